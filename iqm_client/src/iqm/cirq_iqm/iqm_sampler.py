@@ -16,7 +16,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 import sys
 from uuid import UUID
@@ -25,7 +25,7 @@ import warnings
 import cirq
 from iqm.cirq_iqm.devices.iqm_device import IQMDevice, IQMDeviceMetadata
 from iqm.cirq_iqm.serialize import serialize_circuit
-from iqm.iqm_client import CircuitCompilationOptions, IQMClient, JobAbortionError, RunRequest
+from iqm.iqm_client import CircuitCompilationOptions, IQMClient, JobAbortionError, RunRequest, run_pipelined
 import numpy as np
 
 
@@ -131,6 +131,47 @@ class IQMSampler(cirq.work.Sampler):
         )
         return [IQMResult(measurements=result, metadata=metadata) for result in results]
 
+    def run_pipelined(
+        self, batches: Iterable[list[cirq.Circuit]], repetitions: int = 1, *, max_jobs_in_flight: int = 2
+    ) -> Iterator[list[IQMResult]]:
+        """Executes a stream of circuit batches, preparing the next batches while the previous ones are executing.
+
+        Equivalent to calling :meth:`run_iqm_batch` for each batch in turn, except that up to ``max_jobs_in_flight``
+        batches are serialized and submitted in the background while the earlier batches are being executed,
+        so that the quantum computer does not sit idle between the batches. See :func:`.run_pipelined`
+        for the details.
+
+        Args:
+            batches: batches of quantum circuits to execute, consumed lazily
+            repetitions: number of times the circuits are sampled
+            max_jobs_in_flight: maximum number of batches being prepared or executed at the same time
+
+        Yields:
+            results of the execution of each batch, in the order of ``batches``
+
+        Raises:
+            ValueError: circuits are not valid for execution
+            CircuitExecutionError: something went wrong on the server
+            APITimeoutError: server did not return the results in the allocated time
+            RuntimeError: IQM client session has been closed
+
+        """
+
+        def _submit(run_request: RunRequest) -> tuple[UUID, RunRequest]:
+            return self._client.submit_run_request(run_request), run_request
+
+        def _wait(submitted: tuple[UUID, RunRequest]) -> list[IQMResult]:
+            results, metadata = self._wait_for_results(*submitted)
+            return [IQMResult(measurements=result, metadata=metadata) for result in results]
+
+        yield from run_pipelined(
+            batches,
+            lambda circuits: self.create_run_request(list(circuits), repetitions=repetitions),
+            _submit,
+            _wait,
+            max_jobs_in_flight=max_jobs_in_flight,
+        )
+
     def create_run_request(
         self, programs: cirq.Circuit | list[cirq.Circuit], *, params: cirq.Sweepable = None, repetitions: int = 1
     ) -> RunRequest:
@@ -204,7 +245,23 @@ class IQMSampler(cirq.work.Sampler):
         """
         run_request = self.create_run_request(circuits, repetitions=repetitions)
         job_id = self._client.submit_run_request(run_request)
+        return self._wait_for_results(job_id, run_request)
+
+    def _wait_for_results(
+        self, job_id: UUID, run_request: RunRequest
+    ) -> tuple[list[dict[str, np.ndarray]], ResultMetadata]:
+        """Waits for the results of a submitted job.
+
+        If a user interrupts the program while it is waiting for results, attempts to abort the job.
 
+        Args:
+            job_id: ID of the job
+            run_request: request that was submitted to create the job
+
+        Returns:
+            circuit execution results, result metadata
+
+        """
         timeout_arg = [self._run_sweep_timeout] if self._run_sweep_timeout is not None else []
 
         try:
@@ -18,10 +18,17 @@ import sys
 import warnings
 
 from iqm.iqm_client.api import *  # noqa: F403
+from iqm.iqm_client.async_iqm_client import *  # noqa: F403
 from iqm.iqm_client.authentication import *  # noqa: F403
+from iqm.iqm_client.cache import *  # noqa: F403
 from iqm.iqm_client.errors import *  # noqa: F403
 from iqm.iqm_client.iqm_client import *  # noqa: F403
+from iqm.iqm_client.measurements import *  # noqa: F403
 from iqm.iqm_client.models import *  # noqa: F403
+from iqm.iqm_client.pipeline import *  # noqa: F403
+from iqm.iqm_client.polling import *  # noqa: F403
+from iqm.iqm_client.simulator import *  # noqa: F403
+from iqm.iqm_client.templates import *  # noqa: F403
 from iqm.iqm_client.transpile import *  # noqa: F403
 
 try:
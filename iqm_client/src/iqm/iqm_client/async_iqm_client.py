@@ -0,0 +1,327 @@
+# Copyright 2025 IQM client developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Asyncio client for connecting to the IQM quantum computer server interface."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+from uuid import UUID
+
+from iqm.iqm_client.errors import APITimeoutError
+from iqm.iqm_client.iqm_client import (
+    DEFAULT_TIMEOUT_SECONDS,
+    REQUESTS_POOL_MAXSIZE,
+    REQUESTS_TIMEOUT,
+    IQMClient,
+)
+from iqm.iqm_client.models import (
+    CircuitBatch,
+    DynamicQuantumArchitecture,
+    RunCounts,
+    RunRequest,
+    RunResult,
+    RunStatus,
+    Status,
+)
+from iqm.iqm_client.polling import PollingPolicy
+
+T = TypeVar("T")
+
+
+class AsyncIQMClient:
+    """Provides asyncio access to IQM quantum computers.
+
+    Wraps an :class:`.IQMClient` and offers coroutine versions of its job related methods, using the same
+    models. The HTTP requests are made through the connection pool of the wrapped client, on a bounded set of
+    worker threads, while waiting between status polls happens on the event loop. A single process can thus
+    drive hundreds of concurrent jobs without dedicating a thread to each of them.
+
+    Args:
+        url: Endpoint for accessing the server. Has to start with http or https.
+        max_concurrent_requests: Maximum number of HTTP requests in flight at the same time.
+            Also used as the connection pool size of the wrapped client, unless ``pool_maxsize`` is given.
+        polling_policy: Backoff policy for polling the job statuses while waiting for jobs.
+            If ``None``, the default :class:`.PollingPolicy` is used.
+        client_kwargs: Keyword arguments passed to :class:`.IQMClient`, e.g. the authentication parameters.
+
+    Note that the constructor creates the wrapped :class:`.IQMClient`, which performs a blocking version
+    compatibility check against the server.
+
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        max_concurrent_requests: int = REQUESTS_POOL_MAXSIZE,
+        polling_policy: PollingPolicy | None = None,
+        **client_kwargs: Any,
+    ):
+        client_kwargs.setdefault("pool_maxsize", max_concurrent_requests)
+        self._client = IQMClient(url, **client_kwargs)
+        self._polling_policy = polling_policy or PollingPolicy()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_requests, thread_name_prefix="iqm-client")
+
+    async def __aenter__(self) -> AsyncIQMClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @property
+    def client(self) -> IQMClient:
+        """The wrapped synchronous client."""
+        return self._client
+
+    async def submit_circuits(self, circuits: CircuitBatch, **kwargs: Any) -> UUID:
+        """Submit a batch of quantum circuits for execution on a quantum computer.
+
+        Args:
+            circuits: Circuits to be executed.
+            kwargs: Keyword arguments accepted by :meth:`.IQMClient.submit_circuits`.
+
+        Returns:
+            ID for the created job. This ID is needed to query the job status and the execution results.
+
+        """
+        return await self._call(self._client.submit_circuits, circuits, **kwargs)
+
+    async def create_run_request(self, circuits: CircuitBatch, **kwargs: Any) -> RunRequest:
+        """Create a run request for executing circuits without sending it to the server.
+
+        Args:
+            circuits: Circuits to be executed.
+            kwargs: Keyword arguments accepted by :meth:`.IQMClient.create_run_request`.
+
+        Returns:
+            RunRequest that would be submitted by equivalent call to :meth:`submit_circuits`.
+
+        """
+        return await self._call(self._client.create_run_request, circuits, **kwargs)
+
+    async def submit_run_request(self, run_request: RunRequest) -> UUID:
+        """Submit a run request for execution on a quantum computer.
+
+        Args:
+            run_request: Run request to be submitted for execution.
+
+        Returns:
+            ID for the created job. This ID is needed to query the job status and the execution results.
+
+        """
+        return await self._call(self._client.submit_run_request, run_request)
+
+    async def get_run(
+        self, job_id: UUID, *, timeout_secs: float = REQUESTS_TIMEOUT, measurements_as_arrays: bool = False
+    ) -> RunResult:
+        """Query the status and results of a submitted job.
+
+        Args:
+            job_id: ID of the job to query.
+            timeout_secs: Network request timeout (seconds).
+            measurements_as_arrays: Iff True, the measurement results are decoded directly into compact arrays,
+                see :meth:`.IQMClient.get_run`.
+
+        Returns:
+            Result of the job (can be pending).
+
+        Raises:
+            CircuitExecutionError: IQM server specific exceptions
+            HTTPException: HTTP exceptions
+
+        """
+        return await self._call(
+            self._client.get_run, job_id, timeout_secs=timeout_secs, measurements_as_arrays=measurements_as_arrays
+        )
+
+    async def get_run_status(self, job_id: UUID, *, timeout_secs: float = REQUESTS_TIMEOUT) -> RunStatus:
+        """Query the status of a submitted job.
+
+        Args:
+            job_id: ID of the job to query.
+            timeout_secs: Network request timeout (seconds).
+
+        Returns:
+            Job status.
+
+        Raises:
+            CircuitExecutionError: IQM server specific exceptions
+            HTTPException: HTTP exceptions
+
+        """
+        return await self._call(self._client.get_run_status, job_id, timeout_secs=timeout_secs)
+
+    async def get_run_counts(self, job_id: UUID, *, timeout_secs: float = REQUESTS_TIMEOUT) -> RunCounts:
+        """Query the counts of an executed job.
+
+        Args:
+            job_id: ID of the job to query.
+            timeout_secs: Network request timeout (seconds).
+
+        Returns:
+            Measurement results of the job in histogram representation.
+
+        """
+        return await self._call(self._client.get_run_counts, job_id, timeout_secs=timeout_secs)
+
+    async def get_dynamic_quantum_architecture(
+        self, calibration_set_id: UUID | None = None
+    ) -> DynamicQuantumArchitecture:
+        """Retrieve the dynamic quantum architecture (DQA) for the given calibration set from the server.
+
+        Args:
+            calibration_set_id: ID of the calibration set for which the DQA is retrieved.
+                If ``None``, use current default calibration set on the server.
+
+        Returns:
+            Dynamic quantum architecture corresponding to the given calibration set.
+
+        """
+        return await self._call(self._client.get_dynamic_quantum_architecture, calibration_set_id)
+
+    async def abort_job(self, job_id: UUID, *, timeout_secs: float = REQUESTS_TIMEOUT) -> None:
+        """Abort a job that was submitted for execution.
+
+        Args:
+            job_id: ID of the job to be aborted.
+            timeout_secs: Network request timeout (seconds).
+
+        Raises:
+            JobAbortionError: aborting the job failed
+
+        """
+        await self._call(self._client.abort_job, job_id, timeout_secs=timeout_secs)
+
+    async def wait_for_compilation(self, job_id: UUID, timeout_secs: float = DEFAULT_TIMEOUT_SECONDS) -> RunResult:
+        """Poll results until a job is either compiled, pending execution, ready, failed, aborted, or timed out.
+
+        Args:
+            job_id: ID of the job to wait for.
+            timeout_secs: How long to wait for a response before raising an APITimeoutError (seconds).
+
+        Returns:
+            Job result.
+
+        Raises:
+            APITimeoutError: time exceeded the set timeout
+
+        """
+        statuses = Status.terminal_statuses() | {Status.PENDING_EXECUTION, Status.COMPILATION_ENDED}
+        if await self._wait_for_status(job_id, statuses, timeout_secs):
+            return await self.get_run(job_id)
+        raise APITimeoutError(f"The job {job_id} compilation didn't finish in {timeout_secs} seconds.")
+
+    async def wait_for_results(self, job_id: UUID, timeout_secs: float = DEFAULT_TIMEOUT_SECONDS) -> RunResult:
+        """Poll results until a job is either ready, failed, aborted, or timed out.
+
+        Args:
+            job_id: ID of the job to wait for.
+            timeout_secs: How long to wait for a response before raising an APITimeoutError (seconds).
+
+        Returns:
+            Job result.
+
+        Raises:
+            APITimeoutError: time exceeded the set timeout
+
+        """
+        if await self._wait_for_status(job_id, Status.terminal_statuses(), timeout_secs):
+            return await self.get_run(job_id)
+        raise APITimeoutError(f"The job {job_id} didn't finish in {timeout_secs} seconds.")
+
+    async def as_completed(
+        self, job_ids: Iterable[UUID], timeout_secs: float = DEFAULT_TIMEOUT_SECONDS
+    ) -> AsyncIterator[tuple[UUID, RunResult]]:
+        """Wait for many jobs concurrently, yielding their results in the order they finish.
+
+        All the jobs are polled concurrently on the running event loop. If waiting for any of the jobs
+        raises an exception, e.g. because the job failed or timed out, the exception is raised from the
+        iteration and waiting for the remaining jobs is cancelled.
+
+        Args:
+            job_ids: IDs of the jobs to wait for.
+            timeout_secs: How long to wait for each job before raising an APITimeoutError (seconds).
+
+        Yields:
+            Pairs of job ID and the corresponding job result.
+
+        Raises:
+            APITimeoutError: time exceeded the set timeout
+
+        """
+
+        async def _wait(job_id: UUID) -> tuple[UUID, RunResult]:
+            return job_id, await self.wait_for_results(job_id, timeout_secs)
+
+        tasks = [asyncio.ensure_future(_wait(job_id)) for job_id in dict.fromkeys(job_ids)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def close_auth_session(self) -> bool:
+        """Terminate session with authentication server if there is one.
+
+        Returns:
+            True iff session was successfully closed.
+
+        Raises:
+            ClientAuthenticationError: logout failed
+            ClientAuthenticationError: asked to close externally managed authentication session
+
+        """
+        return await self._call(self._client.close_auth_session)
+
+    async def close(self) -> None:
+        """Release the worker threads of the client.
+
+        Pending requests are allowed to finish. The client cannot be used after closing.
+        """
+        self._executor.shutdown(wait=False)
+
+    async def _wait_for_status(self, job_id: UUID, statuses: set[Status], timeout_secs: float) -> bool:
+        """Poll the status of a job with adaptive backoff until it is one of ``statuses``.
+
+        Args:
+            job_id: ID of the job to wait for.
+            statuses: Statuses to wait for.
+            timeout_secs: How long to wait (seconds).
+
+        Returns:
+            True iff the job reached one of ``statuses`` before the timeout.
+
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_secs
+        interval: float | None = None
+        previous_status: Status | None = None
+        while loop.time() < deadline:
+            status = (await self.get_run_status(job_id)).status
+            if status in statuses:
+                return True
+            interval = self._polling_policy.next_interval(interval, status, previous_status)
+            previous_status = status
+            await asyncio.sleep(min(interval, max(0.0, deadline - loop.time())))
+        return False
+
+    async def _call(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking client method in the worker threads without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(function, *args, **kwargs))
@@ -15,6 +15,7 @@
 
 from abc import ABC, abstractmethod
 from base64 import b64decode
+from functools import lru_cache
 import json
 import os
 import time
@@ -55,16 +56,7 @@ class TokenManager:
         """
         if not token or not isinstance(token, str):
             return 0
-        parts = token.split(".", 2)
-        if len(parts) != 3:
-            return 0
-        # Add padding to adjust body length to a multiple of 4 chars as required by base64 decoding
-        try:
-            body = parts[1] + ("=" * (-len(parts[1]) % 4))
-            exp_time = int(json.loads(b64decode(body)).get("exp", "0"))
-            return max(0, exp_time - int(time.time()))
-        except (UnicodeDecodeError, json.decoder.JSONDecodeError, ValueError, TypeError):
-            return 0
+        return max(0, _token_expiry_time(token) - int(time.time()))
 
     def __init__(
         self,
@@ -177,6 +169,27 @@ class TokenManager:
         return True
 
 
+@lru_cache(maxsize=64)
+def _token_expiry_time(token: str) -> int:
+    """Decode the expiry time of a JWT token.
+
+    Cached, since the same token is checked before every request.
+
+    Returns:
+        Expiry time of the token as a Unix timestamp, or 0 if the token is not a valid JWT token with an expiry time.
+
+    """
+    parts = token.split(".", 2)
+    if len(parts) != 3:
+        return 0
+    # Add padding to adjust body length to a multiple of 4 chars as required by base64 decoding
+    try:
+        body = parts[1] + ("=" * (-len(parts[1]) % 4))
+        return int(json.loads(b64decode(body)).get("exp", "0"))
+    except (UnicodeDecodeError, json.decoder.JSONDecodeError, ValueError, TypeError):
+        return 0
+
+
 class TokenProviderInterface(ABC):
     """Interface to token provider"""
 
@@ -216,15 +229,27 @@ class ExternalToken(TokenProviderInterface):
 
 
 class TokensFileReader(TokenProviderInterface):
-    """Reads token from a file"""
+    """Reads token from a file.
+
+    The token is re-read only if the file has changed since it was last read, or if the token is about to expire.
+    """
 
     def __init__(self, tokens_file: str):
         self._path: str | None = tokens_file
+        self._file_signature: tuple[int, int, int] | None = None
+        self._token: str | None = None
 
     def get_token(self) -> str:
         try:
             if self._path is None:
                 raise ClientAuthenticationError("No tokens file available")
+            stat = os.stat(self._path)
+            file_signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if (
+                file_signature == self._file_signature
+                and TokenManager.time_left_seconds(self._token) > REFRESH_MARGIN_SECONDS
+            ):
+                return str(self._token)
             with open(self._path, encoding="utf-8") as file:
                 raw_data = file.read()
             json_data = json.loads(raw_data)
@@ -233,6 +258,8 @@ class TokensFileReader(TokenProviderInterface):
                 raise ClientAuthenticationError("Access token in file has expired or is not valid")
         except (FileNotFoundError, IsADirectoryError, json.decoder.JSONDecodeError) as e:
             raise ClientAuthenticationError(rf"Failed to read access token from file '{self._path}': {e}") from e
+        self._file_signature = file_signature
+        self._token = token
         return token
 
     def close(self) -> None:
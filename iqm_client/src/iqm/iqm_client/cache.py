@@ -0,0 +1,177 @@
+# Copyright 2025 IQM client developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Client-side caching of server data."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+import hashlib
+from importlib.metadata import version
+import logging
+import os
+from pathlib import Path
+import random
+import tempfile
+import threading
+import time
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+T = TypeVar("T")
+T_BaseModel = TypeVar("T_BaseModel", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+TTL_JITTER = 0.1
+"""Maximum relative amount by which the lifetime of a cache entry is randomly extended, so that many processes
+started at the same time do not all refresh their caches at the same moment."""
+
+
+class TTLCache:
+    """Thread-safe in-memory cache with a time to live for each entry.
+
+    Concurrent requests for the same missing entry are coalesced, so that the value is fetched only once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], T], ttl_secs: float | None) -> T:
+        """Return the cached value for ``key``, fetching and caching it if it is missing or has expired.
+
+        Args:
+            key: Key of the cache entry.
+            fetch: Function that fetches the value if needed.
+            ttl_secs: How long the fetched value stays valid (seconds). ``None`` means forever,
+                and zero or less means that the value is not cached at all.
+
+        Returns:
+            The cached or fetched value.
+
+        """
+        if ttl_secs is not None and ttl_secs <= 0:
+            return fetch()
+        if (value := self._get(key)) is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # another thread may have fetched the value while we were waiting for the lock
+            if (value := self._get(key)) is not None:
+                return value
+            value = fetch()
+            expires = (
+                float("inf") if ttl_secs is None else time.monotonic() + ttl_secs * (1 + random.uniform(0, TTL_JITTER))
+            )
+            with self._lock:
+                self._entries[key] = (expires, value)
+            return value
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Remove an entry from the cache.
+
+        Args:
+            key: Key of the entry to remove. If ``None``, all the entries are removed.
+
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _get(self, key: Hashable) -> Any:
+        """Return the value of an unexpired entry, or ``None`` if there is none."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+
+class DiskCache:
+    """Cache of server data in a local directory, shared by all the processes using the same directory.
+
+    Entries are stored as JSON files in a subdirectory specific to the server URL and the version of
+    iqm-client, so that clients of different servers or versions never read each other's entries.
+    Writes are atomic, and entries that cannot be read or validated are treated as missing.
+
+    Args:
+        cache_dir: Directory for the cache. Created if it does not exist.
+        url: URL of the server whose data is cached.
+
+    """
+
+    def __init__(self, cache_dir: str | os.PathLike, url: str):
+        namespace = hashlib.sha256(f"{url}\n{version('iqm-client')}".encode()).hexdigest()[:32]
+        self._path = Path(cache_dir) / namespace
+
+    def load(self, key: str, model: type[T_BaseModel]) -> T_BaseModel | None:
+        """Load an entry from the cache.
+
+        Args:
+            key: Key of the entry.
+            model: Model class of the entry.
+
+        Returns:
+            The entry, or ``None`` if it is not in the cache or could not be read.
+
+        """
+        try:
+            return model.model_validate_json((self._path / f"{key}.json").read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            logger.warning("Ignoring unreadable cache entry %s: %s", key, e)
+            return None
+
+    def store(self, key: str, value: BaseModel) -> None:
+        """Store an entry in the cache.
+
+        Failures are logged and otherwise ignored, since the cache is only an optimization.
+
+        Args:
+            key: Key of the entry.
+            value: Value of the entry.
+
+        """
+        try:
+            self._path.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file and rename it, so that readers never see a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self._path, prefix=f".{key}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(value.model_dump_json().encode())
+                os.replace(tmp_path, self._path / f"{key}.json")
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning("Could not write cache entry %s: %s", key, e)
+
+    def invalidate(self, key: str) -> None:
+        """Remove an entry from the cache.
+
+        Args:
+            key: Key of the entry to remove.
+
+        """
+        try:
+            (self._path / f"{key}.json").unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Could not remove cache entry %s: %s", key, e)
@@ -15,10 +15,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from functools import lru_cache
+import gzip
 from http import HTTPStatus
 from importlib.metadata import version
+from importlib.util import find_spec
 import json
 import os
 import platform
@@ -29,6 +33,7 @@ import warnings
 
 from iqm.iqm_client.api import APIConfig, APIEndpoint
 from iqm.iqm_client.authentication import TokenManager
+from iqm.iqm_client.cache import DiskCache, TTLCache
 from iqm.iqm_client.errors import (
     APITimeoutError,
     CircuitExecutionError,
@@ -38,10 +43,12 @@ from iqm.iqm_client.errors import (
     EndpointRequestError,
     JobAbortionError,
 )
+from iqm.iqm_client.measurements import iter_measurement_arrays
 from iqm.iqm_client.models import (
     CalibrationSet,
     CircuitBatch,
     CircuitCompilationOptions,
+    CircuitMeasurementArrays,
     ClientLibrary,
     ClientLibraryDict,
     DynamicQuantumArchitecture,
@@ -62,6 +69,8 @@ from packaging.version import parse
 from pydantic import BaseModel, ValidationError
 import requests
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from iqm.station_control.client.iqm_server.iqm_server_client import IqmServerClient
 from iqm.station_control.client.utils import init_station_control
@@ -73,6 +82,15 @@ T_BaseModel = TypeVar("T_BaseModel", bound=BaseModel)
 REQUESTS_TIMEOUT = float(os.environ.get("IQM_CLIENT_REQUESTS_TIMEOUT", 120.0))
 DEFAULT_TIMEOUT_SECONDS = 900
 SECONDS_BETWEEN_CALLS = float(os.environ.get("IQM_CLIENT_SECONDS_BETWEEN_CALLS", 1.0))
+REQUESTS_POOL_MAXSIZE = int(os.environ.get("IQM_CLIENT_REQUESTS_POOL_MAXSIZE", "10"))
+REQUESTS_MAX_RETRIES = int(os.environ.get("IQM_CLIENT_REQUESTS_MAX_RETRIES", "3"))
+REQUESTS_BACKOFF_FACTOR = float(os.environ.get("IQM_CLIENT_REQUESTS_BACKOFF_FACTOR", "0.5"))
+MEASUREMENTS_CHUNK_SIZE = 1024 * 1024
+CACHE_TTL_SECONDS = float(os.environ.get("IQM_CLIENT_CACHE_TTL_SECONDS", "0"))
+CACHE_DIR = os.environ.get("IQM_CLIENT_CACHE_DIR")
+REQUEST_COMPRESSION = os.environ.get("IQM_CLIENT_REQUEST_COMPRESSION") or None
+REQUEST_COMPRESSION_MIN_BYTES = 1024
+SUPPORTED_REQUEST_COMPRESSIONS = ("gzip", "zstd")
 
 
 class IQMClient:
@@ -92,6 +110,36 @@ class IQMClient:
             If ``auth_server_url`` is given also ``username`` and ``password`` must be given.
         username: Username to log in to authentication server.
         password: Password to log in to authentication server.
+        pool_maxsize: Maximum number of keep-alive connections the client keeps open to the server.
+            Should be at least the number of threads that use the client concurrently.
+        max_retries: Retry policy for idempotent (GET) requests that fail on connection errors or on
+            a 502, 503 or 504 response. Either the maximum number of retries, using exponential backoff
+            with :const:`REQUESTS_BACKOFF_FACTOR`, or a fully configured :class:`urllib3.util.retry.Retry`.
+            Job submissions and abortions are never retried.
+        cache_ttl_secs: How long (seconds) data that may change on the server, such as the current default
+            calibration set and the quality metrics, is cached by the client. By default such data is not
+            cached, and every call retrieves it from the server. Can also be set using the environment
+            variable :envvar:`IQM_CLIENT_CACHE_TTL_SECONDS`.
+        cache_dir: Optional local directory in which the static quantum architecture and the dynamic quantum
+            architectures are stored, so that they are shared between processes and client instances.
+            A new client then only needs to check the label of the QPU and the current default calibration set
+            with the server before it can reuse the stored architectures. Can also be set using the environment
+            variable :envvar:`IQM_CLIENT_CACHE_DIR`.
+        request_compression: Content encoding used for compressing the bodies of job submissions, either
+            ``"gzip"`` or ``"zstd"``. Circuit batches compress very well, so this reduces the upload time of large
+            batches on slow connections, but the server must accept the encoding. ``"zstd"`` requires the
+            ``zstandard`` package. By default the bodies are not compressed. Can also be set using the
+            environment variable :envvar:`IQM_CLIENT_REQUEST_COMPRESSION`.
+        response_compression: Iff True, the client advertises in the ``Accept-Encoding`` header the
+            compressed encodings it can decode, and the server may compress e.g. the measurement results.
+            The responses are decompressed transparently, also when they are streamed. Set to False to save
+            the client CPU time spent on decompression when the connection is fast.
+
+    All HTTP requests the client makes go through a single :class:`requests.Session`, so that
+    connections are reused instead of performing a new TCP and TLS handshake for every request.
+    The pool defaults can also be set using the environment variables
+    :envvar:`IQM_CLIENT_REQUESTS_POOL_MAXSIZE`, :envvar:`IQM_CLIENT_REQUESTS_MAX_RETRIES` and
+    :envvar:`IQM_CLIENT_REQUESTS_BACKOFF_FACTOR`.
 
     Alternatively, the user authentication related keyword arguments can also be given in
     environment variables :envvar:`IQM_TOKEN`, :envvar:`IQM_TOKENS_FILE`, :envvar:`IQM_AUTH_SERVER`,
@@ -101,7 +149,7 @@ class IQMClient:
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         url: str,
         *,
@@ -111,9 +159,22 @@ class IQMClient:
         auth_server_url: str | None = None,
         username: str | None = None,
         password: str | None = None,
+        pool_maxsize: int = REQUESTS_POOL_MAXSIZE,
+        max_retries: int | Retry = REQUESTS_MAX_RETRIES,
+        cache_ttl_secs: float = CACHE_TTL_SECONDS,
+        cache_dir: str | None = CACHE_DIR,
+        request_compression: str | None = REQUEST_COMPRESSION,
+        response_compression: bool = True,
     ):
         if not url.startswith(("http:", "https:")):
             raise ClientConfigurationError(f"The URL schema has to be http or https. Incorrect schema in URL: {url}")
+        if request_compression is not None and request_compression not in SUPPORTED_REQUEST_COMPRESSIONS:
+            raise ClientConfigurationError(
+                f"Unsupported request compression {request_compression!r}, "
+                f"supported compressions are {SUPPORTED_REQUEST_COMPRESSIONS}."
+            )
+        if request_compression == "zstd" and find_spec("zstandard") is None:
+            raise ClientConfigurationError('Request compression "zstd" requires the zstandard package.')
         self._token_manager = TokenManager(
             token,
             tokens_file,
@@ -130,6 +191,13 @@ class IQMClient:
         self._architecture: QuantumArchitectureSpecification | None = None
         self._static_architecture: StaticQuantumArchitecture | None = None
         self._dynamic_architectures: dict[UUID, DynamicQuantumArchitecture] = {}
+        self._cache = TTLCache()
+        self._cache_ttl_secs = cache_ttl_secs
+        self._disk_cache = DiskCache(cache_dir, url) if cache_dir else None
+        self._request_compression = request_compression
+        self._session = self._create_session(pool_maxsize, max_retries)
+        if not response_compression:
+            self._session.headers["Accept-Encoding"] = "identity"
 
         self._station_control: StationControlInterface = init_station_control(
             root_url=url,
@@ -164,6 +232,7 @@ class IQMClient:
         calibration_set_id: UUID | None = None,
         shots: int = 1,
         options: CircuitCompilationOptions | None = None,
+        validate: bool = True,
     ) -> UUID:
         """Submit a batch of quantum circuits for execution on a quantum computer.
 
@@ -177,6 +246,8 @@ class IQMClient:
             calibration_set_id: ID of the calibration set to use, or ``None`` to use the current default calibration.
             shots: Number of times ``circuits`` are executed. Must be greater than zero.
             options: Various discrete options for compiling quantum circuits to instruction schedules.
+            validate: Iff False, the instructions of ``circuits`` are not validated against the supported
+                operations, see :meth:`create_run_request`.
 
         Returns:
             ID for the created job. This ID is needed to query the job status and the execution results.
@@ -189,6 +260,7 @@ class IQMClient:
             calibration_set_id=calibration_set_id,
             shots=shots,
             options=options,
+            validate=validate,
         )
         job_id = self.submit_run_request(run_request)
         return job_id
@@ -202,6 +274,7 @@ class IQMClient:
         calibration_set_id: UUID | None = None,
         shots: int = 1,
         options: CircuitCompilationOptions | None = None,
+        validate: bool = True,
     ) -> RunRequest:
         """Create a run request for executing circuits without sending it to the server.
 
@@ -220,6 +293,10 @@ class IQMClient:
             calibration_set_id: ID of the calibration set to use, or ``None`` to use the current default calibration.
             shots: Number of times ``circuits`` are executed. Must be greater than zero.
             options: Various discrete options for compiling quantum circuits to instruction schedules.
+            validate: Iff False, the instructions of ``circuits`` are trusted to have valid names, arities and
+                arguments, and are not validated against the supported operations. This saves a lot of time for
+                large batches of circuits produced by trusted code, see :meth:`.Circuit.from_trusted`.
+                The circuits are validated against the quantum architecture in any case.
 
         Returns:
             RunRequest that would be submitted by equivalent call to :meth:`submit_circuits`.
@@ -230,7 +307,7 @@ class IQMClient:
         if options is None:
             options = CircuitCompilationOptions()
 
-        for i, circuit in enumerate(circuits):
+        for i, circuit in enumerate(circuits if validate else ()):
             try:
                 # validate the circuit against the static information in iqm.iqm_client.models._SUPPORTED_OPERATIONS
                 validate_circuit(circuit)
@@ -297,11 +374,16 @@ class IQMClient:
             print(f"\nIQM CLIENT DEBUGGING ENABLED\nSUBMITTING RUN REQUEST:\n{run_request}\n")
 
         # Use UTF-8 encoding for the JSON payload
-        result = requests.post(
+        data = run_request.model_dump_json(exclude_none=True).encode("utf-8")
+        headers["Content-Type"] = "application/json; charset=UTF-8"
+        if self._request_compression is not None and len(data) >= REQUEST_COMPRESSION_MIN_BYTES:
+            data = _compress(data, self._request_compression)
+            headers["Content-Encoding"] = self._request_compression
+        result = self._session.post(
             # TODO SW-1434: Use station control client
             self._api.url(APIEndpoint.SUBMIT_JOB),
-            data=run_request.model_dump_json(exclude_none=True).encode("utf-8"),
-            headers=headers | {"Content-Type": "application/json; charset=UTF-8"},
+            data=data,
+            headers=headers,
             timeout=REQUESTS_TIMEOUT,
         )
 
@@ -321,12 +403,19 @@ class IQMClient:
         except (json.decoder.JSONDecodeError, KeyError) as e:
             raise CircuitExecutionError(f"Invalid response: {result.text}, {e}") from e
 
-    def get_run(self, job_id: UUID, *, timeout_secs: float = REQUESTS_TIMEOUT) -> RunResult:
+    def get_run(
+        self, job_id: UUID, *, timeout_secs: float = REQUESTS_TIMEOUT, measurements_as_arrays: bool = False
+    ) -> RunResult:
         """Query the status and results of a submitted job.
 
         Args:
             job_id: ID of the job to query.
             timeout_secs: Network request timeout (seconds).
+            measurements_as_arrays: Iff True, the measurement results are decoded directly into compact
+                ``uint8`` arrays, available through :attr:`.RunResult.measurement_arrays`, instead of nested lists
+                in :attr:`.RunResult.measurements`. The results are streamed from the server and decoded
+                circuit by circuit, so the whole response body is never held in memory.
+                Recommended for large batches and shot counts.
 
         Returns:
             Result of the job (can be pending).
@@ -345,11 +434,54 @@ class IQMClient:
         if Status(status["status"]) not in Status.terminal_statuses():
             return RunResult.from_dict({"status": status["status"], "metadata": {}})
 
-        result = self._get_request(APIEndpoint.GET_JOB_RESULT, (str(job_id),), timeout=timeout_secs, allow_errors=True)
-
-        error_log_response = self._get_request(
-            APIEndpoint.GET_JOB_ERROR_LOG, (str(job_id),), timeout=timeout_secs, allow_errors=True
+        # The metadata artifacts are only fetched when the job has results, while the error log is fetched
+        # concurrently with the results. The same headers are used for all requests to avoid refreshing
+        # the bearer token from several threads at once.
+        headers = self._default_headers()
+        metadata_endpoints = (
+            APIEndpoint.GET_JOB_REQUEST_PARAMETERS,
+            APIEndpoint.GET_JOB_CALIBRATION_SET_ID,
+            APIEndpoint.GET_JOB_CIRCUITS_BATCH,
+            APIEndpoint.GET_JOB_TIMELINE,
         )
+        with ThreadPoolExecutor(max_workers=len(metadata_endpoints)) as executor:
+
+            def _fetch(endpoint: APIEndpoint) -> Future[requests.Response]:
+                return executor.submit(
+                    self._get_request,
+                    endpoint,
+                    (str(job_id),),
+                    timeout=timeout_secs,
+                    headers=headers,
+                    allow_errors=True,
+                )
+
+            error_log_future = _fetch(APIEndpoint.GET_JOB_ERROR_LOG)
+            result = self._get_request(
+                APIEndpoint.GET_JOB_RESULT,
+                (str(job_id),),
+                timeout=timeout_secs,
+                headers=headers,
+                allow_errors=True,
+                stream=measurements_as_arrays,
+            )
+            has_results = result.status_code != 404
+            if has_results:
+                metadata_futures = {endpoint: _fetch(endpoint) for endpoint in metadata_endpoints}
+                result.raise_for_status()
+                # the results are decoded while the metadata is being fetched
+                if measurements_as_arrays:
+                    measurements = {
+                        "measurement_arrays": list(
+                            iter_measurement_arrays(result.iter_content(chunk_size=MEASUREMENTS_CHUNK_SIZE))
+                        )
+                    }
+                else:
+                    measurements = {"measurements": result.json()}
+            else:
+                result.close()
+            error_log_response = error_log_future.result()
+
         if error_log_response.status_code == 200:
             error_log = error_log_response.json()
             if isinstance(error_log, dict) and "user_error_message" in error_log:
@@ -361,28 +493,17 @@ class IQMClient:
         else:
             error_message = None
 
-        if result.status_code == 404:
+        if not has_results:
             run_result = RunResult.from_dict({"status": status["status"], "message": error_message, "metadata": {}})
         else:
-            result.raise_for_status()
-
-            measurements = result.json()
-            request_parameters = self._get_request(
-                APIEndpoint.GET_JOB_REQUEST_PARAMETERS, (str(job_id),), timeout=timeout_secs, allow_errors=True
-            ).json()
-            calibration_set_id = self._get_request(
-                APIEndpoint.GET_JOB_CALIBRATION_SET_ID, (str(job_id),), timeout=timeout_secs, allow_errors=True
-            ).json()
-            circuits_batch = self._get_request(
-                APIEndpoint.GET_JOB_CIRCUITS_BATCH, (str(job_id),), timeout=timeout_secs, allow_errors=True
-            ).json()
-            timeline = self._get_request(
-                APIEndpoint.GET_JOB_TIMELINE, (str(job_id),), timeout=timeout_secs, allow_errors=True
-            ).json()
+            request_parameters = metadata_futures[APIEndpoint.GET_JOB_REQUEST_PARAMETERS].result().json()
+            calibration_set_id = metadata_futures[APIEndpoint.GET_JOB_CALIBRATION_SET_ID].result().json()
+            circuits_batch = metadata_futures[APIEndpoint.GET_JOB_CIRCUITS_BATCH].result().json()
+            timeline = metadata_futures[APIEndpoint.GET_JOB_TIMELINE].result().json()
 
             run_result = RunResult.from_dict(
                 {
-                    "measurements": measurements,
+                    **measurements,
                     "status": status["status"],
                     "message": error_message,
                     "metadata": {
@@ -410,6 +531,38 @@ class IQMClient:
             raise CircuitExecutionError(run_result.message)
         return run_result
 
+    def iter_run_measurements(
+        self, job_id: UUID, *, timeout_secs: float = REQUESTS_TIMEOUT
+    ) -> Iterator[CircuitMeasurementArrays]:
+        """Stream the measurement results of a finished job, circuit by circuit.
+
+        The results are decoded into ``uint8`` arrays while they are being received, so that the memory needed is
+        bounded by the results of a single circuit, plus whatever the caller keeps. The caller can e.g. copy each
+        circuit's results into preallocated arrays, or write them to disk:
+
+        .. code-block:: python
+
+            for index, circuit_measurements in enumerate(client.iter_run_measurements(job_id)):
+                numpy.savez(f"circuit_{index}.npz", **circuit_measurements)
+
+        Args:
+            job_id: ID of the job to query. The job must have finished successfully.
+            timeout_secs: Network request timeout (seconds).
+
+        Yields:
+            Measurement results of each circuit of the job, see :attr:`.RunResult.measurement_arrays`.
+
+        Raises:
+            ValueError: the response could not be decoded as measurement results
+            ClientAuthenticationError: no valid authentication provided
+            HTTPException: HTTP exceptions, e.g. if the job has no results
+
+        """
+        with self._get_request(
+            APIEndpoint.GET_JOB_RESULT, (str(job_id),), timeout=timeout_secs, stream=True
+        ) as response:
+            yield from iter_measurement_arrays(response.iter_content(chunk_size=MEASUREMENTS_CHUNK_SIZE))
+
     def get_run_status(self, job_id: UUID, *, timeout_secs: float = REQUESTS_TIMEOUT) -> RunStatus:
         """Query the status of a submitted job.
 
@@ -485,6 +638,33 @@ class IQMClient:
             time.sleep(SECONDS_BETWEEN_CALLS)
         raise APITimeoutError(f"The job {job_id} didn't finish in {timeout_secs} seconds.")
 
+    def wait_for_counts(self, job_id: UUID, timeout_secs: float = DEFAULT_TIMEOUT_SECONDS) -> RunCounts:
+        """Poll the job status until the job is either ready, failed, aborted, or timed out, then fetch its counts.
+
+        Unlike :meth:`wait_for_results`, does not download the per-shot measurement results, only their histograms.
+
+        Args:
+            job_id: ID of the job to wait for.
+            timeout_secs: How long to wait for a response before raising an APITimeoutError (seconds).
+
+        Returns:
+            Measurement results of the job in histogram representation.
+
+        Raises:
+            APITimeoutError: time exceeded the set timeout
+            CircuitExecutionError: the job failed
+
+        """
+        start_time = datetime.now()
+        while (datetime.now() - start_time).total_seconds() < timeout_secs:
+            run_status = self.get_run_status(job_id)
+            if run_status.status == Status.FAILED:
+                raise CircuitExecutionError(run_status.message)
+            if run_status.status in Status.terminal_statuses():
+                return self.get_run_counts(job_id)
+            time.sleep(SECONDS_BETWEEN_CALLS)
+        raise APITimeoutError(f"The job {job_id} didn't finish in {timeout_secs} seconds.")
+
     def abort_job(self, job_id: UUID, *, timeout_secs: float = REQUESTS_TIMEOUT) -> None:
         """Abort a job that was submitted for execution.
 
@@ -496,7 +676,7 @@ class IQMClient:
             JobAbortionError: aborting the job failed
 
         """
-        result = requests.post(
+        result = self._session.post(
             self._api.url(APIEndpoint.ABORT_JOB, str(job_id)),
             headers=self._default_headers(),
             timeout=timeout_secs,
@@ -507,7 +687,8 @@ class IQMClient:
     def get_static_quantum_architecture(self) -> StaticQuantumArchitecture:
         """Retrieve the static quantum architecture (SQA) from the server.
 
-        Caches the result and returns it on later invocations.
+        Caches the result and returns it on later invocations, also in the local cache directory if
+        ``cache_dir`` is set, see :class:`IQMClient`.
 
         Returns:
             Static quantum architecture of the server.
@@ -520,15 +701,24 @@ class IQMClient:
         """
         if self._static_architecture:
             return self._static_architecture
-
         dut_label = self._get_dut_label()
+        # the stored architecture is only valid for the same QPU
+        disk_cache_key = f"sqa-{dut_label}"
+        if self._disk_cache and (cached := self._disk_cache.load(disk_cache_key, StaticQuantumArchitecture)):
+            self._static_architecture = cached
+            return self._static_architecture
+
         static_quantum_architecture = self._station_control.get_static_quantum_architecture(dut_label)
         self._static_architecture = StaticQuantumArchitecture(**static_quantum_architecture.model_dump())
+        if self._disk_cache:
+            self._disk_cache.store(disk_cache_key, self._static_architecture)
         return self._static_architecture
 
     def get_quality_metric_set(self, calibration_set_id: UUID | None = None) -> QualityMetricSet:
         """Retrieve the latest quality metric set for the given calibration set from the server.
 
+        The result is cached for ``cache_ttl_secs`` seconds, see :class:`IQMClient`.
+
         Args:
             calibration_set_id: ID of the calibration set for which the quality metrics are returned.
                 If ``None``, the current default calibration set is used.
@@ -545,6 +735,14 @@ class IQMClient:
         if isinstance(self._station_control, IqmServerClient):
             raise ValueError("'get_quality_metric_set' method is not supported for IqmServerClient.")
 
+        return self._cache.get_or_fetch(
+            ("quality_metric_set", calibration_set_id),
+            lambda: self._fetch_quality_metric_set(calibration_set_id),
+            self._cache_ttl_secs,
+        )
+
+    def _fetch_quality_metric_set(self, calibration_set_id: UUID | None) -> QualityMetricSet:
+        """Retrieve the latest quality metric set for the given calibration set from the server, bypassing the cache."""
         if not calibration_set_id:
             quality_metrics = self._station_control.get_default_calibration_set_quality_metrics()
         else:
@@ -586,6 +784,8 @@ class IQMClient:
     def get_calibration_set(self, calibration_set_id: UUID | None = None) -> CalibrationSet:
         """Retrieve the given calibration set from the server.
 
+        The result is cached for ``cache_ttl_secs`` seconds, see :class:`IQMClient`.
+
         Args:
             calibration_set_id: ID of the calibration set to retrieve.
                 If ``None``, the current default calibration set is retrieved.
@@ -599,6 +799,17 @@ class IQMClient:
             HTTPException: HTTP exceptions
 
         """
+        if isinstance(self._station_control, IqmServerClient):
+            raise ValueError("'get_calibration_set' method is not supported for IqmServerClient.")
+
+        return self._cache.get_or_fetch(
+            ("calibration_set", calibration_set_id),
+            lambda: self._fetch_calibration_set(calibration_set_id),
+            self._cache_ttl_secs,
+        )
+
+    def _fetch_calibration_set(self, calibration_set_id: UUID | None) -> CalibrationSet:
+        """Retrieve the given calibration set from the server, bypassing the cache."""
 
         def _observation_lite_to_json(obs: ObservationLite) -> dict[str, Any]:
             """Convert ObservationLite to JSON serializable dictionary."""
@@ -607,9 +818,6 @@ class IQMClient:
             json_dict["modified_timestamp"] = obs.modified_timestamp.isoformat(timespec="microseconds")
             return json_dict
 
-        if isinstance(self._station_control, IqmServerClient):
-            raise ValueError("'get_calibration_set' method is not supported for IqmServerClient.")
-
         if not calibration_set_id:
             calibration_set = self._station_control.get_default_calibration_set()
         else:
@@ -632,8 +840,10 @@ class IQMClient:
         """Retrieve the dynamic quantum architecture (DQA) for the given calibration set from the server.
 
         Caches the result and returns the same result on later invocations, unless ``calibration_set_id`` is ``None``.
-        If ``calibration_set_id`` is ``None``, always retrieves the result from the server because the default
-        calibration set may have changed.
+        The result is also stored in the local cache directory if ``cache_dir`` is set.
+        If ``calibration_set_id`` is ``None``, the current default calibration set is resolved from the server
+        because it may have changed, unless it was resolved less than ``cache_ttl_secs`` seconds ago,
+        see :class:`IQMClient`.
 
         Args:
             calibration_set_id: ID of the calibration set for which the DQA is retrieved.
@@ -652,18 +862,45 @@ class IQMClient:
             return self._dynamic_architectures[calibration_set_id]
 
         if not calibration_set_id:
-            if isinstance(self._station_control, IqmServerClient):
-                dut_label = self._get_dut_label()
-                calibration_set_id = self._station_control.get_latest_calibration_set_id(dut_label)
-            else:
-                calibration_set_id = self._station_control.get_default_calibration_set().observation_set_id
-        data = self._station_control.get_dynamic_quantum_architecture(calibration_set_id)
-        dynamic_quantum_architecture = DynamicQuantumArchitecture(**data.model_dump())
+            calibration_set_id = self._cache.get_or_fetch(
+                "default_calibration_set_id", self._fetch_default_calibration_set_id, self._cache_ttl_secs
+            )
+            if calibration_set_id in self._dynamic_architectures:
+                return self._dynamic_architectures[calibration_set_id]
+        disk_cache_key = f"dqa-{calibration_set_id}"
+        dynamic_quantum_architecture = (
+            self._disk_cache.load(disk_cache_key, DynamicQuantumArchitecture) if self._disk_cache else None
+        )
+        if dynamic_quantum_architecture is None:
+            data = self._station_control.get_dynamic_quantum_architecture(calibration_set_id)
+            dynamic_quantum_architecture = DynamicQuantumArchitecture(**data.model_dump())
+            if self._disk_cache:
+                self._disk_cache.store(disk_cache_key, dynamic_quantum_architecture)
 
         # Cache architecture so that later invocations do not need to query it again
         self._dynamic_architectures[dynamic_quantum_architecture.calibration_set_id] = dynamic_quantum_architecture
         return dynamic_quantum_architecture
 
+    def _fetch_default_calibration_set_id(self) -> UUID:
+        """Retrieve the ID of the current default calibration set from the server."""
+        if isinstance(self._station_control, IqmServerClient):
+            dut_label = self._get_dut_label()
+            return self._station_control.get_latest_calibration_set_id(dut_label)
+        return self._station_control.get_default_calibration_set().observation_set_id
+
+    def invalidate_cache(self) -> None:
+        """Clear the cached data that may change on the server.
+
+        After this, the current default calibration set, quality metrics and calibration sets are
+        retrieved from the server again on the next call. The static quantum architecture is also removed
+        from memory and from the local cache directory, and the label of the QPU is retrieved again.
+        """
+        self._cache.invalidate()
+        self._static_architecture = None
+        self._get_dut_label.cache_clear()
+        if self._disk_cache:
+            self._disk_cache.invalidate(f"sqa-{self._get_dut_label()}")
+
     def get_feedback_groups(self) -> tuple[frozenset[str], ...]:
         """Retrieve groups of qubits that can receive real-time feedback signals from each other.
 
@@ -741,7 +978,7 @@ class IQMClient:
         # TODO: Remove "client-libraries" usage after using versioned URLs in station control
         #  Version incompatibility shouldn't be a problem after that anymore,
         #  so we can delete this "client-libraries" implementation and usage.
-        response = requests.get(
+        response = self._session.get(
             #  "/info/client-libraries" is implemented by Nginx so it won't work on locally running service.
             #  We will simply give warning in that case, so that IQMClient can be initialized also locally.
             #  "/station" is set by Nginx, so we will drop it to get the correct root for "/info/client-libraries".
@@ -759,6 +996,9 @@ class IQMClient:
     def close_auth_session(self) -> bool:
         """Terminate session with authentication server if there is one.
 
+        Also closes the pooled connections to the server. The client remains usable, new connections
+        are opened when needed.
+
         Returns:
             True iff session was successfully closed.
 
@@ -767,8 +1007,36 @@ class IQMClient:
             ClientAuthenticationError: asked to close externally managed authentication session
 
         """
+        self._session.close()
         return self._token_manager.close()
 
+    @staticmethod
+    def _create_session(pool_maxsize: int, max_retries: int | Retry) -> requests.Session:
+        """Create the connection-pooled HTTP session shared by all the requests of the client.
+
+        Args:
+            pool_maxsize: Maximum number of connections kept open per host.
+            max_retries: Maximum number of retries for idempotent requests, or a full retry policy.
+
+        Returns:
+            HTTP session with keep-alive connections.
+
+        """
+        if not isinstance(max_retries, Retry):
+            max_retries = Retry(
+                total=max_retries,
+                backoff_factor=REQUESTS_BACKOFF_FACTOR,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                # return the last response instead of raising, the callers have their own error handling
+                raise_on_status=False,
+            )
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=max_retries)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def _default_headers(self) -> dict[str, str]:
         """Default headers for HTTP requests to the IQM server."""
         headers = {"User-Agent": self._signature}
@@ -847,6 +1115,7 @@ class IQMClient:
         timeout: float,
         headers: dict | None = None,
         allow_errors: bool = False,
+        stream: bool = False,
     ) -> requests.Response:
         """Make an HTTP GET request to an IQM server endpoint.
 
@@ -856,6 +1125,10 @@ class IQMClient:
             api_endpoint: API endpoint to GET.
             endpoint_args: Arguments for the endpoint.
             timeout: HTTP request timeout (in seconds).
+            headers: Headers of the request. If ``None``, the default headers are used.
+            allow_errors: Iff True, do not raise exceptions for error responses.
+            stream: Iff True, the response body is not downloaded until it is accessed.
+                The caller must close the response.
 
         Returns:
             HTTP response to the request.
@@ -866,10 +1139,11 @@ class IQMClient:
 
         """
         url = self._api.url(api_endpoint, *endpoint_args)
-        response = requests.get(
+        response = self._session.get(
             url,
             headers=headers or self._default_headers(),
             timeout=timeout,
+            stream=stream,
         )
         if not allow_errors:
             self._check_not_found_error(response)
@@ -902,3 +1176,23 @@ class IQMClient:
         except json.decoder.JSONDecodeError as e:
             raise EndpointRequestError(f"Invalid response: {response.text}, {e!r}") from e
         return model
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    """Compress the body of an HTTP request.
+
+    Args:
+        data: Body of the request.
+        encoding: Content encoding to use, one of :const:`SUPPORTED_REQUEST_COMPRESSIONS`.
+
+    Returns:
+        The compressed body.
+
+    """
+    if encoding == "gzip":
+        # the default level 9 is several times slower, for a few percent smaller result
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    # optional dependency, its presence is checked when the client is created
+    import zstandard  # noqa: PLC0415
+
+    return zstandard.ZstdCompressor().compress(data)
@@ -0,0 +1,251 @@
+# Copyright 2025 IQM client developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Decoding measurement results directly into NumPy arrays.
+
+The measurement results of a job are a JSON list with one object per circuit, mapping each measurement key to a
+nested list of shape ``(shots, qubits)``. Decoding them with :mod:`json` creates a Python object for every single
+result. The functions in this module instead locate the nested lists in the raw response body and parse each of
+them in one go into a contiguous ``uint8`` array, without intermediate Python lists.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from enum import Enum, auto
+import json
+import re
+
+from iqm.iqm_client.models import CircuitMeasurementArrays
+import numpy as np
+
+_WHITESPACE = b" \t\n\r"
+_KEY = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_EMPTY_VALUE = re.compile(rb"\[\s*\]")
+_VALUE_END = re.compile(rb"\]\s*\]")
+_DIGIT = re.compile(rb"\d")
+_BRACKETS_TO_SPACES = bytes.maketrans(b"[]", b"  ")
+_ZERO = ord("0")
+
+
+class _State(Enum):
+    LIST_START = auto()
+    CIRCUIT_OR_LIST_END = auto()
+    FIRST_KEY_OR_CIRCUIT_END = auto()
+    KEY = auto()
+    COLON = auto()
+    VALUE = auto()
+    COMMA_OR_CIRCUIT_END = auto()
+    COMMA_OR_LIST_END = auto()
+    DONE = auto()
+
+
+class _MeasurementsParser:
+    """Incremental parser for the measurement results of a job.
+
+    Bytes are fed in arbitrary chunks, and the results of each circuit are returned as soon as the circuit has
+    been fully received. Only the unconsumed tail of the input is buffered.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._pos = 0
+        self._state = _State.LIST_START
+        self._circuit: CircuitMeasurementArrays = {}
+        self._key = ""
+        self._value_scan_pos = 0
+
+    def feed(self, chunk: bytes) -> list[CircuitMeasurementArrays]:
+        """Parse the next chunk of the input.
+
+        Args:
+            chunk: Next bytes of the input.
+
+        Returns:
+            Results of the circuits that were completed by ``chunk``.
+
+        Raises:
+            ValueError: The input is not valid measurement results.
+
+        """
+        self._buffer += chunk
+        circuits = []
+        while self._state is not _State.DONE and self._step(circuits):
+            pass
+        # drop the consumed input, so that the buffer holds at most the circuit that is being parsed
+        del self._buffer[: self._pos]
+        self._value_scan_pos = max(0, self._value_scan_pos - self._pos)
+        self._pos = 0
+        return circuits
+
+    def close(self) -> None:
+        """Check that the whole input has been parsed.
+
+        Raises:
+            ValueError: The input ended prematurely or has trailing data.
+
+        """
+        if self._state is not _State.DONE:
+            raise ValueError("Measurement results ended prematurely.")
+        if bytes(self._buffer).strip(_WHITESPACE):
+            raise ValueError("Unexpected data after the measurement results.")
+
+    def _step(self, circuits: list[CircuitMeasurementArrays]) -> bool:
+        """Parse the next token of the input.
+
+        Returns:
+            False iff more input is needed for parsing the next token.
+
+        """
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+            self._pos += 1
+        if self._pos >= len(self._buffer):
+            return False
+        if self._state is _State.VALUE:
+            return self._parse_value()
+        if self._state is _State.KEY:
+            return self._parse_key()
+
+        char = chr(self._buffer[self._pos])
+        transitions = _TRANSITIONS[self._state]
+        if char not in transitions:
+            raise ValueError(f"Unexpected character {char!r} in measurement results.")
+        if char != '"':
+            self._pos += 1
+        self._state = transitions[char]
+        if self._state is _State.FIRST_KEY_OR_CIRCUIT_END:
+            self._circuit = {}
+        elif self._state is _State.COMMA_OR_LIST_END:
+            circuits.append(self._circuit)
+        elif self._state is _State.VALUE:
+            self._value_scan_pos = self._pos
+        return True
+
+    def _parse_key(self) -> bool:
+        if self._buffer[self._pos] != ord('"'):
+            raise ValueError("Expected a measurement key in measurement results.")
+        match = _KEY.match(self._buffer, self._pos)
+        if match is None:
+            return False
+        self._key = json.loads(match.group())
+        self._pos = match.end()
+        self._state = _State.COLON
+        return True
+
+    def _parse_value(self) -> bool:
+        if self._buffer[self._pos] != ord("["):
+            raise ValueError(f"Expected a list of shots for measurement key {self._key!r}.")
+        if (empty := _EMPTY_VALUE.match(self._buffer, self._pos)) is not None:
+            self._circuit[self._key] = np.zeros((0, 0), dtype=np.uint8)
+            self._pos = empty.end()
+            self._state = _State.COMMA_OR_CIRCUIT_END
+            return True
+
+        end = _VALUE_END.search(self._buffer, max(self._pos, self._value_scan_pos))
+        if end is None:
+            # resume the search from the last closing bracket, any match must start there or later
+            self._value_scan_pos = max(self._pos, self._buffer.rfind(b"]", self._pos))
+            return False
+        self._circuit[self._key] = _parse_shots(bytes(self._buffer[self._pos : end.end()]), self._key)
+        self._pos = end.end()
+        self._state = _State.COMMA_OR_CIRCUIT_END
+        return True
+
+
+_TRANSITIONS: dict[_State, dict[str, _State]] = {
+    _State.LIST_START: {"[": _State.CIRCUIT_OR_LIST_END},
+    _State.CIRCUIT_OR_LIST_END: {"{": _State.FIRST_KEY_OR_CIRCUIT_END, "]": _State.DONE},
+    _State.FIRST_KEY_OR_CIRCUIT_END: {'"': _State.KEY, "}": _State.COMMA_OR_LIST_END},
+    _State.COLON: {":": _State.VALUE},
+    _State.COMMA_OR_CIRCUIT_END: {",": _State.KEY, "}": _State.COMMA_OR_LIST_END},
+    _State.COMMA_OR_LIST_END: {",": _State.CIRCUIT_OR_LIST_END, "]": _State.DONE},
+}
+"""Transitions of the parser on single-character tokens. The tokens that start a key are not consumed."""
+
+
+def _parse_shots(text: bytes, key: str) -> np.ndarray:
+    """Parse the nested list of results of a single measurement operation.
+
+    Args:
+        text: JSON representation of a non-empty nested list of non-negative integers of shape ``(shots, qubits)``.
+        key: Measurement key of the results, for error messages.
+
+    Returns:
+        The results as an array of shape ``(shots, qubits)``.
+
+    Raises:
+        ValueError: ``text`` does not represent valid measurement results.
+
+    """
+    shots = text.count(b"[") - 1
+    # a list of shape (shots, qubits) contains shots * qubits - 1 commas, unless qubits == 0
+    n_values = text.count(b",") + 1
+    if n_values == shots and _DIGIT.search(text) is None:
+        n_values = 0
+    if n_values == 0:
+        return np.zeros((shots, 0), dtype=np.uint8)
+    if _EMPTY_VALUE.search(text) is not None:
+        raise ValueError(f"Measurement results for measurement key {key!r} are not rectangular.")
+
+    raw = np.frombuffer(text, dtype=np.uint8)
+    digits = raw[(raw >= _ZERO) & (raw <= _ZERO + 9)]
+    if digits.size == n_values and b"-" not in text:
+        # fast path, all the results are single digits
+        values = digits - np.uint8(_ZERO)
+    else:
+        values = np.fromstring(text.translate(_BRACKETS_TO_SPACES), dtype=np.int64, sep=",")
+        if values.size != n_values or values.min() < 0 or values.max() > np.iinfo(np.uint8).max:
+            raise ValueError(f"Invalid measurement results for measurement key {key!r}.")
+        values = values.astype(np.uint8)
+
+    # every shot must contain the same number of results, i.e. the same number of commas
+    comma_counts = np.cumsum(raw == ord(","), dtype=np.int32)
+    row_commas = comma_counts[np.flatnonzero(raw == ord("]"))[:-1]] - comma_counts[np.flatnonzero(raw == ord("["))[1:]]
+    if n_values % shots or np.any(row_commas != n_values // shots - 1):
+        raise ValueError(f"Measurement results for measurement key {key!r} are not rectangular.")
+    return values.reshape(shots, n_values // shots)
+
+
+def iter_measurement_arrays(chunks: Iterable[bytes]) -> Iterator[CircuitMeasurementArrays]:
+    """Decode the JSON measurement results of a job into arrays, circuit by circuit.
+
+    Args:
+        chunks: JSON representation of the measurement results of a job, in consecutive chunks of any size.
+
+    Yields:
+        Measurement results of each circuit of the job, as soon as they have been decoded.
+
+    Raises:
+        ValueError: The input is not valid measurement results.
+
+    """
+    parser = _MeasurementsParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
+
+
+def parse_measurement_arrays(data: bytes) -> list[CircuitMeasurementArrays]:
+    """Decode the JSON measurement results of a job into arrays.
+
+    Args:
+        data: JSON representation of the measurement results of a job.
+
+    Returns:
+        Measurement results of each circuit of the job.
+
+    Raises:
+        ValueError: The input is not valid measurement results.
+
+    """
+    return list(iter_measurement_arrays([data]))
@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import cached_property
@@ -22,7 +23,8 @@ import re
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, StrictStr, TypeAdapter, field_validator
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr, StrictStr, TypeAdapter, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
 
@@ -417,6 +419,40 @@ class Circuit(BaseModel):
     metadata: dict[str, Any] | None = Field(None)
     """arbitrary metadata associated with the circuit"""
 
+    @classmethod
+    def from_trusted(
+        cls,
+        name: str,
+        instructions: list[Instruction] | tuple[Instruction, ...],
+        metadata: dict[str, Any] | None = None,
+    ) -> Circuit:
+        """Construct a circuit from instructions that are known to be valid, without validating them.
+
+        Meant for circuits produced by code that is known to construct valid instructions, such as the
+        circuit converters of the Qiskit and Cirq adapters. Only the circuit name and the presence of
+        instructions are checked. Submit such circuits with ``validate=False`` in
+        :meth:`.IQMClient.submit_circuits` to also skip validating them against the supported operations,
+        in which case they are still validated against the quantum architecture.
+
+        Args:
+            name: name of the circuit
+            instructions: instructions comprising the circuit, constructed e.g. using
+                :meth:`Instruction.model_construct`
+            metadata: arbitrary metadata associated with the circuit
+
+        Returns:
+            the circuit
+
+        Raises:
+            ValueError: the circuit has no name or no instructions
+
+        """
+        if not name:
+            raise ValueError("A circuit should have a non-empty string for a name.")
+        if not instructions:
+            raise ValueError("Each circuit should have at least one instruction.")
+        return cls.model_construct(name=name, instructions=instructions, metadata=metadata)
+
     def all_qubits(self) -> set[str]:
         """Return the names of all qubits in the circuit."""
         qubits: set[str] = set()
@@ -733,6 +769,88 @@ class DynamicQuantumArchitecture(BaseModel):
         """
         return tuple(sorted(self.qubits + self.computational_resonators, key=_component_sort_key))
 
+    @cached_property
+    def index(self) -> ArchitectureIndex:
+        """Lookup tables for validating instructions against the architecture, built on first use."""
+        return ArchitectureIndex(self)
+
+
+class ArchitectureIndex:
+    """Lookup tables of a dynamic quantum architecture, for checking gate loci in constant time.
+
+    For symmetric operations each locus is stored in a canonical order, so that all its permutations
+    are found without materializing them. Use the cached :attr:`DynamicQuantumArchitecture.index`
+    instead of creating new instances.
+
+    Args:
+        architecture: architecture to index
+
+    """
+
+    def __init__(self, architecture: DynamicQuantumArchitecture):
+        self.components: frozenset[str] = frozenset(architecture.components)
+        """all the locus components of the architecture"""
+        self.qubits: frozenset[str] = frozenset(architecture.qubits)
+        """qubits of the architecture"""
+        self.computational_resonators: frozenset[str] = frozenset(architecture.computational_resonators)
+        """computational resonators of the architecture"""
+        # keyed by (gate name, implementation name), where implementation None means any implementation
+        self._loci: dict[tuple[str, str | None], frozenset[Locus]] = {}
+        self._locus_components: dict[tuple[str, str | None], frozenset[str]] = {}
+        self._symmetric: dict[str, bool] = {}
+        for gate_name, gate_info in architecture.gates.items():
+            op_info = _SUPPORTED_OPERATIONS.get(gate_name)
+            symmetric = op_info is not None and op_info.symmetric
+            self._symmetric[gate_name] = symmetric
+            implementations: dict[str | None, tuple[Locus, ...]] = {
+                impl_name: impl_info.loci for impl_name, impl_info in gate_info.implementations.items()
+            }
+            implementations[None] = gate_info.loci
+            for impl_name, loci in implementations.items():
+                key = (gate_name, impl_name)
+                self._loci[key] = frozenset(_canonical_locus(locus) for locus in loci) if symmetric else frozenset(loci)
+                self._locus_components[key] = frozenset(c for locus in loci for c in locus)
+
+    def has_gate(self, name: str, implementation: str | None = None) -> bool:
+        """True iff the architecture supports the given gate (and implementation).
+
+        Args:
+            name: name of the gate
+            implementation: name of the implementation, or ``None`` for any implementation
+
+        """
+        return (name, implementation) in self._loci
+
+    def is_allowed_locus(self, name: str, locus: Iterable[str], implementation: str | None = None) -> bool:
+        """True iff the given gate (and implementation) is available at the given locus.
+
+        Args:
+            name: name of the gate
+            locus: locus to check
+            implementation: name of the implementation, or ``None`` for any implementation
+
+        """
+        loci = self._loci.get((name, implementation))
+        if loci is None:
+            return False
+        locus = tuple(locus)
+        return (_canonical_locus(locus) if self._symmetric[name] else locus) in loci
+
+    def locus_components(self, name: str, implementation: str | None = None) -> frozenset[str]:
+        """Components that appear in at least one locus of the given gate (and implementation).
+
+        Args:
+            name: name of the gate
+            implementation: name of the implementation, or ``None`` for any implementation
+
+        """
+        return self._locus_components.get((name, implementation), frozenset())
+
+
+def _canonical_locus(locus: Locus) -> Locus:
+    """Canonical order of the components of a locus of a symmetric gate."""
+    return tuple(sorted(locus))
+
 
 class HeraldingMode(str, Enum):
     """Heralding mode for circuit execution.
@@ -931,6 +1049,10 @@ and the inner list elements to the qubits measured in the measurement operation.
 CircuitMeasurementResultsBatch = list[CircuitMeasurementResults]
 """Type that represents measurement results for a batch of circuits."""
 
+CircuitMeasurementArrays = dict[str, np.ndarray]
+"""Measurement results from a single circuit as arrays. For each measurement operation in the circuit,
+maps the measurement key to an ``uint8`` array of shape ``(shots, qubits)`` holding the corresponding results."""
+
 
 class JobParameters(BaseModel):
     """Job-specific parameters extracted from the original RunRequest."""
@@ -1100,23 +1222,48 @@ class RunResult(BaseModel):
     warnings: list[str] | None = Field(None)
     """list of warning messages"""
 
+    _measurement_arrays: list[CircuitMeasurementArrays] | None = PrivateAttr(None)
+
+    @property
+    def measurement_arrays(self) -> list[CircuitMeasurementArrays] | None:
+        """Measurement results for the circuit(s) as compact arrays, or ``None`` if there are no results.
+
+        ``RunResult.measurement_arrays[circuit_index][key][shot, qubit_index]`` corresponds to
+        ``RunResult.measurements[circuit_index][key][shot][qubit_index]``.
+        If the job result was retrieved with ``measurements_as_arrays=True``, the results are only available
+        through this accessor and :attr:`measurements` is ``None``.
+        """
+        if self._measurement_arrays is None and self.measurements is not None:
+            self._measurement_arrays = [
+                {
+                    key: np.array(shots, dtype=np.uint8).reshape(len(shots), len(shots[0]) if shots else 0)
+                    for key, shots in circuit_measurements.items()
+                }
+                for circuit_measurements in self.measurements
+            ]
+        return self._measurement_arrays
+
     @staticmethod
     def from_dict(inp: dict[str, str | dict | list | None]) -> RunResult:
         """Parses the result from a dict.
 
         Args:
-            inp: value to parse, has to map to RunResult
+            inp: value to parse, has to map to RunResult. Measurement results that have already been decoded
+                into arrays can be given under the key ``"measurement_arrays"``.
 
         Returns:
             parsed job result
 
         """
         input_copy = inp.copy()
+        measurement_arrays = input_copy.pop("measurement_arrays", None)
         try:
             status = Status(input_copy.pop("status"))
         except ValueError:
             status = Status.UNKNOWN
-        return RunResult(status=status, **input_copy)  # type:ignore[arg-type]
+        run_result = RunResult(status=status, **input_copy)  # type:ignore[arg-type]
+        run_result._measurement_arrays = measurement_arrays  # type:ignore[assignment]
+        return run_result
 
 
 class RunStatus(BaseModel):
@@ -0,0 +1,108 @@
+# Copyright 2025 IQM client developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pipelined execution of a stream of circuit batches."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+import threading
+from typing import TypeVar
+
+B = TypeVar("B")
+P = TypeVar("P")
+J = TypeVar("J")
+R = TypeVar("R")
+
+
+def run_pipelined(  # noqa: PLR0913
+    batches: Iterable[B],
+    prepare: Callable[[B], P],
+    submit: Callable[[P], J],
+    wait: Callable[[J], R],
+    *,
+    max_jobs_in_flight: int = 2,
+    max_workers: int | None = None,
+) -> Iterator[R]:
+    """Execute batches of circuits so that the preparation of the next batches overlaps with the execution of
+    the previous ones.
+
+    Up to ``max_jobs_in_flight`` batches are being prepared, submitted or executed at any time. The batches are
+    prepared concurrently on worker threads, but submitted in the order they are given, so that they are
+    queued on the server in order. When the results of the oldest batch have been yielded, the next batch is
+    taken from ``batches``, so that its preparation overlaps with the execution of the other batches in flight.
+
+    If the iteration is stopped early, the batches that have not been submitted yet are not submitted, but the
+    jobs that have already been submitted are not aborted. Likewise, once a batch fails to be prepared or
+    submitted, none of the batches after it are submitted.
+
+    Args:
+        batches: Batches of circuits to execute. Consumed lazily, so it can be e.g. a generator that decides
+            the next batch based on earlier results, as long as it does not need more than the results
+            yielded so far.
+        prepare: Prepares a batch for submission, e.g. transpiles it and creates the run request.
+        submit: Submits a prepared batch, and returns the job.
+        wait: Waits for a job to finish, and returns its results.
+        max_jobs_in_flight: Maximum number of batches being prepared or executed at the same time.
+        max_workers: Number of threads used for preparing the batches. By default
+            ``max_jobs_in_flight``.
+
+    Yields:
+        The results of each batch, in the order of ``batches``.
+
+    Raises:
+        ValueError: ``max_jobs_in_flight`` is not positive.
+
+    """
+    if max_jobs_in_flight < 1:
+        raise ValueError("max_jobs_in_flight must be at least 1.")
+
+    stopped = threading.Event()
+
+    def _prepare_and_submit(batch: B, previous: Future | None) -> J:
+        prepared = prepare(batch)
+        if previous is not None:
+            # submit in order, and not at all once an earlier batch has failed, its own future reports the error
+            try:
+                failed = previous.exception() is not None
+            except CancelledError:
+                failed = True
+            if failed:
+                stopped.set()
+        if stopped.is_set():
+            raise CancelledError
+        return submit(prepared)
+
+    in_flight: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers or max_jobs_in_flight, thread_name_prefix="iqm-pipeline") as pool:
+        try:
+            batch_iterator = iter(batches)
+            exhausted = False
+            while True:
+                while not exhausted and len(in_flight) < max_jobs_in_flight:
+                    try:
+                        batch = next(batch_iterator)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    in_flight.append(pool.submit(_prepare_and_submit, batch, in_flight[-1] if in_flight else None))
+                if not in_flight:
+                    return
+                job = in_flight.popleft().result()
+                yield wait(job)
+        finally:
+            stopped.set()
+            for future in in_flight:
+                future.cancel()
@@ -0,0 +1,201 @@
+# Copyright 2025 IQM client developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Polling the status of many jobs with adaptive backoff."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import threading
+import time
+from uuid import UUID
+
+from iqm.iqm_client.errors import APITimeoutError
+from iqm.iqm_client.iqm_client import DEFAULT_TIMEOUT_SECONDS, REQUESTS_POOL_MAXSIZE, IQMClient
+from iqm.iqm_client.models import RunStatus, Status
+
+from iqm.station_control.interface.models import Statuses
+
+_ACTIVE_STATUSES = frozenset(
+    {
+        Status.EXECUTION_STARTED,
+        Status.EXECUTION_ENDED,
+        Status.POST_PROCESSING_PENDING,
+        Status.POST_PROCESSING_STARTED,
+        Status.POST_PROCESSING_ENDED,
+    }
+)
+"""Statuses of jobs that are on the hardware or past it, and are thus expected to finish soon."""
+
+
+@dataclass(frozen=True)
+class PollingPolicy:
+    """Adaptive exponential backoff for polling the status of a job.
+
+    A job is first polled after :attr:`initial_interval` seconds, and the interval grows by :attr:`backoff_factor`
+    after every poll. Jobs that are still being compiled or are queued for execution are polled at most every
+    :attr:`max_interval_queued` seconds, whereas jobs that have started executing are polled at least every
+    :attr:`max_interval_active` seconds. When a job starts executing, the interval is reset back to
+    :attr:`initial_interval`, so that short jobs are noticed quickly.
+    """
+
+    initial_interval: float = 0.2
+    """Seconds to wait before polling a job for the second time."""
+    backoff_factor: float = 1.5
+    """Factor by which the polling interval grows after each poll."""
+    max_interval_queued: float = 10.0
+    """Maximum polling interval in seconds for jobs that have not started executing yet."""
+    max_interval_active: float = 2.0
+    """Maximum polling interval in seconds for jobs that have started executing."""
+
+    def next_interval(self, interval: float | None, status: Status, previous_status: Status | None) -> float:
+        """Compute the time to wait before polling a job again.
+
+        Args:
+            interval: Previous polling interval of the job, or ``None`` if the job was polled for the first time.
+            status: Current status of the job.
+            previous_status: Status of the job in the previous poll, or ``None`` if there was no previous poll.
+
+        Returns:
+            Seconds to wait before the next poll.
+
+        """
+        if interval is None:
+            return self.initial_interval
+        if status in _ACTIVE_STATUSES:
+            if previous_status not in _ACTIVE_STATUSES:
+                return self.initial_interval
+            return min(interval * self.backoff_factor, self.max_interval_active)
+        return min(interval * self.backoff_factor, self.max_interval_queued)
+
+
+class JobPoller:
+    """Polls the status of many jobs at once, with an adaptive backoff for each job.
+
+    The poller can be shared between threads. Concurrent status requests for the same job are
+    deduplicated, so that only one HTTP request per job is in flight at any time.
+
+    Args:
+        client: Client used for querying the job statuses.
+        policy: Backoff policy for the polling intervals. If ``None``, the default :class:`PollingPolicy` is used.
+        max_concurrent_requests: Maximum number of status requests in flight at the same time.
+
+    """
+
+    def __init__(
+        self,
+        client: IQMClient,
+        *,
+        policy: PollingPolicy | None = None,
+        max_concurrent_requests: int = REQUESTS_POOL_MAXSIZE,
+    ):
+        self._client = client
+        self._policy = policy or PollingPolicy()
+        self._max_concurrent_requests = max_concurrent_requests
+        self._lock = threading.Lock()
+        self._in_flight: dict[UUID, Future[RunStatus]] = {}
+
+    def get_run_status(self, job_id: UUID) -> RunStatus:
+        """Query the status of a submitted job.
+
+        If another thread is already querying the status of the same job, waits for and returns its result
+        instead of making a new request.
+
+        Args:
+            job_id: ID of the job to query.
+
+        Returns:
+            Job status.
+
+        """
+        with self._lock:
+            future = self._in_flight.get(job_id)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[job_id] = future
+        if not is_owner:
+            return future.result()
+
+        try:
+            run_status = self._client.get_run_status(job_id)
+            future.set_result(run_status)
+            return run_status
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[job_id]
+
+    def wait_for_many(
+        self,
+        job_ids: Iterable[UUID],
+        timeout_secs: float = DEFAULT_TIMEOUT_SECONDS,
+        *,
+        progress_callback: Callable[[Statuses], None] | None = None,
+    ) -> dict[UUID, RunStatus]:
+        """Poll the statuses of jobs until all of them are either ready, failed, aborted, or timed out.
+
+        Each job is polled according to its own backoff schedule, and the jobs that are due at the same time are
+        polled concurrently. Use :meth:`.IQMClient.get_run` to retrieve the results of the finished jobs.
+
+        Args:
+            job_ids: IDs of the jobs to wait for.
+            timeout_secs: How long to wait for all the jobs to finish before raising an APITimeoutError (seconds).
+            progress_callback: Called after every polling round with the number of jobs in each status,
+                e.g. the callback returned by :func:`iqm.station_control.client.utils.get_progress_bar_callback`.
+
+        Returns:
+            Mapping from job ID to the terminal status of the job, in the order of ``job_ids``.
+
+        Raises:
+            APITimeoutError: time exceeded the set timeout
+
+        """
+        job_ids = list(dict.fromkeys(job_ids))
+        deadline = time.monotonic() + timeout_secs
+        next_poll_times = dict.fromkeys(job_ids, 0.0)
+        intervals: dict[UUID, float | None] = dict.fromkeys(job_ids)
+        latest: dict[UUID, RunStatus] = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, self._max_concurrent_requests)) as executor:
+            while next_poll_times:
+                now = time.monotonic()
+                due = [job_id for job_id, poll_time in next_poll_times.items() if poll_time <= now]
+                for job_id, run_status in zip(due, executor.map(self.get_run_status, due)):
+                    previous = latest.get(job_id)
+                    latest[job_id] = run_status
+                    if run_status.status in Status.terminal_statuses():
+                        del next_poll_times[job_id]
+                        continue
+                    intervals[job_id] = self._policy.next_interval(
+                        intervals[job_id], run_status.status, previous.status if previous else None
+                    )
+                    next_poll_times[job_id] = time.monotonic() + intervals[job_id]
+
+                if progress_callback:
+                    counts = Counter(run_status.status for run_status in latest.values())
+                    progress_callback([(status.value, count, len(job_ids)) for status, count in counts.items()])
+                if not next_poll_times:
+                    break
+                if time.monotonic() >= deadline:
+                    raise APITimeoutError(
+                        f"{len(next_poll_times)} of the {len(job_ids)} jobs didn't finish in {timeout_secs} seconds."
+                    )
+                time.sleep(max(0.0, min(*next_poll_times.values(), deadline) - time.monotonic()))
+
+        return {job_id: latest[job_id] for job_id in job_ids}
@@ -0,0 +1,664 @@
+# Copyright 2025 IQM client developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Local noiseless simulation of IQM circuits, for testing and dry runs without a quantum computer.
+
+The circuits are simulated directly in the IQM circuit format, using NumPy. Circuits that only contain
+Clifford operations are simulated using a stabilizer tableau, which scales to any number of qubits,
+and other circuits using a statevector.
+
+:class:`LocalIQMClient` implements the job submission surface of :class:`.IQMClient` on top of the simulator,
+so that code using the client can be run offline:
+
+.. code-block:: python
+
+    client = LocalIQMClient(seed=1234)
+    job_id = client.submit_circuits(circuits, shots=1000)
+    result = client.get_run(job_id, measurements_as_arrays=True)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+import uuid
+from uuid import UUID
+
+from iqm.iqm_client.errors import CircuitExecutionError, CircuitValidationError
+from iqm.iqm_client.iqm_client import DEFAULT_TIMEOUT_SECONDS, REQUESTS_TIMEOUT
+from iqm.iqm_client.models import (
+    Circuit,
+    CircuitBatch,
+    CircuitCompilationOptions,
+    CircuitMeasurementArrays,
+    DynamicQuantumArchitecture,
+    Instruction,
+    JobParameters,
+    Metadata,
+    RunResult,
+    RunStatus,
+    Status,
+    _op_current_name,
+    validate_circuit,
+)
+from iqm.iqm_client.validation import validate_circuit_instructions, validate_qubit_mapping
+import numpy as np
+
+MAX_STATEVECTOR_QUBITS = 24
+"""Default maximum number of locus components in a non-Clifford circuit, simulated using a statevector."""
+
+_CLIFFORD_ATOL = 1e-10
+"""Absolute tolerance, in quarter turns, for considering a ``prx`` angle a Clifford angle."""
+
+_PAULI_X = np.array([[0, 1], [1, 0]], dtype=np.complex128)
+
+_NO_EFFECT_OPERATIONS = frozenset({"barrier", "delay"})
+"""Operations that do not affect the state in a noiseless simulation."""
+
+_SUPPORTED_NAMES = frozenset({"prx", "cc_prx", "cz", "move", "measure", "reset"}) | _NO_EFFECT_OPERATIONS
+"""Names of the operations supported by the simulator."""
+
+
+@dataclass
+class _Operation:
+    """Instruction of a circuit in the form used by the simulators."""
+
+    name: str
+    """Current name of the operation."""
+    qubits: tuple[int, ...]
+    """Indices of the locus components."""
+    instruction: Instruction
+    """The instruction."""
+
+
+@dataclass
+class _Branch:
+    """Statevector for the shots that have had the same mid-circuit measurement results so far."""
+
+    state: np.ndarray
+    """State, with one axis per locus component."""
+    shots: int
+    """Number of shots that follow this branch."""
+    results: dict[str, tuple[int, ...]] = field(default_factory=dict)
+    """Maps measurement keys to the results of the measurement."""
+    feedback: dict[tuple[str, str], int] = field(default_factory=dict)
+    """Maps feedback keys and qubit names to the results used for classical control."""
+
+
+def simulate_circuit(
+    circuit: Circuit,
+    shots: int,
+    *,
+    rng: np.random.Generator | None = None,
+    max_statevector_qubits: int = MAX_STATEVECTOR_QUBITS,
+) -> CircuitMeasurementArrays:
+    r"""Simulate a circuit without noise.
+
+    The circuit may contain the operations ``prx``, ``cc_prx``, ``cz``, ``move``, ``measure``, ``reset``,
+    ``barrier`` and ``delay``. ``move`` is simulated as a SWAP, i.e. with zero phases, see :class:`.Instruction`.
+    The circuit is simulated on the locus components it uses, which are initially in the :math:`|0\rangle` state.
+
+    Circuits that only contain Clifford operations, i.e. no ``cc_prx`` or ``reset``, and ``prx`` gates whose
+    angles are multiples of a quarter turn, are simulated using a stabilizer tableau. The measurement results of all
+    the shots are then sampled at once from the affine space of possible outcomes.
+
+    Other circuits are simulated using a statevector. The shots are split between the outcomes of each
+    mid-circuit measurement, and each distinct sequence of mid-circuit outcomes is simulated only once.
+    The results of the final measurements are sampled for all the shots of a sequence at once.
+
+    Args:
+        circuit: Circuit to simulate.
+        shots: Number of shots.
+        rng: Random number generator to use for sampling the measurement results.
+        max_statevector_qubits: Maximum number of locus components in a circuit that must be simulated using a
+            statevector.
+
+    Returns:
+        The measurement results, in the format of :attr:`.RunResult.measurement_arrays`.
+
+    Raises:
+        ValueError: The circuit contains an unsupported operation, or is too large to simulate.
+
+    """
+    if shots < 1:
+        raise ValueError("Number of shots must be greater than zero.")
+    if rng is None:
+        rng = np.random.default_rng()
+    components, operations = _parse(circuit)
+    if _is_clifford(operations):
+        return _simulate_stabilizer(len(components), operations, shots, rng)
+    if len(components) > max_statevector_qubits:
+        raise ValueError(
+            f"Circuit '{circuit.name}' acts on {len(components)} locus components and is not a Clifford circuit, "
+            f"but statevector simulation is limited to {max_statevector_qubits} components."
+        )
+    return _simulate_statevector(components, operations, shots, rng)
+
+
+def _parse(circuit: Circuit) -> tuple[list[str], list[_Operation]]:
+    """Index the locus components of the circuit in the order they first appear in, and convert its instructions."""
+    indices: dict[str, int] = {}
+    operations = []
+    for instruction in circuit.instructions:
+        name = _op_current_name(instruction.name)
+        if name not in _SUPPORTED_NAMES:
+            raise ValueError(f"Operation '{instruction.name}' is not supported by the simulator.")
+        qubits = tuple(indices.setdefault(component, len(indices)) for component in instruction.qubits)
+        if name not in _NO_EFFECT_OPERATIONS:
+            operations.append(_Operation(name, qubits, instruction))
+    return list(indices), operations
+
+
+def _quarter_turns(value: float) -> int | None:
+    """The given angle in quarter turns modulo a full turn, or None if it is not a multiple of a quarter turn."""
+    quarters = 4 * value
+    rounded = round(quarters)
+    if abs(quarters - rounded) > _CLIFFORD_ATOL:
+        return None
+    return rounded % 4
+
+
+def _is_clifford(operations: list[_Operation]) -> bool:
+    """True iff the operations can be simulated using a stabilizer tableau."""
+    for operation in operations:
+        if operation.name in ("cc_prx", "reset"):
+            return False
+        if operation.name == "prx":
+            angle = _quarter_turns(operation.instruction.args["angle_t"])
+            if angle is None or (angle and _quarter_turns(operation.instruction.args["phase_t"]) is None):
+                return False
+    return True
+
+
+class _Tableau:
+    """Stabilizer tableau whose signs are affine functions of the random measurement outcomes.
+
+    Rows ``0..n-1`` are the destabilizers and rows ``n..2n-1`` the stabilizers, see
+    S. Aaronson and D. Gottesman, Phys. Rev. A 70, 052328 (2004). Instead of drawing the outcome of each
+    random measurement, it is represented by a new binary variable. The signs of the rows, and hence the outcomes
+    of the later measurements, are then affine functions of these variables over GF(2), and the results of
+    any number of shots can be sampled by drawing values for the variables.
+
+    Args:
+        num_qubits: Number of qubits.
+        num_variables: Maximum number of random measurement outcomes.
+
+    """
+
+    def __init__(self, num_qubits: int, num_variables: int):
+        n = num_qubits
+        self.n = n
+        self.x = np.zeros((2 * n, n), dtype=bool)
+        self.z = np.zeros((2 * n, n), dtype=bool)
+        self.x[np.arange(n), np.arange(n)] = True
+        self.z[np.arange(n, 2 * n), np.arange(n)] = True
+        # column 0 is the constant term, column k the coefficient of the k-th variable
+        self.signs = np.zeros((2 * n, num_variables + 1), dtype=bool)
+        self.num_variables = 0
+
+    def h(self, a: int) -> None:
+        """Apply a Hadamard gate."""
+        self.signs[:, 0] ^= self.x[:, a] & self.z[:, a]
+        self.x[:, a], self.z[:, a] = self.z[:, a].copy(), self.x[:, a].copy()
+
+    def s(self, a: int, power: int = 1) -> None:
+        """Apply the phase gate ``power`` times."""
+        for _ in range(power % 4):
+            self.signs[:, 0] ^= self.x[:, a] & self.z[:, a]
+            self.z[:, a] ^= self.x[:, a]
+
+    def cnot(self, a: int, b: int) -> None:
+        """Apply a CNOT gate with the control ``a`` and the target ``b``."""
+        self.signs[:, 0] ^= self.x[:, a] & self.z[:, b] & ~(self.x[:, b] ^ self.z[:, a])
+        self.x[:, b] ^= self.x[:, a]
+        self.z[:, a] ^= self.z[:, b]
+
+    def cz(self, a: int, b: int) -> None:
+        """Apply a CZ gate."""
+        self.h(b)
+        self.cnot(a, b)
+        self.h(b)
+
+    def swap(self, a: int, b: int) -> None:
+        """Apply a SWAP gate."""
+        self.x[:, [a, b]] = self.x[:, [b, a]]
+        self.z[:, [a, b]] = self.z[:, [b, a]]
+
+    def prx(self, angle: int, phase: int, a: int) -> None:
+        r"""Apply a PRX gate, with the angles given in quarter turns, using :math:`RX = H \: RZ \: H`."""
+        if angle:
+            self.s(a, -phase)
+            self.h(a)
+            self.s(a, angle)
+            self.h(a)
+            self.s(a, phase)
+
+    def _row_products(
+        self, x: np.ndarray, z: np.ndarray, signs: np.ndarray, source: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Multiply the given Pauli rows by the row ``source``, and return the products."""
+        x_1, z_1 = self.x[source].astype(np.int8), self.z[source].astype(np.int8)
+        x_2, z_2 = x.astype(np.int8), z.astype(np.int8)
+        # powers of i from multiplying the single-qubit Paulis
+        g = x_1 * z_1 * (z_2 - x_2) + x_1 * (1 - z_1) * z_2 * (2 * x_2 - 1) + (1 - x_1) * z_1 * x_2 * (1 - 2 * z_2)
+        new_signs = signs ^ self.signs[source]
+        new_signs[..., 0] ^= np.mod(g.sum(axis=-1), 4) == 2
+        return x ^ self.x[source], z ^ self.z[source], new_signs
+
+    def measure(self, a: int) -> np.ndarray:
+        """Measure a qubit in the Z basis.
+
+        Returns:
+            The outcome, as the coefficients of an affine function of the variables.
+
+        """
+        n = self.n
+        anticommuting = np.flatnonzero(self.x[n:, a])
+        if anticommuting.size:
+            p = n + anticommuting[0]
+            rows = np.flatnonzero(self.x[:, a])
+            rows = rows[rows != p]
+            self.x[rows], self.z[rows], self.signs[rows] = self._row_products(
+                self.x[rows], self.z[rows], self.signs[rows], p
+            )
+            self.x[p - n], self.z[p - n], self.signs[p - n] = self.x[p], self.z[p], self.signs[p]
+            self.num_variables += 1
+            self.x[p] = False
+            self.z[p] = False
+            self.z[p, a] = True
+            self.signs[p] = False
+            self.signs[p, self.num_variables] = True
+            return self.signs[p].copy()
+        x = np.zeros(n, dtype=bool)
+        z = np.zeros(n, dtype=bool)
+        signs = np.zeros(self.signs.shape[1], dtype=bool)
+        for i in np.flatnonzero(self.x[:n, a]):
+            x, z, signs = self._row_products(x, z, signs, n + i)
+        return signs
+
+
+def _simulate_stabilizer(
+    num_qubits: int, operations: list[_Operation], shots: int, rng: np.random.Generator
+) -> CircuitMeasurementArrays:
+    """Simulate a Clifford circuit using a stabilizer tableau."""
+    num_measured = sum(len(operation.qubits) for operation in operations if operation.name == "measure")
+    tableau = _Tableau(num_qubits, num_measured)
+    keys: list[tuple[str, int]] = []
+    outcomes = []
+    for operation in operations:
+        qubits = operation.qubits
+        match operation.name:
+            case "prx":
+                args = operation.instruction.args
+                tableau.prx(_quarter_turns(args["angle_t"]), _quarter_turns(args["phase_t"]) or 0, qubits[0])
+            case "cz":
+                tableau.cz(*qubits)
+            case "move":
+                tableau.swap(*qubits)
+            case "measure":
+                keys.append((operation.instruction.args["key"], len(qubits)))
+                outcomes.extend(tableau.measure(qubit) for qubit in qubits)
+    if not outcomes:
+        return {}
+    # sample the variables for all the shots at once, and evaluate the affine functions
+    coefficients = np.array(outcomes)[:, : tableau.num_variables + 1]
+    variables = rng.integers(0, 2, size=(shots, tableau.num_variables), dtype=np.uint8)
+    results = (variables.astype(np.float64) @ coefficients[:, 1:].T.astype(np.float64)).astype(np.int64) & 1
+    results = (results ^ coefficients[:, 0]).astype(np.uint8)
+    measurements = {}
+    start = 0
+    for key, size in keys:
+        measurements[key] = np.ascontiguousarray(results[:, start : start + size])
+        start += size
+    return measurements
+
+
+def _prx_matrix(angle_t: float, phase_t: float) -> np.ndarray:
+    """Matrix of a PRX gate."""
+    half_angle = np.pi * angle_t
+    phase = 2 * np.pi * phase_t
+    cos, sin = np.cos(half_angle), np.sin(half_angle)
+    return np.array(
+        [[cos, -1j * np.exp(-1j * phase) * sin], [-1j * np.exp(1j * phase) * sin, cos]],
+        dtype=np.complex128,
+    )
+
+
+def _apply_1q(state: np.ndarray, matrix: np.ndarray, a: int) -> np.ndarray:
+    """Apply a single-qubit gate on the axis ``a`` of the state."""
+    shape = state.shape
+    return np.matmul(matrix, state.reshape(2**a, 2, -1)).reshape(shape)
+
+
+def _select(num_qubits: int, qubits: Sequence[int], bits: Sequence[int]) -> tuple[slice | int, ...]:
+    """Index of the part of the state in which the given qubits have the given values."""
+    index: list[slice | int] = [slice(None)] * num_qubits
+    for qubit, bit in zip(qubits, bits):
+        index[qubit] = bit
+    return tuple(index)
+
+
+def _outcome_probabilities(state: np.ndarray, qubits: tuple[int, ...]) -> np.ndarray:
+    """Probabilities of the outcomes of measuring the given qubits, indexed by the outcomes in big-endian order."""
+    others = tuple(axis for axis in range(state.ndim) if axis not in qubits)
+    marginal = np.sum(np.abs(state) ** 2, axis=others)
+    marginal = np.transpose(marginal, np.argsort(np.argsort(qubits))).ravel()
+    return marginal / marginal.sum()
+
+
+def _split(branch: _Branch, qubits: tuple[int, ...], rng: np.random.Generator) -> list[tuple[_Branch, tuple[int, ...]]]:
+    """Measure the given qubits in a branch, splitting its shots between the outcomes.
+
+    Returns:
+        The branches with the state projected on each outcome that occurred, and the outcomes.
+
+    """
+    probabilities = _outcome_probabilities(branch.state, qubits)
+    counts = rng.multinomial(branch.shots, probabilities)
+    branches = []
+    for outcome in np.flatnonzero(counts):
+        bits = tuple(int(outcome) >> (len(qubits) - 1 - i) & 1 for i in range(len(qubits)))
+        state = np.zeros_like(branch.state)
+        index = _select(branch.state.ndim, qubits, bits)
+        state[index] = branch.state[index] / np.sqrt(probabilities[outcome])
+        branches.append((_Branch(state, int(counts[outcome]), dict(branch.results), dict(branch.feedback)), bits))
+    return branches
+
+
+def _apply_gate(branches: list[_Branch], operation: _Operation) -> None:
+    """Apply a unitary or classically controlled operation to the branches."""
+    qubits = operation.qubits
+    args = operation.instruction.args
+    match operation.name:
+        case "prx":
+            matrix = _prx_matrix(args["angle_t"], args["phase_t"])
+            for branch in branches:
+                branch.state = _apply_1q(branch.state, matrix, qubits[0])
+        case "cc_prx":
+            matrix = _prx_matrix(args["angle_t"], args["phase_t"])
+            control = (args["feedback_key"], args["feedback_qubit"])
+            for branch in branches:
+                if branch.feedback.get(control, 0):
+                    branch.state = _apply_1q(branch.state, matrix, qubits[0])
+        case "cz":
+            for branch in branches:
+                branch.state[_select(branch.state.ndim, qubits, (1, 1))] *= -1
+        case "move":
+            for branch in branches:
+                branch.state = np.ascontiguousarray(np.swapaxes(branch.state, *qubits))
+
+
+def _measure(
+    branches: list[_Branch], operation: _Operation, components: list[str], rng: np.random.Generator
+) -> list[_Branch]:
+    """Apply a measurement or a reset to the branches, and return the branches for the outcomes."""
+    new_branches = []
+    if operation.name == "reset":
+        for qubit in operation.qubits:
+            new_branches = []
+            for branch in branches:
+                for new_branch, bits in _split(branch, (qubit,), rng):
+                    if bits[0]:
+                        new_branch.state = _apply_1q(new_branch.state, _PAULI_X, qubit)
+                    new_branches.append(new_branch)
+            branches = new_branches
+        return branches
+
+    key = operation.instruction.args["key"]
+    feedback_key = operation.instruction.args.get("feedback_key")
+    for branch in branches:
+        for new_branch, bits in _split(branch, operation.qubits, rng):
+            new_branch.results[key] = bits
+            if feedback_key is not None:
+                for qubit, bit in zip(operation.qubits, bits):
+                    new_branch.feedback[(feedback_key, components[qubit])] = bit
+            new_branches.append(new_branch)
+    return new_branches
+
+
+def _simulate_statevector(
+    components: list[str], operations: list[_Operation], shots: int, rng: np.random.Generator
+) -> CircuitMeasurementArrays:
+    """Simulate a circuit using a statevector."""
+    num_qubits = len(components)
+    # the final measurements are sampled from the final state
+    first_final = len(operations)
+    while first_final > 0 and operations[first_final - 1].name == "measure":
+        first_final -= 1
+
+    initial_state = np.zeros((2,) * num_qubits, dtype=np.complex128)
+    initial_state.flat[0] = 1.0
+    branches = [_Branch(initial_state, shots)]
+    for operation in operations[:first_final]:
+        if operation.name in ("measure", "reset"):
+            branches = _measure(branches, operation, components, rng)
+        else:
+            _apply_gate(branches, operation)
+
+    final_measurements = operations[first_final:]
+    results: dict[str, list[np.ndarray]] = {
+        operation.instruction.args["key"]: [] for operation in operations if operation.name == "measure"
+    }
+    for branch in branches:
+        for key, bits in branch.results.items():
+            results[key].append(np.broadcast_to(np.array(bits, dtype=np.uint8), (branch.shots, len(bits))))
+        if final_measurements:
+            probabilities = np.abs(branch.state.ravel()) ** 2
+            samples = rng.choice(probabilities.size, size=branch.shots, p=probabilities / probabilities.sum())
+            for operation in final_measurements:
+                shifts = num_qubits - 1 - np.array(operation.qubits)
+                bits = (samples[:, np.newaxis] >> shifts) & 1
+                results[operation.instruction.args["key"]].append(bits.astype(np.uint8))
+
+    # interleave the shots of different branches
+    order = rng.permutation(shots) if len(branches) > 1 else slice(None)
+    return {key: np.concatenate(arrays)[order] for key, arrays in results.items()}
+
+
+@dataclass
+class _LocalJob:
+    """Job executed by :class:`LocalIQMClient`."""
+
+    status: Status
+    metadata: Metadata
+    measurements: list[CircuitMeasurementArrays] | None = None
+    message: str | None = None
+
+
+class LocalIQMClient:
+    """Local stand-in for :class:`.IQMClient` that simulates the submitted circuits instead of executing them.
+
+    Implements the job submission and result retrieval methods of :class:`.IQMClient`, so that code using the
+    client can be tested offline at native speed. The circuits are simulated without noise using
+    :func:`simulate_circuit` when they are submitted, hence the jobs are always finished when their status is
+    queried. A circuit that cannot be simulated fails its job, like a circuit that cannot be executed on the server.
+
+    Args:
+        architecture: Dynamic quantum architecture to validate the circuits against, as :class:`.IQMClient` does.
+            If ``None``, the circuits are not validated against any architecture.
+        seed: Seed for the random number generator used for sampling the measurement results.
+        max_statevector_qubits: Maximum number of locus components in a circuit that must be simulated using a
+            statevector, see :func:`simulate_circuit`.
+
+    """
+
+    def __init__(
+        self,
+        architecture: DynamicQuantumArchitecture | None = None,
+        *,
+        seed: int | None = None,
+        max_statevector_qubits: int = MAX_STATEVECTOR_QUBITS,
+    ):
+        self._architecture = architecture
+        self._rng = np.random.default_rng(seed)
+        self._max_statevector_qubits = max_statevector_qubits
+        self._jobs: dict[UUID, _LocalJob] = {}
+
+    def get_dynamic_quantum_architecture(self, calibration_set_id: UUID | None = None) -> DynamicQuantumArchitecture:
+        """Dynamic quantum architecture the circuits are validated against.
+
+        Args:
+            calibration_set_id: Ignored, there is only one architecture.
+
+        Returns:
+            The architecture.
+
+        Raises:
+            ValueError: The client has no architecture.
+
+        """
+        if self._architecture is None:
+            raise ValueError("The local client has no quantum architecture.")
+        return self._architecture
+
+    def submit_circuits(  # noqa: PLR0913
+        self,
+        circuits: CircuitBatch,
+        *,
+        qubit_mapping: dict[str, str] | None = None,
+        custom_settings: dict[str, Any] | None = None,
+        calibration_set_id: UUID | None = None,
+        shots: int = 1,
+        options: CircuitCompilationOptions | None = None,
+        validate: bool = True,
+    ) -> UUID:
+        """Simulate a batch of quantum circuits.
+
+        See :meth:`.IQMClient.submit_circuits` for the arguments. ``custom_settings`` and the compilation options
+        other than the MOVE gate validation mode have no effect on the simulation.
+
+        Returns:
+            ID for the created job, needed for retrieving the results.
+
+        Raises:
+            CircuitValidationError: A circuit failed the validation.
+
+        """
+        if shots < 1:
+            raise ValueError("Number of shots must be greater than zero.")
+        if options is None:
+            options = CircuitCompilationOptions()
+
+        for i, circuit in enumerate(circuits if validate else ()):
+            try:
+                validate_circuit(circuit)
+            except ValueError as e:
+                raise CircuitValidationError(f"The circuit at index {i} failed the validation").with_traceback(
+                    e.__traceback__
+                )
+        if self._architecture is not None:
+            validate_qubit_mapping(self._architecture, circuits, qubit_mapping)
+            validate_circuit_instructions(
+                self._architecture,
+                circuits,
+                qubit_mapping,
+                validate_moves=options.move_gate_validation,
+                must_close_sandwiches=False,
+            )
+
+        metadata = Metadata(
+            calibration_set_id=calibration_set_id
+            or (self._architecture.calibration_set_id if self._architecture is not None else None),
+            circuits_batch=circuits,
+            parameters=JobParameters(
+                shots=shots,
+                max_circuit_duration_over_t2=options.max_circuit_duration_over_t2,
+                heralding_mode=options.heralding_mode,
+                move_validation_mode=options.move_gate_validation,
+                move_gate_frame_tracking_mode=options.move_gate_frame_tracking,
+                dd_mode=options.dd_mode,
+                dd_strategy=options.dd_strategy,
+            ),
+        )
+        try:
+            measurements = [
+                simulate_circuit(circuit, shots, rng=self._rng, max_statevector_qubits=self._max_statevector_qubits)
+                for circuit in circuits
+            ]
+            job = _LocalJob(Status.READY, metadata, measurements)
+        except ValueError as e:
+            job = _LocalJob(Status.FAILED, metadata, message=str(e))
+
+        job_id = uuid.uuid4()
+        self._jobs[job_id] = job
+        return job_id
+
+    def _get_job(self, job_id: UUID) -> _LocalJob:
+        """Job with the given ID."""
+        if job_id not in self._jobs:
+            raise ValueError(f"Job {job_id} not found.")
+        return self._jobs[job_id]
+
+    def get_run(
+        self, job_id: UUID, *, timeout_secs: float = REQUESTS_TIMEOUT, measurements_as_arrays: bool = False
+    ) -> RunResult:
+        """Query the status and results of a submitted job.
+
+        Args:
+            job_id: ID of the job to query.
+            timeout_secs: Ignored.
+            measurements_as_arrays: Iff True, the measurement results are only available through
+                :attr:`.RunResult.measurement_arrays`, see :meth:`.IQMClient.get_run`.
+
+        Returns:
+            Result of the job.
+
+        Raises:
+            CircuitExecutionError: The job failed.
+            ValueError: There is no job with the given ID.
+
+        """
+        job = self._get_job(job_id)
+        if job.status == Status.FAILED:
+            raise CircuitExecutionError(job.message)
+        if measurements_as_arrays:
+            measurements: dict[str, Any] = {"measurement_arrays": job.measurements}
+        else:
+            measurements = {
+                "measurements": [
+                    {key: array.tolist() for key, array in circuit_measurements.items()}
+                    for circuit_measurements in job.measurements
+                ]
+            }
+        return RunResult.from_dict({**measurements, "status": job.status, "metadata": job.metadata})
+
+    def get_run_status(self, job_id: UUID, *, timeout_secs: float = REQUESTS_TIMEOUT) -> RunStatus:
+        """Query the status of a submitted job.
+
+        Args:
+            job_id: ID of the job to query.
+            timeout_secs: Ignored.
+
+        Returns:
+            Job status.
+
+        Raises:
+            ValueError: There is no job with the given ID.
+
+        """
+        job = self._get_job(job_id)
+        return RunStatus(status=job.status, message=job.message)
+
+    def wait_for_results(self, job_id: UUID, timeout_secs: float = DEFAULT_TIMEOUT_SECONDS) -> RunResult:
+        """Return the results of a job, which has always finished.
+
+        Args:
+            job_id: ID of the job to wait for.
+            timeout_secs: Ignored.
+
+        Returns:
+            Job result.
+
+        """
+        return self.get_run(job_id)
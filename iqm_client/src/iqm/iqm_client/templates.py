@@ -0,0 +1,172 @@
+# Copyright 2025 IQM client developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Parametric circuit templates, for submitting many circuits that only differ in their gate angles.
+
+A :class:`CircuitTemplate` is a circuit in which the ``angle_t`` and ``phase_t`` arguments of ``prx`` and ``cc_prx``
+instructions may be :class:`TemplateParameter` symbols instead of numbers. The template is validated once when it is
+created, and binding it to a table of parameter values produces the bound circuits without validating each of them
+again. The resulting circuits can be submitted with ``validate=False`` in :meth:`.IQMClient.submit_circuits`.
+
+.. code-block:: python
+
+    theta = TemplateParameter("theta")
+    template = CircuitTemplate(
+        "sweep",
+        [
+            Instruction.model_construct(name="prx", qubits=("QB1",), args={"angle_t": theta, "phase_t": 0.0}),
+            Instruction(name="measure", qubits=("QB1",), args={"key": "m"}),
+        ],
+    )
+    circuits = template.bind({"theta": np.linspace(0, 1, 500)})
+    job_id = client.submit_circuits(circuits, validate=False)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from iqm.iqm_client.models import Circuit, CircuitBatch, Instruction, _op_current_name
+import numpy as np
+from numpy.typing import ArrayLike
+
+PARAMETRIC_ARGS: dict[str, frozenset[str]] = {
+    "prx": frozenset({"angle_t", "phase_t"}),
+    "cc_prx": frozenset({"angle_t", "phase_t"}),
+}
+"""Maps names of native operations to the names of their arguments that can be template parameters."""
+
+
+@dataclass(frozen=True)
+class TemplateParameter:
+    """Symbolic argument of an instruction in a :class:`CircuitTemplate`."""
+
+    name: str
+    """Name of the parameter, used for binding values to it."""
+
+
+class CircuitTemplate:
+    """Quantum circuit with symbolic gate angles, which can be bound to many sets of values.
+
+    Args:
+        name: Name of the template. The bound circuits are named after it.
+        instructions: Instructions comprising the template. Instructions with :class:`TemplateParameter` arguments
+            have to be created using :meth:`Instruction.model_construct`, since they are not valid as such.
+        metadata: Arbitrary metadata associated with the bound circuits.
+
+    Raises:
+        ValueError: The template is not a valid circuit, or a parameter is used for an argument that cannot
+            be parametrized.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        instructions: Sequence[Instruction],
+        metadata: dict[str, Any] | None = None,
+    ):
+        self.name = name
+        self.metadata = metadata
+        parameters: dict[str, int] = {}
+        # instruction index -> pairs of argument name and parameter index
+        slots: dict[int, list[tuple[str, int]]] = {}
+        placeholder_instructions = []
+        for idx, instruction in enumerate(instructions):
+            op_name = _op_current_name(instruction.name)
+            args = dict(instruction.args)
+            for arg_name, value in instruction.args.items():
+                if not isinstance(value, TemplateParameter):
+                    continue
+                if arg_name not in PARAMETRIC_ARGS.get(op_name, ()):
+                    raise ValueError(
+                        f'The argument "{arg_name}" of the operation "{op_name}" cannot be a template parameter.'
+                    )
+                slots.setdefault(idx, []).append((arg_name, parameters.setdefault(value.name, len(parameters))))
+                args[arg_name] = 0.0
+            placeholder_instructions.append(
+                Instruction.model_construct(
+                    name=op_name, implementation=instruction.implementation, qubits=instruction.qubits, args=args
+                )
+            )
+        # validate the template once, with a placeholder value for each parameter
+        self._instructions: list[Instruction] = Circuit(
+            name=name, instructions=placeholder_instructions, metadata=metadata
+        ).instructions
+        self._slots = slots
+        self.parameters: tuple[str, ...] = tuple(parameters)
+        """Names of the parameters of the template, in the order of the columns of a binding table."""
+
+    def bind(self, values: Mapping[str, ArrayLike] | ArrayLike) -> CircuitBatch:
+        """Bind the parameters of the template to values, producing one circuit for each set of values.
+
+        Args:
+            values: Either a mapping from parameter names to values, or a table of shape
+                ``(n_bindings, len(parameters))`` whose columns are in the order of :attr:`parameters`.
+                In the mapping, each value is either a scalar or a 1D array, and all the arrays must have
+                the same length.
+
+        Returns:
+            The bound circuits, named ``f"{name}_{i}"`` for the ``i``-th set of values. The instructions that do
+            not depend on the parameters are shared between the circuits.
+
+        Raises:
+            ValueError: The values are missing a parameter, have the wrong shape, or are not finite.
+
+        """
+        table = self._binding_table(values)
+        if not np.all(np.isfinite(table)):
+            raise ValueError("The values of the template parameters must be finite.")
+        # one Python list of floats per parameter, converted in a single pass
+        columns = table.T.tolist()
+        circuits = []
+        for binding in range(table.shape[0]):
+            instructions = list(self._instructions)
+            for idx, slots in self._slots.items():
+                instruction = instructions[idx]
+                args = dict(instruction.args)
+                for arg_name, parameter_idx in slots:
+                    args[arg_name] = columns[parameter_idx][binding]
+                instructions[idx] = Instruction.model_construct(
+                    name=instruction.name,
+                    implementation=instruction.implementation,
+                    qubits=instruction.qubits,
+                    args=args,
+                )
+            circuits.append(Circuit.from_trusted(f"{self.name}_{binding}", instructions, self.metadata))
+        return circuits
+
+    def _binding_table(self, values: Mapping[str, ArrayLike] | ArrayLike) -> np.ndarray:
+        """Convert the given parameter values to a table of shape ``(n_bindings, len(parameters))``."""
+        n_parameters = len(self.parameters)
+        if isinstance(values, Mapping):
+            if missing := set(self.parameters) - set(values):
+                raise ValueError(f"No values given for the template parameters {sorted(missing)}.")
+            if unknown := set(values) - set(self.parameters):
+                raise ValueError(f"The template has no parameters {sorted(unknown)}.")
+            columns = [np.asarray(values[name], dtype=np.float64) for name in self.parameters]
+            if any(column.ndim > 1 for column in columns):
+                raise ValueError("The values of each template parameter must be a scalar or a 1D array.")
+            try:
+                return np.column_stack(np.broadcast_arrays(*columns)) if columns else np.zeros((1, 0))
+            except ValueError as e:
+                raise ValueError("The value arrays of the template parameters must have the same length.") from e
+        table = np.asarray(values, dtype=np.float64)
+        if table.ndim != 2 or table.shape[1] != n_parameters:
+            raise ValueError(
+                f"The table of parameter values must have the shape (n_bindings, {n_parameters}), "
+                f"but {table.shape} was given."
+            )
+        return table
@@ -57,7 +57,7 @@ version can be obtained using :func:`simplify_architecture`.
 
 from __future__ import annotations
 
-from collections.abc import Collection, Iterable, Sequence
+from collections.abc import Collection, Iterable, Iterator, Sequence
 from enum import Enum
 
 from iqm.iqm_client import (
@@ -167,6 +167,10 @@ class _ResonatorStateTracker:
 
         self.res_state_owner = {r: r for r in self.resonators}
         """Maps resonator to the QPU component whose state it currently holds."""
+        self._qubit_state_holder: dict[str, str] = {}
+        """Inverse of :attr:`res_state_owner` for the qubits whose states are in resonators."""
+        self._resolutions: dict[tuple[str, Locus], list[Resolution]] = {}
+        """Cache for :meth:`find_resolutions`, which only depends on the gate name and locus."""
 
     @classmethod
     def from_dynamic_architecture(cls, arch: DynamicQuantumArchitecture) -> _ResonatorStateTracker:
@@ -238,11 +242,11 @@ class _ResonatorStateTracker:
 
     @property
     def qubit_state_holder(self) -> dict[str, str]:
-        """Qubits not found in the dict hold their own states."""
-        # TODO reverses res_state_owner, maybe this is the one we need to track instead?
-        resonators = self.resonators
-        # qubits whose states are in resonators
-        return {c: r for r, c in self.res_state_owner.items() if c not in resonators}
+        """Maps qubits whose states are in resonators to the resonators holding them.
+
+        Qubits not found in the dict hold their own states. The dict must not be modified.
+        """
+        return self._qubit_state_holder
 
     def apply_move(self, qubit: str, resonator: str) -> None:
         """Record changes to qubit state location when a MOVE gate is applied.
@@ -262,7 +266,12 @@ class _ResonatorStateTracker:
             and qubit in self.move_r2q[resonator]
             and (owner := self.res_state_owner[resonator]) in [qubit, resonator]
         ):
-            self.res_state_owner[resonator] = qubit if owner == resonator else resonator
+            if owner == resonator:
+                self.res_state_owner[resonator] = qubit
+                self._qubit_state_holder[qubit] = resonator
+            else:
+                self.res_state_owner[resonator] = resonator
+                del self._qubit_state_holder[qubit]
         else:
             raise CircuitTranspilationError(f"MOVE locus {qubit, resonator} is not allowed.")
 
@@ -295,9 +304,9 @@ class _ResonatorStateTracker:
             yield Instruction(name=self.move_gate, qubits=locus, args={})
 
         # if the qubit does not hold its own state, restore it, unless it's in the resonator
-        # find where the qubit state is (it can be in at most one resonator)
-        res = [r for r, c in self.res_state_owner.items() if c == qubit]  # TODO not efficient
-        if res and (holder := res[0]) != resonator:
+        # (it can be in at most one resonator)
+        holder = self._qubit_state_holder.get(qubit)
+        if holder is not None and holder != resonator:
             locus = (qubit, holder)
             self.apply_move(*locus)
             yield Instruction(name=self.move_gate, qubits=locus, args={})
@@ -347,9 +356,11 @@ class _ResonatorStateTracker:
             Resonators that hold the state of one of ``qubits``.
 
         """
-        # a resonator can only hold the state of a connected qubit, or its own state
-        # TODO needs to be made more efficient once we have lots of resonators
-        return [r for r, q in self.res_state_owner.items() if q != r and q in qubits]
+        holders = {r for q in qubits if (r := self._qubit_state_holder.get(q)) is not None}
+        if not holders:
+            return []
+        # keep the resonator order of res_state_owner, so that the restoring MOVEs are always in the same order
+        return [r for r in self.res_state_owner if r in holders]
 
     def map_resonators_in_locus(self, locus: Iterable[str]) -> Locus:
         """Map any resonators in the given instruction locus into the QPU components whose state is
@@ -384,6 +395,9 @@ class _ResonatorStateTracker:
         """
         if (gate_q2r := self.qr_gates_q2r.get(inst.name)) is None:
             return []
+        key = (inst.name, tuple(inst.qubits))
+        if (resolutions := self._resolutions.get(key)) is not None:
+            return resolutions
 
         def get_resonators(g: str, m: str) -> set[str]:
             """Resonators r for which we have G(g, r) and MOVE(m, r) available."""
@@ -391,7 +405,9 @@ class _ResonatorStateTracker:
 
         # G is assumed symmetric, hence we may reverse the locus order for more resolutions
         a, b = inst.qubits
-        return [(a, b, r) for r in get_resonators(a, b)] + [(b, a, r) for r in get_resonators(b, a)]
+        resolutions = [(a, b, r) for r in get_resonators(a, b)] + [(b, a, r) for r in get_resonators(b, a)]
+        self._resolutions[key] = resolutions
+        return resolutions
 
     def find_best_resolution(self, inst: Instruction, lookahead: Iterable[Instruction]) -> Resolution | None:
         """Find the best resolution for the fictional qubit-qubit gate instruction ``inst``
@@ -455,7 +471,7 @@ class _ResonatorStateTracker:
             g_follower = followers.get(g)
             m_follower = followers.get(m)
 
-            if g_follower == m_follower and g_follower is not None:
+            if g_follower is m_follower and g_follower is not None:
                 # >=2q gate. 2q gate has the same or reversed locus (no matter since QR gates are assumed symmetric!)
                 if g_follower.name == inst.name:
                     # same gate => same resolution works, free
@@ -568,11 +584,39 @@ class _ResonatorStateTracker:
         """Convert a simplified architecture circuit into a equivalent Star architecture circuit with
         resonators and MOVE gates.
 
+        See :meth:`iter_insert_moves`.
+
+        Args:
+            instructions: The instructions in the circuit, using physical qubit names.
+            arch: Real Star quantum architecture we transpile to.
+
+        Raises:
+            CircuitTranspilationError: Raised when the circuit contains invalid gates that cannot be
+                transpiled using this method.
+
+        Returns:
+            Real Star architecture equivalent of ``circuit`` with MOVEs and resonators added.
+
+        """
+        return [new_inst for replacement in self.iter_insert_moves(instructions, arch) for new_inst in replacement]
+
+    def iter_insert_moves(
+        self,
+        instructions: Sequence[Instruction],
+        arch: DynamicQuantumArchitecture,
+    ) -> Iterator[list[Instruction]]:
+        """Convert a simplified architecture circuit into a equivalent Star architecture circuit with
+        resonators and MOVE gates.
+
         Inserts MOVE gates into the circuit and changes the existing instruction loci as needed,
         while updating the state of the tracker object.
 
         Can also handle circuits that mix the simplified and real architectures.
 
+        The instructions are converted one at a time, and the tracker state is updated as each
+        replacement is yielded, so that callers can map the replacements back to their own circuit
+        representation of the instructions.
+
         Args:
             instructions: The instructions in the circuit, using physical qubit names.
             arch: Real Star quantum architecture we transpile to.
@@ -581,13 +625,25 @@ class _ResonatorStateTracker:
             CircuitTranspilationError: Raised when the circuit contains invalid gates that cannot be
                 transpiled using this method.
 
-        Returns:
-            Real Star architecture equivalent of ``circuit`` with MOVEs and resonators added.
+        Yields:
+            For each instruction in ``instructions``, the instructions that replace it. Exactly one of them
+            is not a MOVE, unless the instruction itself is a MOVE, and it is the instruction itself or
+            a copy of it with a different locus.
 
         """
         # This method can handle real single- and two-qubit gates, real q-r gates including MOVE,
         # and fictional two-qubit gates which it decomposes into real q-r gates.
-        new_instructions: list[Instruction] = []
+
+        # For each instruction, the indices of the next instructions acting on its locus components.
+        # Computed in a single backward pass, so that finding the followers of an instruction
+        # does not require scanning the rest of the circuit.
+        next_uses: list[tuple[int, ...]] = [()] * len(instructions)
+        last_use: dict[str, int] = {}
+        for idx in range(len(instructions) - 1, -1, -1):
+            locus = instructions[idx].qubits
+            next_uses[idx] = tuple(sorted({last_use[q] for q in locus if q in last_use}))
+            for q in locus:
+                last_use[q] = idx
 
         for idx, inst in enumerate(instructions):
             locus = inst.qubits
@@ -598,22 +654,24 @@ class _ResonatorStateTracker:
 
                 if inst.name == self.move_gate:
                     # apply the requested MOVE, closing interfering MOVE sandwiches first
-                    new_instructions += self.create_move_instructions(*locus)
+                    yield list(self.create_move_instructions(*locus))
                     continue
 
                 # are some of the locus qubits' states currently in a resonator?
                 if res_match := self.resonators_holding_qubits(locus):
                     # Some locus qubits do not hold their states, which need to be restored before applying the gate.
                     # NOTE: as a consequence, a barrier closes a MOVE sandwich.
-                    new_instructions += self.restore_as_move_instructions(res_match)
-                new_instructions.append(inst)
+                    yield [*self.restore_as_move_instructions(res_match), inst]
+                else:
+                    yield [inst]
 
             except CircuitValidationError as e:
                 # inst can not be applied to this locus as is
                 if inst.name not in self.qr_gates_q2r or any(c in self.resonators for c in locus):
                     raise CircuitTranspilationError(e) from e
 
-                resolution = self.find_best_resolution(inst, instructions[idx + 1 :])
+                # the followers are the only instructions in the lookahead that affect the resolution
+                resolution = self.find_best_resolution(inst, [instructions[i] for i in next_uses[idx]])
                 if resolution is None:
                     raise CircuitTranspilationError(
                         f"Unable to find native gate sequence to enable fictional gate {inst.name} at {locus}."
@@ -621,9 +679,7 @@ class _ResonatorStateTracker:
                     ) from e
 
                 # implement G using the sequence
-                new_instructions += self.get_sequence(resolution, inst)
-
-        return new_instructions
+                yield self.get_sequence(resolution, inst)
 
 
 def simplify_architecture(
@@ -768,37 +824,20 @@ def transpile_insert_moves(
         # nothing to do (do not validate the circuit)
         return circuit
 
-    tracker = _ResonatorStateTracker.from_dynamic_architecture(arch)
-
     # add missing QPU components to the mapping (mapped to themselves)
     if qubit_mapping is None:
         qubit_mapping = {}
     for c in set(arch.components) - set(qubit_mapping.values()):
         qubit_mapping[c] = c
 
-    if existing_moves == ExistingMoveHandlingOptions.KEEP:
-        # convert to physical qubit names
-        phys_instructions = _map_loci(circuit.instructions, qubit_mapping)
-        try:
-            validate_circuit_moves(
-                arch,
-                Circuit(name=circuit.name, instructions=phys_instructions, metadata=circuit.metadata),
-            )
-
-        except CircuitValidationError as e:
-            raise CircuitTranspilationError(e) from e
-    else:
-        if circuit_has_moves and existing_moves == ExistingMoveHandlingOptions.REMOVE:
-            # convert the circuit into a pure simplified architecture circuit
-            circuit = transpile_remove_moves(circuit)
-
-        # convert to physical qubit names
-        phys_instructions = _map_loci(circuit.instructions, qubit_mapping)
-
-    new_instructions = tracker.insert_moves(phys_instructions, arch)
-
-    if restore_states:
-        new_instructions += tracker.restore_as_move_instructions()
+    # convert to physical qubit names
+    phys_instructions = _map_loci(circuit.instructions, qubit_mapping)
+    new_instructions = [
+        inst
+        for _, inst in insert_moves_into_instructions(
+            phys_instructions, arch, existing_moves=existing_moves, restore_states=restore_states
+        )
+    ]
 
     # convert back to logical qubit names
     return Circuit(
@@ -808,6 +847,66 @@ def transpile_insert_moves(
     )
 
 
+def insert_moves_into_instructions(
+    instructions: Sequence[Instruction],
+    arch: DynamicQuantumArchitecture,
+    *,
+    existing_moves: ExistingMoveHandlingOptions = ExistingMoveHandlingOptions.KEEP,
+    restore_states: bool = True,
+) -> list[tuple[int | None, Instruction]]:
+    """Instruction-level version of :func:`transpile_insert_moves`, which keeps track of where each
+    resulting instruction came from.
+
+    Meant for converting circuits in other representations, e.g. Qiskit DAGs, without converting the whole
+    circuit to an IQM :class:`Circuit` and back. Only the names and loci of ``instructions`` are used, so
+    their arguments need not be set.
+
+    Args:
+        instructions: Instructions of the circuit to convert, using physical qubit names.
+        arch: Real Star architecture of the target device.
+        existing_moves: Specifies how to deal with existing MOVE instructions, if any.
+        restore_states: Iff True, all qubit states held in resonators are returned to their qubits
+            at the end of the circuit.
+
+    Returns:
+        Instructions of the equivalent Star architecture circuit. Each instruction is paired with the index
+        of the instruction in ``instructions`` that it implements, possibly on a different locus,
+        or ``None`` if it is a MOVE.
+
+    Raises:
+        ValueError: ``instructions`` contain MOVEs, but the architecture does not support them.
+        CircuitTranspilationError: The instructions cannot be converted.
+
+    """
+    move_gate = _ResonatorStateTracker.move_gate
+    circuit_has_moves = any(i.name == move_gate for i in instructions)
+    if move_gate not in arch.gates:
+        if circuit_has_moves:
+            raise ValueError("Circuit contains MOVE instructions, but the architecture does not support them.")
+        return list(enumerate(instructions))
+
+    indices: Sequence[int] = range(len(instructions))
+    if existing_moves == ExistingMoveHandlingOptions.KEEP:
+        if instructions:
+            try:
+                validate_circuit_moves(arch, Circuit.from_trusted("moves", instructions))
+            except CircuitValidationError as e:
+                raise CircuitTranspilationError(e) from e
+    elif circuit_has_moves and existing_moves == ExistingMoveHandlingOptions.REMOVE:
+        # convert the circuit into a pure simplified architecture circuit
+        remaining = _remove_moves(instructions)
+        indices = [idx for idx, _ in remaining]
+        instructions = [inst for _, inst in remaining]
+
+    tracker = _ResonatorStateTracker.from_dynamic_architecture(arch)
+    new_instructions: list[tuple[int | None, Instruction]] = []
+    for idx, replacement in zip(indices, tracker.iter_insert_moves(instructions, arch)):
+        new_instructions += ((None if inst.name == move_gate else idx, inst) for inst in replacement)
+    if restore_states:
+        new_instructions += ((None, inst) for inst in tracker.restore_as_move_instructions())
+    return new_instructions
+
+
 def transpile_remove_moves(circuit: Circuit) -> Circuit:
     """Convert a Star architecture circuit involving resonators and MOVE gates into an equivalent
     simplified achitecture circuit without them.
@@ -823,16 +922,29 @@ def transpile_remove_moves(circuit: Circuit) -> Circuit:
         Equivalent simplified architecture circuit without resonators and MOVEs.
 
     """
-    tracker = _ResonatorStateTracker.from_circuit(circuit)
+    new_instructions = tuple(inst for _, inst in _remove_moves(circuit.instructions))
+    return Circuit(name=circuit.name, instructions=new_instructions, metadata=circuit.metadata)
+
+
+def _remove_moves(instructions: Sequence[Instruction]) -> list[tuple[int, Instruction]]:
+    """Remove the MOVE gates from a sequence of Star architecture instructions, see :func:`transpile_remove_moves`.
+
+    Args:
+        instructions: Star architecture instructions from which resonators and MOVE gates should be removed.
+
+    Returns:
+        The remaining instructions with their loci mapped to the qubits, each paired with its index in
+        ``instructions``.
+
+    """
+    tracker = _ResonatorStateTracker.from_instructions(instructions)
     new_instructions = []
-    for inst in circuit.instructions:
+    for idx, inst in enumerate(instructions):
         if inst.name == tracker.move_gate:
             # update the state tracking, drop the MOVE
             tracker.apply_move(*inst.qubits)
         else:
             # map the instruction locus
             new_qubits = tracker.map_resonators_in_locus(inst.qubits)
-            new_instructions.append(
-                Instruction(name=inst.name, implementation=inst.implementation, qubits=new_qubits, args=inst.args)
-            )
-    return Circuit(name=circuit.name, instructions=tuple(new_instructions), metadata=circuit.metadata)
+            new_instructions.append((idx, inst.model_copy(update={"qubits": new_qubits})))
+    return new_instructions
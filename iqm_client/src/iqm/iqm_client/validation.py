@@ -7,8 +7,7 @@
 #  ********************************************************************************
 """Validation related helper functions for IQMClient."""
 
-from collections.abc import Iterable
-import itertools
+from collections.abc import Iterable, Set
 
 from iqm.iqm_client.errors import CircuitValidationError
 from iqm.iqm_client.models import (
@@ -85,10 +84,15 @@ def validate_circuit_instructions(
         CircuitValidationError: validation failed
 
     """
+    # the same operation on the same locus typically occurs many times in a batch, so it is validated only once
+    validated: set[tuple[str, str | None, tuple[str, ...]]] = set()
     for index, circuit in enumerate(circuits):
         measurement_keys: set[str] = set()
         for instr in circuit.instructions:
-            validate_instruction(architecture, instr, qubit_mapping)
+            instruction_key = (instr.name, instr.implementation, tuple(instr.qubits))
+            if instruction_key not in validated:
+                validate_instruction(architecture, instr, qubit_mapping)
+                validated.add(instruction_key)
             # check measurement key uniqueness
             if instr.name in {"measure", "measurement"}:
                 key = instr.args["key"]
@@ -140,46 +144,39 @@ def validate_instruction(
                     else f"{instruction!r}: Component {q} {msg}."
                 )
 
+    index = architecture.index
     if op_info.no_calibration_needed:
         # all QPU loci are allowed
-        check_locus_components(architecture.components, msg="does not exist on the QPU")
+        check_locus_components(index.components, msg="does not exist on the QPU")
         return
 
-    gate_info = architecture.gates.get(instruction.name)
-    if gate_info is None:
+    if not index.has_gate(instruction.name):
         raise CircuitValidationError(
             f"Operation '{instruction.name}' is not supported by the dynamic quantum architecture."
         )
 
     if instruction.implementation is not None:
         # specific implementation requested
-        impl_info = gate_info.implementations.get(instruction.implementation)
-        if impl_info is None:
+        if not index.has_gate(instruction.name, instruction.implementation):
             raise CircuitValidationError(
                 f"Operation '{instruction.name}' implementation '{instruction.implementation}' "
                 f"is not supported by the dynamic quantum architecture."
             )
-        allowed_loci = impl_info.loci
         instruction_name = f"{instruction.name}.{instruction.implementation}"
     else:
         # any implementation is fine
-        allowed_loci = gate_info.loci
         instruction_name = f"{instruction.name}"
 
     if op_info.factorizable:
         # Check that all the locus components are allowed by the architecture
         check_locus_components(
-            {q for locus in allowed_loci for q in locus}, msg=f"is not allowed as locus for '{instruction_name}'"
+            index.locus_components(instruction.name, instruction.implementation),
+            msg=f"is not allowed as locus for '{instruction_name}'",
         )
         return
 
     # Check that locus matches one of the allowed loci
-    all_loci = (
-        tuple(tuple(x) for locus in allowed_loci for x in itertools.permutations(locus))
-        if op_info.symmetric
-        else allowed_loci
-    )
-    if mapped_qubits not in all_loci:
+    if not index.is_allowed_locus(instruction.name, mapped_qubits, instruction.implementation):
         raise CircuitValidationError(
             f"{instruction.qubits} = {tuple(mapped_qubits)} is not allowed as locus for '{instruction_name}'"
             if qubit_mapping
@@ -223,8 +220,8 @@ def validate_circuit_moves(
     if validate_moves == MoveGateValidationMode.ALLOW_PRX:
         allowed_gates.add("prx")
 
-    all_resonators = set(architecture.computational_resonators)
-    all_qubits = set(architecture.qubits)
+    all_resonators: Set[str] = architecture.index.computational_resonators
+    all_qubits: Set[str] = architecture.index.qubits
     if qubit_mapping:
         reverse_mapping = {phys: log for log, phys in qubit_mapping.items()}
         all_resonators = {reverse_mapping[q] if q in reverse_mapping else q for q in all_resonators}
@@ -18,9 +18,15 @@ from iqm.qiskit_iqm.fake_backends.iqm_fake_backend import IQMFakeBackend
 from iqm.qiskit_iqm.iqm_circuit import IQMCircuit
 from iqm.qiskit_iqm.iqm_job import IQMJob
 from iqm.qiskit_iqm.iqm_move_layout import generate_initial_layout
-from iqm.qiskit_iqm.iqm_naive_move_pass import IQMNaiveResonatorMoving, transpile_to_IQM
+from iqm.qiskit_iqm.iqm_naive_move_pass import (
+    BatchTranspilationResult,
+    IQMNaiveResonatorMoving,
+    transpile_batch_to_IQM,
+    transpile_to_IQM,
+)
 from iqm.qiskit_iqm.iqm_provider import IQMBackend, IQMProvider, __version__
 from iqm.qiskit_iqm.iqm_transpilation import IQMOptimizeSingleQubitGates, optimize_single_qubit_gates
 from iqm.qiskit_iqm.move_gate import MoveGate
+from iqm.qiskit_iqm.transpilation_cache import TranspilationCache
 from iqm.qiskit_iqm.transpiler_plugins import *  # noqa: F403
 from qiskit import __version__ as qiskit_version
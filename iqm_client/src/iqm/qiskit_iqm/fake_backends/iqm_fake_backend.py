@@ -17,7 +17,9 @@ from __future__ import annotations
 
 from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import permutations
+from typing import Final
 from uuid import UUID
 
 from iqm.iqm_client import (
@@ -34,9 +36,57 @@ from iqm.qiskit_iqm.move_gate import MOVE_GATE_UNITARY
 from qiskit import QuantumCircuit
 from qiskit.providers import JobV1, Options
 from qiskit_aer import AerSimulator
-from qiskit_aer.noise import NoiseModel, QuantumError
+from qiskit_aer.noise import NoiseModel, QuantumError, ReadoutError
 from qiskit_aer.noise.errors import depolarizing_error, thermal_relaxation_error
 
+GATE_TO_UNITARY: Final[dict[str, list[list[float]]]] = {
+    "move": MOVE_GATE_UNITARY,
+}
+"""Unitaries of the IQM gates that are not native to the simulator, used for simulating them."""
+
+_CHANNEL_CACHE_SIZE: Final[int] = 8192
+"""Maximum number of error channels of each kind memoized by the fake backends."""
+
+
+@lru_cache(maxsize=_CHANNEL_CACHE_SIZE)
+def _thermal_relaxation_error(t1: float, t2: float, duration: float) -> QuantumError:
+    """One-qubit relaxation error channel, memoized."""
+    return thermal_relaxation_error(t1, t2, duration)
+
+
+@lru_cache(maxsize=_CHANNEL_CACHE_SIZE)
+def _depolarizing_error(error: float, num_qubits: int) -> QuantumError:
+    """Depolarizing error channel, memoized."""
+    return depolarizing_error(error, num_qubits)
+
+
+@lru_cache(maxsize=_CHANNEL_CACHE_SIZE)
+def _gate_error(t1s: tuple[float, ...], t2s: tuple[float, ...], duration: float, error: float) -> QuantumError:
+    """Error channel of a gate, memoized.
+
+    Thermal relaxation of each qubit the gate acts on, followed by a depolarizing channel on all of them.
+
+    Args:
+        t1s: :math:`T_1` times of the qubits in the locus of the gate, in locus order.
+        t2s: :math:`T_2` times of the qubits in the locus of the gate, in locus order.
+        duration: Duration of the gate.
+        error: Depolarizing error parameter of the gate.
+
+    Returns:
+        The error channel.
+
+    """
+    thermal_relaxation_channel = _thermal_relaxation_error(t1s[0], t2s[0], duration)
+    for t1, t2 in zip(t1s[1:], t2s[1:]):
+        thermal_relaxation_channel = thermal_relaxation_channel.tensor(_thermal_relaxation_error(t1, t2, duration))
+    return thermal_relaxation_channel.compose(_depolarizing_error(error, len(t1s)))
+
+
+@lru_cache(maxsize=_CHANNEL_CACHE_SIZE)
+def _readout_error(error_0: float, error_1: float) -> ReadoutError:
+    """One-qubit readout error, memoized."""
+    return ReadoutError([[1 - error_0, error_0], [error_1, 1 - error_1]])
+
 
 def _dqa_from_sqa(
     sqa: StaticQuantumArchitecture,
@@ -141,7 +191,36 @@ class IQMErrorProfile:
 
     def thermal_relaxation(self, component: str, duration: float) -> QuantumError:
         """One-qubit relaxation error channel."""
-        return thermal_relaxation_error(self.t1s[component], self.t2s[component], duration)
+        return _thermal_relaxation_error(self.t1s[component], self.t2s[component], duration)
+
+
+class _CachingNoiseModel(NoiseModel):
+    """Noise model that caches its serialized form, which the simulator requests on every run.
+
+    The errors in a noise model are never modified, adding an error for an instruction that already
+    has one replaces it with a new error object. Hence the serialized form stays valid as long as the noise model
+    contains the same error objects.
+    """
+
+    _serialized: tuple[tuple, dict] | None = None
+
+    def _errors(self) -> tuple:
+        """All the errors in the noise model, with the instructions and qubits they apply to."""
+        return (
+            tuple(self._default_quantum_errors.items()),
+            tuple((name, tuple(qubit_errors.items())) for name, qubit_errors in self._local_quantum_errors.items()),
+            self._default_readout_error,
+            tuple(self._local_readout_errors.items()),
+        )
+
+    def to_dict(self, serializable: bool = False) -> dict:
+        if not serializable:
+            return super().to_dict()
+        # comparing the error objects is fast, since tuple comparison checks for identity first
+        errors = self._errors()
+        if self._serialized is None or self._serialized[0] != errors:
+            self._serialized = (errors, super().to_dict(serializable=True))
+        return self._serialized[1]
 
 
 class IQMFakeBackend(IQMBackendBase):
@@ -173,8 +252,28 @@ class IQMFakeBackend(IQMBackendBase):
         self.__dqa = dqa
         self.__error_profile = error_profile
 
-        self.noise_model = self._create_noise_model()
+        # built on first use, since constructing the error channels is expensive
+        self._noise_model: NoiseModel | None = None
         self.name = name
+        # simulator for the current noise model, created on first use and reused between runs
+        self._simulator: AerSimulator | None = None
+        self._simulator_noise_model: NoiseModel | None = None
+        self._replacement_passes: dict[str, IQMReplaceGateWithUnitaryPass] = {}
+
+    @property
+    def noise_model(self) -> NoiseModel:
+        """Noise model of the fake backend, built from :attr:`error_profile` on first use.
+
+        The error channels are memoized by their parameters and shared between fake backends, so e.g. the noise model
+        of a backend created by :meth:`copy_with_error_profile` only needs new channels for the changed parameters.
+        """
+        if self._noise_model is None:
+            self._noise_model = self._create_noise_model()
+        return self._noise_model
+
+    @noise_model.setter
+    def noise_model(self, value: NoiseModel) -> None:
+        self._noise_model = value
 
     @property
     def error_profile(self) -> IQMErrorProfile:
@@ -265,18 +364,20 @@ class IQMFakeBackend(IQMBackendBase):
             if iqm_gate not in ["measure", "barrier"]:
                 iqm_to_qiskit_gates.setdefault(iqm_gate, iqm_gate)
 
-        noise_model = NoiseModel(basis_gates=list(iqm_to_qiskit_gates.values()))
+        noise_model = _CachingNoiseModel(basis_gates=list(iqm_to_qiskit_gates.values()))
+
+        qubit_indices = {component: self.qubit_name_to_index(component) for component in error_profile.t1s}
 
         # Add single-qubit gate errors to noise model
         for gate, gate_errors_1q in error_profile.single_qubit_gate_depolarizing_error_parameters.items():
             gate_duration = error_profile.single_qubit_gate_durations[gate]
             for component, gate_error in gate_errors_1q.items():
-                thermal_relaxation_channel = error_profile.thermal_relaxation(component, gate_duration)
-                depolarizing_channel = depolarizing_error(gate_error, 1)
                 noise_model.add_quantum_error(
-                    thermal_relaxation_channel.compose(depolarizing_channel),
+                    _gate_error(
+                        (error_profile.t1s[component],), (error_profile.t2s[component],), gate_duration, gate_error
+                    ),
                     iqm_to_qiskit_gates[gate],
-                    [self.qubit_name_to_index(component)],
+                    [qubit_indices[component]],
                 )
 
         # Add two-qubit gate errors to noise model
@@ -285,27 +386,42 @@ class IQMFakeBackend(IQMBackendBase):
             for locus, gate_error in gate_errors_2q.items():
                 for qb_order in permutations(locus):
                     # TODO why do we need to add the other locus order?
-                    thermal_channels = [
-                        error_profile.thermal_relaxation(component, gate_duration) for component in qb_order
-                    ]
-                    thermal_relaxation_channel = thermal_channels[0].tensor(thermal_channels[1])
-                    depolarizing_channel = depolarizing_error(gate_error, 2)
                     noise_model.add_quantum_error(
-                        thermal_relaxation_channel.compose(depolarizing_channel),
+                        _gate_error(
+                            tuple(error_profile.t1s[component] for component in qb_order),
+                            tuple(error_profile.t2s[component] for component in qb_order),
+                            gate_duration,
+                            gate_error,
+                        ),
                         iqm_to_qiskit_gates[gate],
-                        [self.qubit_name_to_index(qb_order[0]), self.qubit_name_to_index(qb_order[1])],
+                        [qubit_indices[component] for component in qb_order],
                     )
 
         # Add readout errors
         for qb, readout_error in error_profile.readout_errors.items():
-            probabilities = [[1 - readout_error["0"], readout_error["0"]], [readout_error["1"], 1 - readout_error["1"]]]
-            noise_model.add_readout_error(probabilities, [self.qubit_name_to_index(qb)])
+            noise_model.add_readout_error(_readout_error(readout_error["0"], readout_error["1"]), [qubit_indices[qb]])
 
         return noise_model
 
     @classmethod
     def _default_options(cls) -> Options:
-        return Options(shots=1024)
+        return Options(shots=1024, max_parallel_experiments=0)
+
+    @property
+    def simulator(self) -> AerSimulator:
+        """Noisy simulator for running circuits on the fake backend.
+
+        Created on first use, and reused by all the runs as long as :attr:`noise_model` is not replaced.
+        """
+        if self._simulator is None or self._simulator_noise_model is not self.noise_model:
+            self._simulator = AerSimulator(noise_model=self.noise_model)
+            self._simulator_noise_model = self.noise_model
+            self._replacement_passes = {
+                gate: IQMReplaceGateWithUnitaryPass(gate, GATE_TO_UNITARY[gate])
+                for gate in self.noise_model.basis_gates
+                if gate not in IQM_TO_QISKIT_GATE_NAME.values() and gate in GATE_TO_UNITARY
+            }
+        return self._simulator
 
     @property
     def max_circuits(self) -> int | None:
@@ -317,6 +433,11 @@ class IQMFakeBackend(IQMBackendBase):
         This method will run the simulation with the noise model of the fake backend.
         Validity of the circuits is also checked.
 
+        The circuits are simulated as a single batch by :attr:`simulator`. By default the simulator
+        runs the circuits of the batch in parallel, as allowed by the available threads and memory.
+        The number of circuits simulated in parallel can be limited using the ``max_parallel_experiments``
+        option, see :class:`~qiskit_aer.AerSimulator`.
+
         Args:
             run_input: One or more quantum circuits to simulate on the backend.
             options: Any kwarg options to pass to the backend.
@@ -333,26 +454,22 @@ class IQMFakeBackend(IQMBackendBase):
         if len(circuits_aux) == 0:
             raise ValueError("Empty list of circuits submitted for execution.")
 
+        simulator = self.simulator
         circuits = []
-        GATE_TO_UNITARY = {
-            "move": MOVE_GATE_UNITARY,
-        }
-
         for circ in circuits_aux:
             validate_circuit(circ, self)
             circ_updated = circ
-
-            for g in self.noise_model.basis_gates:
-                if g not in IQM_TO_QISKIT_GATE_NAME.values():
-                    circ_updated = IQMReplaceGateWithUnitaryPass(g, GATE_TO_UNITARY[g])(circ)
+            # replace the gates the simulator does not know, if the circuit has any
+            circuit_ops = circ.count_ops()
+            for gate, replacement_pass in self._replacement_passes.items():
+                if gate in circuit_ops:
+                    circ_updated = replacement_pass(circ_updated)
             circuits.append(circ_updated)
 
         shots = options.get("shots", self.options.shots)
+        max_parallel_experiments = options.get("max_parallel_experiments", self.options.max_parallel_experiments)
 
-        # Create noisy simulator backend and run circuits
-        sim_noise = AerSimulator(noise_model=self.noise_model)
-
-        job = sim_noise.run(circuits, shots=shots)
+        job = simulator.run(circuits, shots=shots, max_parallel_experiments=max_parallel_experiments)
         return job
 
     def validate_compatible_architecture(self, architecture: StaticQuantumArchitecture) -> bool:
@@ -16,22 +16,26 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Callable
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 import uuid
 import warnings
 
 from iqm.iqm_client import (
     DEFAULT_TIMEOUT_SECONDS,
     APITimeoutError,
+    CircuitMeasurementArrays,
     CircuitMeasurementResults,
     HeraldingMode,
     IQMClient,
     JobAbortionError,
+    RunCounts,
     RunRequest,
     RunResult,
     Status,
 )
+from iqm.iqm_client.models import Counts as IQMCounts
 from iqm.qiskit_iqm.qiskit_to_iqm import MeasurementKey
 import numpy as np
 from qiskit.providers import JobStatus, JobV1
@@ -40,6 +44,8 @@ from qiskit.result import Counts, Result
 if TYPE_CHECKING:
     from iqm.qiskit_iqm.iqm_provider import IQMBackend
 
+T = TypeVar("T")
+
 
 class IQMJob(JobV1):
     """Implementation of Qiskit's job interface to handle circuit execution on an IQM server.
@@ -54,10 +60,12 @@ class IQMJob(JobV1):
     def __init__(self, backend: IQMBackend, job_id: str, **kwargs):
         super().__init__(backend, job_id=job_id, **kwargs)
         self._result: None | list[tuple[str, list[str]]] = None
+        self._counts: None | list[tuple[str, dict[str, int]]] = None
         self._calibration_set_id: uuid.UUID | None = None
         self._request: RunRequest | None = None
         self._client: IQMClient = backend.client
         self.circuit_metadata: list | None = None  # Metadata that was originally associated with circuits by user
+        self.circuit_names: list[str] | None = None  # Names of the circuits, needed for retrieving only the counts
 
     def _format_iqm_results(self, iqm_result: RunResult) -> list[tuple[str, list[str]]]:
         """Convert the measurement results for a batch of circuits into the Qiskit format.
@@ -70,7 +78,7 @@ class IQMJob(JobV1):
             registers after the shot.
 
         """
-        if iqm_result.measurements is None:
+        if iqm_result.measurement_arrays is None:
             raise ValueError(
                 f'Cannot format IQM result without measurements. Job status is "{iqm_result.status.value.upper()}"'
             )
@@ -80,17 +88,19 @@ class IQMJob(JobV1):
 
         return [
             (circuit.name, self._format_measurement_results(measurements, requested_shots, expect_exact_shots))
-            for measurements, circuit in zip(iqm_result.measurements, iqm_result.metadata.circuits)
+            for measurements, circuit in zip(iqm_result.measurement_arrays, iqm_result.metadata.circuits)
         ]
 
     @staticmethod
     def _format_measurement_results(
-        measurement_results: CircuitMeasurementResults, requested_shots: int, expect_exact_shots: bool = True
+        measurement_results: CircuitMeasurementResults | CircuitMeasurementArrays,
+        requested_shots: int,
+        expect_exact_shots: bool = True,
     ) -> list[str]:
         """Convert the measurement results from a circuit into the Qiskit format.
 
         Args:
-            measurement_results: measurement results for a single circuit
+            measurement_results: measurement results for a single circuit, as nested lists or arrays
             requested_shots: number of shots requested
             expect_exact_shots: iff True, we must get exactly as many shots as requested
         Returns:
@@ -100,10 +110,11 @@ class IQMJob(JobV1):
         """
         # Mapping from creg index (in the circuit) to an array with shape (shots, len(creg)) with the results.
         formatted_results: dict[int, np.ndarray] = {}
+        shots = 0
         for k, v in measurement_results.items():
             # measurement keys encode data about the classical registers in the original Qiskit circuit
             mk = MeasurementKey.from_string(k)
-            res = np.array(v, dtype=int)
+            res = np.asarray(v, dtype=int)
             shots = len(res)
             if shots == 0 and not expect_exact_shots:
                 warnings.warn(
@@ -128,14 +139,69 @@ class IQMJob(JobV1):
         # TODO If the original circuit has a creg that is not used at all we won't know about it here,
         # and thus cannot include it (containing only zeros) in the result strings.
 
+        if not formatted_results or shots == 0:
+            return []
+        cregs = [res for _, res in sorted(formatted_results.items())]
+        if any(res.max(initial=0) > 9 for res in cregs):
+            # results that are not single digits cannot be assembled as characters
+            return [" ".join("".join(map(str, res[s, :])) for res in cregs)[::-1] for s in range(shots)]
+
         # Number of shots is the same for all measurement keys.
         # Qiskit uses the little-endian convention in presenting the result bitstrings
-        # (both between and within registers), hence the [::-1]
+        # (both between and within registers), hence the reversed order of registers and bits.
+        # The bitstrings of all the shots are assembled as a single array of characters.
+        columns: list[np.ndarray] = []
+        for res in reversed(cregs):
+            if columns:
+                columns.append(np.full((shots, 1), ord(" "), dtype=np.uint8))
+            columns.append(res[:, ::-1].astype(np.uint8) + np.uint8(ord("0")))
+        characters = np.hstack(columns)
+        width = characters.shape[1]
+        text = characters.tobytes().decode("ascii")
+        return [text[start : start + width] for start in range(0, len(text), width)]
+
+    def _format_iqm_counts(self, iqm_counts: RunCounts) -> list[tuple[str, dict[str, int]]]:
+        """Convert the measurement histograms for a batch of circuits into the Qiskit format.
+
+        Args:
+            iqm_counts: measurement histograms for the circuit batch
+        Returns:
+            A list of (circuit_name, counts) tuples, one tuple for each circuit in the batch.
+
+        """
+        if iqm_counts.counts_batch is None:
+            raise ValueError(
+                f'Cannot format IQM result without measurements. Job status is "{iqm_counts.status.value.upper()}"'
+            )
+        if self.circuit_names is None or len(self.circuit_names) != len(iqm_counts.counts_batch):
+            raise ValueError("Circuit names are required for formatting the counts of a job.")
         return [
-            " ".join("".join(map(str, res[s, :])) for _, res in sorted(formatted_results.items()))[::-1]
-            for s in range(shots)
+            (name, self._format_counts(counts)) for name, counts in zip(self.circuit_names, iqm_counts.counts_batch)
         ]
 
+    @staticmethod
+    def _format_counts(counts: IQMCounts) -> dict[str, int]:
+        """Convert the measurement histogram of a circuit into the Qiskit format.
+
+        Args:
+            counts: measurement histogram for a single circuit
+        Returns:
+            Mapping from bitstrings representing the state of the classical registers after a shot, in
+            little-endian order, to the number of shots with that outcome.
+
+        """
+        # each measurement key measures a single qubit, and the bits of the histogram states are in key order
+        keys = [MeasurementKey.from_string(k) for k in counts.measurement_keys]
+        creg_lengths = dict(sorted({mk.creg_idx: mk.creg_len for mk in keys}.items()))
+        formatted_counts: Counter[str] = Counter()
+        for state, count in counts.counts.items():
+            cregs = {creg_idx: ["0"] * creg_len for creg_idx, creg_len in creg_lengths.items()}
+            for mk, bit in zip(keys, state):
+                cregs[mk.creg_idx][mk.clbit_idx] = bit
+            # Qiskit uses the little-endian convention, see _format_measurement_results
+            formatted_counts[" ".join("".join(bits) for bits in cregs.values())[::-1]] += count
+        return dict(formatted_counts)
+
     def submit(self):
         raise NotImplementedError(
             "You should never have to submit jobs by calling this method. When running circuits through "
@@ -157,12 +223,22 @@ class IQMJob(JobV1):
             warnings.warn(f"Failed to cancel job: {e}")
             return False
 
-    def result(self, *, timeout: float = DEFAULT_TIMEOUT_SECONDS, cancel_after_timeout: bool = False) -> Result:
+    def result(
+        self,
+        *,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        cancel_after_timeout: bool = False,
+        memory: bool | None = None,
+    ) -> Result:
         """Retrieve results within defined timeout.
 
         Args:
             timeout: Time limit for client to get result, in seconds.
             cancel_after_timeout: Whether client will try to cancel the job if timeout exceeded.
+            memory: Iff False, only the counts of the measurement results are retrieved from the server, instead
+                of the individual results of every shot, and the result contains no memory. Much faster for large
+                numbers of shots. If ``None``, the ``memory`` option given to :meth:`.IQMBackend.run` is used.
+                Jobs created using :meth:`.IQMBackend.retrieve_job` always retrieve the memory.
 
         Returns:
             Result if retrieved successfully.
@@ -172,19 +248,18 @@ class IQMJob(JobV1):
             JobAbortionError: Job failed to abort after timeout exceeded and cancellation requested.
 
         """
+        if memory is None:
+            memory = self.metadata.get("memory", True)
+        if not memory and not self._result and self.circuit_names is not None:
+            if not self._counts:
+                iqm_counts = self._wait(self._client.wait_for_counts, timeout, cancel_after_timeout)
+                self._counts = self._format_iqm_counts(iqm_counts)
+            return self._create_result(
+                [(name, {"counts": Counts(counts)}, sum(counts.values())) for name, counts in self._counts]
+            )
+
         if not self._result:
-            # Client will raise an error if it was unable to get the results within the timeout
-            try:
-                results = self._client.wait_for_results(uuid.UUID(self._job_id), timeout)
-            except APITimeoutError as err:
-                # Cancel the job if client was unable to get the results within the timeout
-                if cancel_after_timeout:
-                    try:
-                        self._client.abort_job(uuid.UUID(self._job_id))
-                    except JobAbortionError as e:
-                        raise JobAbortionError("Failed to cancel job.") from e
-                    raise APITimeoutError("Job cancelled successfully.") from err
-                raise
+            results = self._wait(self._client.wait_for_results, timeout, cancel_after_timeout)
             self._calibration_set_id = results.metadata.calibration_set_id
             self._request = results.metadata.request
             if results.metadata.timestamps is not None:
@@ -196,6 +271,44 @@ class IQMJob(JobV1):
             if self.circuit_metadata is None and results.metadata.request is not None:
                 self.circuit_metadata = [c.metadata for c in results.metadata.circuits]
 
+        return self._create_result(
+            [
+                (
+                    name,
+                    {"memory": measurement_results, "counts": Counts(Counter(measurement_results))}
+                    if memory
+                    else {"counts": Counts(Counter(measurement_results))},
+                    len(measurement_results),
+                )
+                for name, measurement_results in self._result
+            ]
+        )
+
+    def _wait(self, wait_for: Callable[[uuid.UUID, float], T], timeout: float, cancel_after_timeout: bool) -> T:
+        """Wait for the job to finish using the given client method, optionally cancelling it after the timeout."""
+        # Client will raise an error if it was unable to get the results within the timeout
+        try:
+            return wait_for(uuid.UUID(self._job_id), timeout)
+        except APITimeoutError as err:
+            # Cancel the job if client was unable to get the results within the timeout
+            if cancel_after_timeout:
+                try:
+                    self._client.abort_job(uuid.UUID(self._job_id))
+                except JobAbortionError as e:
+                    raise JobAbortionError("Failed to cancel job.") from e
+                raise APITimeoutError("Job cancelled successfully.") from err
+            raise
+
+    def _create_result(self, circuit_results: list[tuple[str, dict[str, Any], int]]) -> Result:
+        """Create the Qiskit result of the job.
+
+        Args:
+            circuit_results: For each circuit in the batch, its name, its result data and its number of shots.
+
+        Returns:
+            Result of the job.
+
+        """
         result_dict = {
             "backend_name": None,
             "backend_version": None,
@@ -204,17 +317,16 @@ class IQMJob(JobV1):
             "success": True,
             "results": [
                 {
-                    "shots": len(measurement_results),
+                    "shots": shots,
                     "success": True,
                     "data": {
-                        "memory": measurement_results,
-                        "counts": Counts(Counter(measurement_results)),
+                        **data,
                         "metadata": self.circuit_metadata[i] if self.circuit_metadata is not None else {},
                     },
                     "header": {"name": name},
                     "calibration_set_id": self._calibration_set_id,
                 }
-                for i, (name, measurement_results) in enumerate(self._result)
+                for i, (name, data, shots) in enumerate(circuit_results)
             ],
             "date": date.today().isoformat(),
             "request": self._request,
@@ -258,3 +370,76 @@ class IQMJob(JobV1):
     def error_message(self) -> str | None:
         """Returns the error message if job has failed, otherwise returns None."""
         return self._client.get_run_status(uuid.UUID(self._job_id)).message
+
+
+class IQMCompositeJob(JobV1):
+    """Circuit execution job that consists of several :class:`IQMJob` instances.
+
+    Created by :meth:`.IQMBackend.run` when a batch of circuits is split into several jobs. Behaves like
+    a single job whose circuits are the circuits of the sub-jobs, in order.
+
+    Args:
+        backend: Backend instance initiating this job.
+        jobs: The sub-jobs, in the order of their circuits.
+        kwargs: Arguments to be passed to the initializer of the parent class.
+
+    """
+
+    def __init__(self, backend: IQMBackend, jobs: list[IQMJob], **kwargs):
+        super().__init__(backend, job_id=",".join(job.job_id() for job in jobs), **kwargs)
+        self.jobs = jobs
+        """The sub-jobs, in the order of their circuits."""
+
+    def submit(self):
+        raise NotImplementedError("The sub-jobs of a composite job are submitted when the job is created.")
+
+    def cancel(self) -> bool:
+        """Attempt to cancel all the sub-jobs.
+
+        Returns:
+            True if all the sub-jobs were cancelled successfully, False otherwise
+
+        """
+        return all([job.cancel() for job in self.jobs])
+
+    def result(
+        self,
+        *,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        cancel_after_timeout: bool = False,
+        memory: bool | None = None,
+    ) -> Result:
+        """Retrieve the results of all the sub-jobs, merged into a single result.
+
+        The arguments are the same as in :meth:`.IQMJob.result`, and apply to each sub-job separately.
+
+        Returns:
+            Result containing the results of all the circuits, in the original order.
+
+        Raises:
+            APITimeoutError: Waiting for results exceeded timeout.
+            JobAbortionError: Job failed to abort after timeout exceeded and cancellation requested.
+
+        """
+        results = [
+            job.result(timeout=timeout, cancel_after_timeout=cancel_after_timeout, memory=memory) for job in self.jobs
+        ]
+        merged = results[0]
+        merged.job_id = self._job_id
+        merged.results = [experiment_result for result in results for experiment_result in result.results]
+        merged.success = all(result.success for result in results)
+        return merged
+
+    def status(self) -> JobStatus:
+        statuses = [job.status() for job in self.jobs]
+        for status in (JobStatus.ERROR, JobStatus.CANCELLED, JobStatus.RUNNING, JobStatus.QUEUED):
+            if status in statuses:
+                return status
+        return JobStatus.DONE
+
+    def error_message(self) -> str | None:
+        """Returns the error message of the first failed sub-job, or None if no sub-job has failed."""
+        for job in self.jobs:
+            if job.status() == JobStatus.ERROR:
+                return job.error_message()
+        return None
@@ -13,30 +13,38 @@
 # limitations under the License.
 """Naive transpilation for the IQM Star architecture."""
 
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import multiprocessing
+import os
+import time
 import warnings
 
-from iqm.iqm_client import Circuit as IQMClientCircuit
-from iqm.iqm_client.transpile import ExistingMoveHandlingOptions, transpile_insert_moves
-import numpy as np
-from pydantic_core import ValidationError
+import dill
+from iqm.iqm_client import Instruction as IQMInstruction
+from iqm.iqm_client.transpile import ExistingMoveHandlingOptions, insert_moves_into_instructions
 from qiskit import QuantumCircuit, transpile
-from qiskit.circuit.library import RGate
-from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.circuit import Operation, QuantumRegister
+from qiskit.circuit.parameterexpression import ParameterValueType
 from qiskit.dagcircuit import DAGCircuit
+from qiskit.transpiler import PassManager, generate_preset_pass_manager
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.layout import Layout
+from qiskit.user_config import get_config
 
 from .iqm_backend import IQMBackendBase, IQMTarget
 from .iqm_move_layout import generate_initial_layout
-from .qiskit_to_iqm import deserialize_instructions, serialize_instructions
+from .move_gate import MoveGate
 
 
 class IQMNaiveResonatorMoving(TransformationPass):
     """Naive transpilation pass for resonator moving.
 
-    The logic of this pass is deferred to `iqm-client.transpile_insert_moves`.
-    This pass is a wrapper that converts the circuit into the IQMClient Circuit format,
-    runs the `transpile_insert_moves` function, and then converts the result back to a Qiskit circuit.
+    The logic of this pass is deferred to :func:`iqm.iqm_client.transpile.insert_moves_into_instructions`.
+    The pass describes the operations of the DAG to it by their native names and loci only,
+    and then builds the new DAG from the original operations, with the MOVE gates added and the loci
+    changed as needed.
 
     Args:
         target: Transpilation target.
@@ -69,20 +77,7 @@ class IQMNaiveResonatorMoving(TransformationPass):
             TranspilerError: The layout is not compatible with the DAG, or if the input gate set is incorrect.
 
         """
-        # TODO: Temporary hack to get the symbolic parameters to work: replace symbols with (inf, idx).
-        # Replace symbolic parameters with indices and store the index to symbol mapping.
-        symbolic_gates = {}
-        symbolic_index = 0.0
-        for node in dag.topological_op_nodes():
-            # This only works for prx gates because that has two parameters
-            # We use one to mark that it is a symbolic gate (np.inf) and the other to store the index.
-            if node.name == "r" and not all(isinstance(param, (float, int)) for param in node.op.params):
-                symbolic_gates[symbolic_index] = node.op.params
-                dag.substitute_node(node, RGate(np.inf, float(symbolic_index)))
-                symbolic_index += 1
-
-        circuit = dag_to_circuit(dag)
-        if len(circuit) == 0:
+        if dag.size() == 0:
             return dag  # Empty circuit, no need to transpile.
         # For some reason, the dag does not contain the layout, so we need to do a bunch of fixing.
         if self.property_set.get("layout"):
@@ -90,45 +85,60 @@ class IQMNaiveResonatorMoving(TransformationPass):
         else:
             # Reconstruct the layout from the dag.
             layout = Layout()
-            for qreg in dag.qregs:
+            for qreg in dag.qregs.values():
                 layout.add_register(qreg)
             for i, qubit in enumerate(dag.qubits):
                 layout.add(qubit, i)
 
-        # Convert the circuit to the IQMClientCircuit format and run the transpiler.
-        iqm_circuit = IQMClientCircuit(
-            name="Transpiling Circuit",
-            instructions=tuple(serialize_instructions(circuit, self.idx_to_component)),
-            metadata=None,
-        )
-        try:
-            routed_iqm_circuit = transpile_insert_moves(
-                iqm_circuit, self.architecture, existing_moves=self.existing_moves_handling
-            )
-            routed_circuit = deserialize_instructions(
-                list(routed_iqm_circuit.instructions), self.component_to_idx, layout
+        # Describe the operations to the MOVE insertion by their native names and loci only.
+        qubit_to_component = {qubit: self.idx_to_component[idx] for idx, qubit in enumerate(dag.qubits)}
+        nodes = []
+        instructions = []
+        for node in dag.topological_op_nodes():
+            name = _native_name(node.op)
+            if name is None:
+                continue
+            nodes.append(node)
+            instructions.append(
+                IQMInstruction.model_construct(
+                    name=name,
+                    implementation=None,
+                    qubits=tuple(qubit_to_component[qubit] for qubit in node.qargs),
+                    args={},
+                )
             )
-        except ValidationError as e:  # The Circuit without move gates is empty.
-            errors = e.errors()
-            if (
-                len(errors) == 1
-                and errors[0]["msg"] == "Value error, Each circuit should have at least one instruction."
-            ):
-                circ_args = [circuit.num_ancillas, circuit.num_clbits]
-                routed_circuit = QuantumCircuit(*layout.get_registers(), *(arg for arg in circ_args if arg > 0))
-            else:
-                raise e
+        routed_instructions = insert_moves_into_instructions(
+            instructions, self.architecture, existing_moves=self.existing_moves_handling
+        )
 
-        # Create the new DAG and make sure that the qubits are properly ordered.
-        ordered_qubits = [layout.get_physical_bits()[i] for i in range(len(layout.get_physical_bits()))]
-        new_dag = circuit_to_dag(routed_circuit, qubit_order=ordered_qubits, clbit_order=routed_circuit.clbits)
+        # Add the resonators to the layout.
+        n_qubits = len(layout.get_physical_bits())
+        n_resonators = len(self.component_to_idx) - n_qubits
+        if n_resonators > 0:
+            resonator_qreg = QuantumRegister(n_resonators, "resonators")
+            layout.add_register(resonator_qreg)
+            for idx in range(n_resonators):
+                layout.add(resonator_qreg[idx], idx + n_qubits)
+        index_to_qiskit_qubit = layout.get_physical_bits()
 
-        # Reinsert the symbolic parameters.
-        for node in new_dag.topological_op_nodes():
-            # This only works for prx gates because that has two parameters
-            # We use one to mark that it is a symbolic gate (np.inf) and the other to store the index.
-            if node.name == "r" and not np.isfinite(node.op.params[0]):
-                new_dag.substitute_node(node, RGate(*symbolic_gates[int(np.round(node.op.params[1]))]))
+        # Create the new DAG and make sure that the qubits are properly ordered.
+        new_dag = DAGCircuit()
+        new_dag.name = dag.name
+        new_dag.metadata = dag.metadata
+        new_dag.global_phase = dag.global_phase
+        new_dag.add_qubits([index_to_qiskit_qubit[i] for i in range(len(index_to_qiskit_qubit))])
+        for qreg in layout.get_registers():
+            new_dag.add_qreg(qreg)
+        new_dag.add_clbits(dag.clbits)
+        for creg in dag.cregs.values():
+            new_dag.add_creg(creg)
+        for idx, inst in routed_instructions:
+            qargs = tuple(index_to_qiskit_qubit[self.component_to_idx[q]] for q in inst.qubits)
+            if idx is None:
+                new_dag.apply_operation_back(MoveGate(), qargs, (), check=False)
+            else:
+                node = nodes[idx]
+                new_dag.apply_operation_back(node.op, qargs, node.cargs, check=False)
 
         # Update the final_layout with the correct bits.
         if "final_layout" in self.property_set:
@@ -150,6 +160,40 @@ class IQMNaiveResonatorMoving(TransformationPass):
         return new_dag
 
 
+_PRX_GATES = frozenset({"r", "x", "rx", "y", "ry"})
+"""Names of the Qiskit gates that are implemented using the native prx operation."""
+_NATIVE_OPERATIONS = frozenset({"cz", "move", "barrier", "delay", "measure", "reset"})
+"""Names of the Qiskit operations that have native counterparts of the same name."""
+
+
+def _native_name(operation: Operation) -> str | None:
+    """Name of the native IQM operation implementing the given Qiskit operation.
+
+    See :func:`.serialize_instructions`.
+
+    Args:
+        operation: Qiskit operation.
+
+    Returns:
+        Name of the native operation, or ``None`` if ``operation`` is dropped in the serialization.
+
+    Raises:
+        ValueError: ``operation`` is not natively supported.
+
+    """
+    name = operation.name
+    condition = getattr(operation, "condition", None)
+    if name in _PRX_GATES:
+        return "prx" if condition is None else "cc_prx"
+    if condition is not None:
+        raise ValueError(f"This backend only supports conditionals on r, x, y, rx and ry gates, not on {name}")
+    if name in _NATIVE_OPERATIONS:
+        return name
+    if name == "id":
+        return None
+    raise ValueError(f"Instruction '{name}' is not natively supported. You need to transpile the circuit first.")
+
+
 def _get_scheduling_method(
     perform_move_routing: bool,
     optimize_single_qubits: bool,
@@ -229,9 +273,161 @@ def transpile_to_IQM(  # noqa: PLR0913
         Transpiled circuit ready for running on the backend.
 
     """
+    restrict_to_qubits = _qubit_indices(backend, restrict_to_qubits)
+    target, initial_layout = _select_target(
+        circuit, backend, target, initial_layout, perform_move_routing, existing_moves_handling, restrict_to_qubits
+    )
     if restrict_to_qubits is not None:
-        restrict_to_qubits = [backend.qubit_name_to_index(q) if isinstance(q, str) else q for q in restrict_to_qubits]
+        target = target.restrict_to_qubits(restrict_to_qubits)
+
+    qiskit_transpiler_kwargs["scheduling_method"] = _select_scheduling_method(
+        qiskit_transpiler_kwargs.pop("scheduling_method", None),
+        perform_move_routing=perform_move_routing,
+        optimize_single_qubits=optimize_single_qubits,
+        remove_final_rzs=remove_final_rzs,
+        ignore_barriers=ignore_barriers,
+        existing_moves_handling=existing_moves_handling,
+    )
+    new_circuit = transpile(circuit, target=target, initial_layout=initial_layout, **qiskit_transpiler_kwargs)
+    return new_circuit
+
+
+@dataclass(frozen=True)
+class BatchTranspilationResult:
+    """Result of :func:`transpile_batch_to_IQM`."""
+
+    circuits: list[QuantumCircuit]
+    """Transpiled circuits, in the order of the input circuits."""
+    durations: list[float]
+    """Time spent in transpiling each circuit, in seconds, in the order of the input circuits.
+    Does not include the setup shared by the circuits, or the communication with the worker processes."""
+
+
+def transpile_batch_to_IQM(  # noqa: PLR0913
+    circuits: Sequence[QuantumCircuit],
+    backend: IQMBackendBase,
+    *,
+    target: IQMTarget | None = None,
+    initial_layout: Layout | dict | list | None = None,
+    perform_move_routing: bool = True,
+    optimize_single_qubits: bool = True,
+    ignore_barriers: bool = False,
+    remove_final_rzs: bool = True,
+    existing_moves_handling: ExistingMoveHandlingOptions | None = None,
+    restrict_to_qubits: list[int] | list[str] | None = None,
+    num_processes: int | None = None,
+    **qiskit_transpiler_kwargs,
+) -> BatchTranspilationResult:
+    """Transpile a batch of circuits to an IQM backend, using multiple processes.
+
+    Equivalent to calling :func:`transpile_to_IQM` on each circuit with the same arguments, but the
+    target and the pass manager are built only once for all the circuits that use them, and the circuits
+    are transpiled in parallel in a pool of worker processes, each of which receives the pass managers only once.
+
+    Circuits with MOVE gates are transpiled using the target with resonators. If ``initial_layout`` is not given,
+    an initial layout is generated for each of them, and each distinct layout requires its own pass manager.
+
+    The worker processes are forked if the platform supports it. Otherwise the pass managers are serialized using
+    dill, which loses the global phases of the gate equivalences in the supported Qiskit versions, so the global
+    phases of the transpiled circuits may differ from those produced by :func:`transpile_to_IQM`. The same applies
+    to the parallel transpilation in :func:`~qiskit.compiler.transpile`. The circuits are otherwise equivalent.
+
+    Args:
+        circuits: Circuits to transpile.
+        backend: The target backend to compile to.
+        target: See :func:`transpile_to_IQM`.
+        initial_layout: Initial layout used for all the circuits, see :func:`transpile_to_IQM`.
+        perform_move_routing: Whether to perform MOVE gate routing.
+        optimize_single_qubits: Whether to optimize single qubit gates away.
+        ignore_barriers: Whether to ignore barriers when optimizing single qubit gates away.
+        remove_final_rzs: Whether to remove the final z rotations.
+        existing_moves_handling: How to handle existing MOVE gates in the circuits, required if some of the
+            circuits contain MOVE gates.
+        restrict_to_qubits: Restrict the transpilation to only use these specific physical qubits.
+        num_processes: Maximum number of worker processes. By default the number of CPUs.
+            If 1, the circuits are transpiled in the calling process.
+        qiskit_transpiler_kwargs: Arguments for :func:`~qiskit.transpiler.generate_preset_pass_manager`.
+            ``optimization_level`` defaults to the same value as in :func:`~qiskit.compiler.transpile`.
+
+    Returns:
+        Transpiled circuits ready for running on the backend, and the time spent transpiling each of them.
+
+    """
+    restrict_to_qubits = _qubit_indices(backend, restrict_to_qubits)
+    qiskit_transpiler_kwargs["scheduling_method"] = _select_scheduling_method(
+        qiskit_transpiler_kwargs.pop("scheduling_method", None),
+        perform_move_routing=perform_move_routing,
+        optimize_single_qubits=optimize_single_qubits,
+        remove_final_rzs=remove_final_rzs,
+        ignore_barriers=ignore_barriers,
+        existing_moves_handling=existing_moves_handling,
+    )
+    optimization_level = qiskit_transpiler_kwargs.pop("optimization_level", None)
+    if optimization_level is None:
+        optimization_level = get_config().get("transpile_optimization_level", 1)
 
+    # restricting the target is expensive, so it is done once for each target
+    restricted_targets: dict[int, IQMTarget] = {}
+    pass_managers: list[PassManager] = []
+    pass_manager_indices: dict[tuple, int] = {}
+    # for each circuit, the index of its pass manager
+    indices = []
+    for circuit in circuits:
+        circuit_target, circuit_layout = _select_target(
+            circuit, backend, target, initial_layout, perform_move_routing, existing_moves_handling, restrict_to_qubits
+        )
+        if restrict_to_qubits is not None:
+            if id(circuit_target) not in restricted_targets:
+                restricted_targets[id(circuit_target)] = circuit_target.restrict_to_qubits(restrict_to_qubits)
+            circuit_target = restricted_targets[id(circuit_target)]
+        if circuit_layout is initial_layout:
+            layout_key = None
+        else:
+            # a layout generated for this circuit, equivalent to the list of physical qubits of its virtual qubits
+            circuit_layout = [circuit_layout[qubit] for qubit in circuit.qubits]
+            layout_key = tuple(circuit_layout)
+        key = (id(circuit_target), layout_key)
+        if key not in pass_manager_indices:
+            pass_manager_indices[key] = len(pass_managers)
+            pass_managers.append(
+                generate_preset_pass_manager(
+                    optimization_level, target=circuit_target, initial_layout=circuit_layout, **qiskit_transpiler_kwargs
+                )
+            )
+        indices.append(pass_manager_indices[key])
+
+    if num_processes is None:
+        num_processes = os.cpu_count() or 1
+    num_processes = min(num_processes, len(circuits))
+    if num_processes <= 1:
+        results = [_transpile_timed(pass_managers[idx], circuit) for idx, circuit in zip(indices, circuits)]
+    else:
+        results = _transpile_in_processes(circuits, pass_managers, indices, num_processes)
+    # like in qiskit.compiler.transpile, the transpiled circuits keep the names of the original circuits
+    for circuit, (transpiled, _) in zip(circuits, results):
+        transpiled.name = circuit.name
+    return BatchTranspilationResult(
+        circuits=[transpiled for transpiled, _ in results], durations=[duration for _, duration in results]
+    )
+
+
+def _qubit_indices(backend: IQMBackendBase, qubits: list[int] | list[str] | None) -> list[int] | None:
+    """Convert the given qubit names to their indices in ``backend``."""
+    if qubits is None:
+        return None
+    return [backend.qubit_name_to_index(q) if isinstance(q, str) else q for q in qubits]
+
+
+def _select_target(
+    circuit: QuantumCircuit,
+    backend: IQMBackendBase,
+    target: IQMTarget | None,
+    initial_layout: Layout | dict | list | None,
+    perform_move_routing: bool,
+    existing_moves_handling: ExistingMoveHandlingOptions | None,
+    restrict_to_qubits: list[int] | None,
+) -> tuple[IQMTarget, Layout | dict | list | None]:
+    """Select the transpilation target and the initial layout for a circuit, see :func:`transpile_to_IQM`."""
     if target is None:
         if circuit.count_ops().get("move", 0) > 0:
             target = backend.target_with_resonators
@@ -242,26 +438,127 @@ def transpile_to_IQM(  # noqa: PLR0913
                 raise ValueError("The circuit contains MOVE gates but existing_moves_handling is not set.")
         else:
             target = backend.target
+    return target, initial_layout
 
-    if restrict_to_qubits is not None:
-        target = target.restrict_to_qubits(restrict_to_qubits)
 
-    # Determine which scheduling method to use
-    scheduling_method = qiskit_transpiler_kwargs.pop("scheduling_method", None)
+def _select_scheduling_method(
+    scheduling_method: str | None,
+    *,
+    perform_move_routing: bool,
+    optimize_single_qubits: bool,
+    remove_final_rzs: bool,
+    ignore_barriers: bool,
+    existing_moves_handling: ExistingMoveHandlingOptions | None,
+) -> str:
+    """Determine the scheduling method, unless the user has given one, see :func:`transpile_to_IQM`."""
     if scheduling_method is None:
-        scheduling_method = _get_scheduling_method(
+        return _get_scheduling_method(
             perform_move_routing=perform_move_routing,
             optimize_single_qubits=optimize_single_qubits,
             remove_final_rzs=remove_final_rzs,
             ignore_barriers=ignore_barriers,
             existing_moves_handling=existing_moves_handling,
         )
+    warnings.warn(
+        f"Scheduling method is set to {scheduling_method}, but it is normally used to pass other transpiler "
+        + "options, ignoring the `perform_move_routing`, `optimize_single_qubits`, `remove_final_rzs`, "
+        + "`ignore_barriers`, and `existing_moves_handling` arguments."
+    )
+    return scheduling_method
+
+
+def _transpile_timed(pass_manager: PassManager, circuit: QuantumCircuit) -> tuple[QuantumCircuit, float]:
+    """Run a pass manager on a circuit, and measure the time it takes."""
+    start = time.perf_counter()
+    transpiled = pass_manager.run(circuit)
+    return transpiled, time.perf_counter() - start
+
+
+def _transpile_in_processes(
+    circuits: Sequence[QuantumCircuit],
+    pass_managers: list[PassManager],
+    indices: list[int],
+    num_processes: int,
+) -> list[tuple[QuantumCircuit, float]]:
+    """Transpile circuits in a pool of worker processes.
+
+    If possible, the worker processes are forked, so that they inherit the pass managers without serializing
+    them. Otherwise the pass managers are serialized using dill, since they contain lambdas.
+
+    Args:
+        circuits: Circuits to transpile.
+        pass_managers: Pass managers to use.
+        indices: For each circuit, the index of its pass manager in ``pass_managers``.
+        num_processes: Number of worker processes.
+
+    Returns:
+        Transpiled circuits and their transpilation times, in the order of ``circuits``.
+
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+        worker_pass_managers: list[PassManager | bytes] = list(pass_managers)
     else:
-        warnings.warn(
-            f"Scheduling method is set to {scheduling_method}, but it is normally used to pass other transpiler "
-            + "options, ignoring the `perform_move_routing`, `optimize_single_qubits`, `remove_final_rzs`, "
-            + "`ignore_barriers`, and `existing_moves_handling` arguments."
-        )
-    qiskit_transpiler_kwargs["scheduling_method"] = scheduling_method
-    new_circuit = transpile(circuit, target=target, initial_layout=initial_layout, **qiskit_transpiler_kwargs)
-    return new_circuit
+        context = None
+        worker_pass_managers = [dill.dumps(pass_manager) for pass_manager in pass_managers]
+    # a few chunks per process balance the load without much communication overhead
+    chunk_size = max(1, len(circuits) // (4 * num_processes))
+    chunks = [range(start, min(start + chunk_size, len(circuits))) for start in range(0, len(circuits), chunk_size)]
+    with ProcessPoolExecutor(
+        max_workers=num_processes, mp_context=context, initializer=_init_worker, initargs=(worker_pass_managers,)
+    ) as executor:
+        futures = [
+            executor.submit(
+                _transpile_chunk,
+                [indices[i] for i in chunk],
+                [circuits[i] for i in chunk],
+                [circuits[i].global_phase for i in chunk],
+            )
+            for chunk in chunks
+        ]
+        results = []
+        for future in futures:
+            for transpiled, global_phase, duration in future.result():
+                transpiled.global_phase = global_phase
+                results.append((transpiled, duration))
+        return results
+
+
+_worker_pass_managers: list[PassManager | bytes] = []
+"""Pass managers in a worker process of :func:`_transpile_in_processes`, serialized until first used."""
+
+
+def _init_worker(pass_managers: list[PassManager | bytes]) -> None:
+    """Initialize a worker process of :func:`_transpile_in_processes`."""
+    # Like in qiskit.utils.parallel_map, the passes implemented in Rust must not use their own thread pools
+    # in a forked process.
+    os.environ["QISKIT_IN_PARALLEL"] = "TRUE"
+    _worker_pass_managers[:] = pass_managers
+
+
+def _transpile_chunk(
+    indices: list[int], circuits: list[QuantumCircuit], global_phases: list[ParameterValueType]
+) -> list[tuple[QuantumCircuit, ParameterValueType, float]]:
+    """Transpile circuits in a worker process of :func:`_transpile_in_processes`.
+
+    The global phases of the circuits are passed separately, since Qiskit does not preserve them when pickling
+    circuits.
+
+    Args:
+        indices: For each circuit, the index of its pass manager.
+        circuits: Circuits to transpile.
+        global_phases: Global phases of ``circuits``.
+
+    Returns:
+        Transpiled circuits, their global phases and their transpilation times.
+
+    """
+    results = []
+    for idx, circuit, global_phase in zip(indices, circuits, global_phases):
+        pass_manager = _worker_pass_managers[idx]
+        if isinstance(pass_manager, bytes):
+            pass_manager = _worker_pass_managers[idx] = dill.loads(pass_manager)
+        circuit.global_phase = global_phase
+        transpiled, duration = _transpile_timed(pass_manager, circuit)
+        results.append((transpiled, transpiled.global_phase, duration))
+    return results
@@ -15,20 +15,33 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
 from importlib.metadata import PackageNotFoundError, version
+import math
+import time
 from typing import Any
 from uuid import UUID
 import warnings
 
-from iqm.iqm_client import Circuit, CircuitCompilationOptions, CircuitValidationError, IQMClient, RunRequest
+from iqm.iqm_client import (
+    DEFAULT_TIMEOUT_SECONDS,
+    Circuit,
+    CircuitCompilationOptions,
+    CircuitValidationError,
+    IQMClient,
+    RunRequest,
+    run_pipelined,
+)
 from iqm.iqm_client.util import to_json_dict
 from iqm.qiskit_iqm.fake_backends import IQMFakeAdonis
 from iqm.qiskit_iqm.iqm_backend import IQMBackendBase
-from iqm.qiskit_iqm.iqm_job import IQMJob
+from iqm.qiskit_iqm.iqm_job import IQMCompositeJob, IQMJob
 from iqm.qiskit_iqm.qiskit_to_iqm import serialize_instructions
 from qiskit import QuantumCircuit
 from qiskit.providers import JobStatus, JobV1, Options
+from qiskit.result import Result
 
 try:
     __version__ = version("qiskit-iqm")
@@ -38,6 +51,14 @@ finally:
     del version, PackageNotFoundError
 
 
+MAX_PAYLOAD_BYTES = 50 * 1024 * 1024
+"""Default maximum estimated size of the circuits of a single job, when splitting batches in :meth:`.IQMBackend.run`."""
+CIRCUIT_OVERHEAD_BYTES = 200
+"""Estimated serialized size of a circuit without its instructions, in bytes."""
+MAX_CONCURRENT_SUBMISSIONS = 4
+"""Default maximum number of jobs submitted at the same time, when splitting batches in :meth:`.IQMBackend.run`."""
+
+
 class IQMBackend(IQMBackendBase):
     """Backend for executing quantum circuits on IQM quantum computers.
 
@@ -60,6 +81,8 @@ class IQMBackend(IQMBackendBase):
         self._max_circuits: int | None = None
         self.name = "IQM Backend"
         self._calibration_set_id = architecture.calibration_set_id
+        self.run_request_timings: dict[str, float] = {}
+        """Time in seconds spent in each stage of the latest :meth:`create_run_request` call."""
 
     @classmethod
     def _default_options(cls) -> Options:
@@ -88,12 +111,28 @@ class IQMBackend(IQMBackendBase):
     def run(
         self,
         run_input: QuantumCircuit | list[QuantumCircuit],
+        *,
+        memory: bool = True,
+        split_batches: bool = False,
+        max_payload_bytes: int = MAX_PAYLOAD_BYTES,
+        max_concurrent_submissions: int = MAX_CONCURRENT_SUBMISSIONS,
         **options,
-    ) -> IQMJob:
+    ) -> IQMJob | IQMCompositeJob:
         """Run a quantum circuit or a list of quantum circuits on the IQM quantum computer represented by this backend.
 
         Args:
             run_input: The circuits to run.
+            memory: Iff False, :meth:`.IQMJob.result` retrieves only the counts of the measurement results from the
+                server, and the result contains no per-shot memory. Much faster for large numbers of shots.
+            split_batches: Iff True, circuits that do not fit in a single job, because there are more of them than
+                :attr:`max_circuits` or their estimated payload is larger than ``max_payload_bytes``, are split
+                into as few evenly sized jobs as possible. The jobs are submitted concurrently, and returned as
+                a single :class:`.IQMCompositeJob` whose result contains the results of all the circuits in order.
+                If submitting any of the jobs fails, the jobs that were already submitted are cancelled.
+            max_payload_bytes: Maximum estimated size of the serialized circuits of a single job, in bytes.
+                Only used if ``split_batches`` is True.
+            max_concurrent_submissions: Maximum number of jobs submitted at the same time.
+                Only used if ``split_batches`` is True.
             options: Keyword arguments passed on to :meth:`create_run_request`, and documented there.
 
         Returns:
@@ -101,9 +140,93 @@ class IQMBackend(IQMBackendBase):
 
         """
         run_request = self.create_run_request(run_input, **options)
+        if not split_batches:
+            return self._submit(run_request, memory=memory)
+        chunks = _split_circuits(run_request.circuits, self.max_circuits, max_payload_bytes)
+        if len(chunks) == 1:
+            return self._submit(run_request, memory=memory)
+        # the circuits have already been validated as a whole, so the sub-requests only need to be copied
+        sub_requests = [run_request.model_copy(update={"circuits": chunk}) for chunk in chunks]
+        error: Exception | None = None
+        with ThreadPoolExecutor(max_workers=max(1, min(len(sub_requests), max_concurrent_submissions))) as executor:
+            futures = [executor.submit(self._submit, sub_request, memory=memory) for sub_request in sub_requests]
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    error = future.exception()
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        # leaving the executor waits for the submissions in progress to finish
+        if error is not None:
+            submitted = [future.result() for future in futures if not future.cancelled() and future.exception() is None]
+            if submitted and not IQMCompositeJob(self, submitted).cancel():
+                warnings.warn(
+                    "Submitting the split batch failed, and not all of its submitted jobs could be cancelled: "
+                    f"{[job.job_id() for job in submitted]}"
+                )
+            raise error
+        return IQMCompositeJob(self, [future.result() for future in futures])
+
+    def run_pipelined(
+        self,
+        batches: Iterable[QuantumCircuit | list[QuantumCircuit]],
+        *,
+        max_jobs_in_flight: int = 2,
+        transpile: Callable[[list[QuantumCircuit]], list[QuantumCircuit]] | None = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        memory: bool = True,
+        **options,
+    ) -> Iterator[Result]:
+        """Run a stream of circuit batches, preparing the next batches while the previous ones are executing.
+
+        Equivalent to calling :meth:`run` and :meth:`.IQMJob.result` for each batch in turn, except that up to
+        ``max_jobs_in_flight`` batches are transpiled, serialized and submitted in the background while the
+        earlier batches are being executed, so that the quantum computer does not sit idle between the batches.
+        See :func:`.run_pipelined` for the details.
+
+        .. code-block:: python
+
+            cache = TranspilationCache(backend)
+            batches = ([circuit.assign_parameters(values) for values in chunk] for chunk in parameter_chunks)
+            for result in backend.run_pipelined(
+                batches, transpile=lambda circuits: [cache.transpile(c) for c in circuits], shots=1000
+            ):
+                process(result.get_counts())
+
+        Args:
+            batches: Batches of circuits to run, consumed lazily.
+            max_jobs_in_flight: Maximum number of batches being prepared or executed at the same time.
+            transpile: Function applied to each batch before serializing it, e.g. for transpiling the circuits.
+                It is called on worker threads. If ``None``, the circuits must already be transpiled.
+            timeout: Time limit for waiting for the results of each batch, in seconds.
+            memory: Iff False, only the counts of the measurement results are retrieved, see :meth:`run`.
+            options: Keyword arguments passed on to :meth:`create_run_request`, and documented there.
+
+        Yields:
+            The results of each batch, in the order of ``batches``.
+
+        """
+
+        def _prepare(batch: QuantumCircuit | list[QuantumCircuit]) -> RunRequest:
+            circuits = [batch] if isinstance(batch, QuantumCircuit) else list(batch)
+            if transpile is not None:
+                circuits = transpile(circuits)
+            return self.create_run_request(circuits, **options)
+
+        return run_pipelined(
+            batches,
+            _prepare,
+            partial(self._submit, memory=memory),
+            lambda job: job.result(timeout=timeout),
+            max_jobs_in_flight=max_jobs_in_flight,
+        )
+
+    def _submit(self, run_request: RunRequest, *, memory: bool) -> IQMJob:
+        """Submit a run request, and return the job executing it."""
         job_id = self.client.submit_run_request(run_request)
-        job = IQMJob(self, str(job_id), shots=run_request.shots)
+        job = IQMJob(self, str(job_id), shots=run_request.shots, memory=memory)
         job.circuit_metadata = [c.metadata for c in run_request.circuits]
+        job.circuit_names = [c.name for c in run_request.circuits]
         return job
 
     def create_run_request(
@@ -113,6 +236,7 @@ class IQMBackend(IQMBackendBase):
         circuit_compilation_options: CircuitCompilationOptions | None = None,
         circuit_callback: Callable[[list[QuantumCircuit]], Any] | None = None,
         qubit_mapping: dict[int, str] | None = None,
+        serialization_workers: int | None = None,
         **unknown_options,
     ) -> RunRequest:
         """Creates a run request without submitting it for execution.
@@ -141,10 +265,14 @@ class IQMBackend(IQMBackendBase):
                 purpose.
             qubit_mapping: Mapping from qubit indices in the circuit to qubit names on the device. If ``None``,
                 :attr:`.IQMBackendBase.index_to_qubit_name` will be used.
+            serialization_workers: Number of processes used for serializing the circuits, see
+                :meth:`serialize_circuits`.
 
         Returns:
             The created run request object
 
+        The time spent in each stage of creating the run request is stored in :attr:`run_request_timings`.
+
         """
         circuits = [run_input] if isinstance(run_input, QuantumCircuit) else run_input
 
@@ -170,10 +298,16 @@ class IQMBackend(IQMBackendBase):
         if unknown_options:
             warnings.warn(f"Unknown backend option(s): {unknown_options}")
 
+        timings: dict[str, float] = {}
+        start = time.perf_counter()
         if circuit_callback:
             circuit_callback(circuits)
+            timings["circuit_callback"] = time.perf_counter() - start
+            start = time.perf_counter()
 
-        circuits_serialized: list[Circuit] = [self.serialize_circuit(circuit, qubit_mapping) for circuit in circuits]
+        circuits_serialized = self.serialize_circuits(circuits, qubit_mapping, max_workers=serialization_workers)
+        timings["serialization"] = time.perf_counter() - start
+        start = time.perf_counter()
 
         if self._use_default_calibration_set:
             default_calset_id = self.client.get_dynamic_quantum_architecture(None).calibration_set_id
@@ -183,18 +317,24 @@ class IQMBackend(IQMBackendBase):
                     f"to {default_calset_id}. Create a new IQMBackend if you wish to transpile the "
                     "circuits using the new calibration set."
                 )
+            timings["calibration_set_check"] = time.perf_counter() - start
+            start = time.perf_counter()
         try:
             run_request = self.client.create_run_request(
                 circuits_serialized,
                 calibration_set_id=self._calibration_set_id,
                 shots=shots,
                 options=circuit_compilation_options,
+                # the circuits were serialized by us, so they only need to be validated against the architecture
+                validate=False,
             )
         except CircuitValidationError as e:
             raise CircuitValidationError(
                 f"{e}\nMake sure the circuits have been transpiled using the same backend that you used to submit "
                 f"the circuits."
             ) from e
+        timings["validation"] = time.perf_counter() - start
+        self.run_request_timings = timings
 
         return run_request
 
@@ -235,6 +375,8 @@ class IQMBackend(IQMBackendBase):
             qubit_mapping: Mapping from qubit indices in the circuit to qubit names on the device. If not provided,
                 :attr:`.IQMBackendBase.index_to_qubit_name` will be used.
 
+        The instructions of the serialized circuit are not validated, see :meth:`.Circuit.from_trusted`.
+
         Returns:
             data transfer object representing the circuit
 
@@ -244,17 +386,98 @@ class IQMBackend(IQMBackendBase):
         """
         if qubit_mapping is None:
             qubit_mapping = self._idx_to_qb
-        instructions = tuple(serialize_instructions(circuit, qubit_index_to_name=qubit_mapping))
+        return _serialize_circuit(circuit, qubit_mapping)
 
-        try:
-            metadata = to_json_dict(circuit.metadata)
-        except ValueError:
-            warnings.warn(
-                f"Metadata of circuit {circuit.name} was dropped because it could not be serialised to JSON.",
-            )
-            metadata = None
+    def serialize_circuits(
+        self,
+        circuits: Sequence[QuantumCircuit],
+        qubit_mapping: dict[int, str] | None = None,
+        *,
+        max_workers: int | None = None,
+    ) -> list[Circuit]:
+        """Serialize a batch of quantum circuits into the IQM data transfer format.
+
+        Equivalent to calling :meth:`serialize_circuit` for each circuit. For large batches, the circuits
+        can be serialized in parallel in a pool of processes. This only pays off for batches of many deep
+        circuits, since the circuits have to be pickled for sending them to the worker processes.
+
+        Args:
+            circuits: quantum circuits to serialize
+            qubit_mapping: Mapping from qubit indices in the circuits to qubit names on the device. If not provided,
+                :attr:`.IQMBackendBase.index_to_qubit_name` will be used.
+            max_workers: Number of worker processes to use. If ``None`` or 1, the circuits are serialized in the
+                current process.
+
+        Returns:
+            data transfer objects representing the circuits
+
+        Raises:
+            ValueError: a circuit contains an unsupported instruction or is not transpiled in general
+
+        """
+        if qubit_mapping is None:
+            qubit_mapping = self._idx_to_qb
+        serialize = partial(_serialize_circuit, qubit_mapping=qubit_mapping)
+        if max_workers is None or max_workers <= 1 or len(circuits) <= 1:
+            return [serialize(circuit) for circuit in circuits]
+
+        chunksize = max(1, len(circuits) // (4 * max_workers))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(serialize, circuits, chunksize=chunksize))
+
+
+def _split_circuits(circuits: list[Circuit], max_circuits: int | None, max_payload_bytes: int) -> list[list[Circuit]]:
+    """Split circuits into as few evenly sized consecutive chunks as possible, respecting the given limits.
+
+    The payload size of each circuit is estimated from the serialized size of a sample of instructions.
+
+    Args:
+        circuits: circuits to split
+        max_circuits: maximum number of circuits in a chunk, or ``None`` for no limit
+        max_payload_bytes: maximum estimated serialized size of the circuits in a chunk
+
+    Returns:
+        the chunks, in order
+
+    """
+    sample = [instruction for circuit in circuits[:10] for instruction in circuit.instructions[:100]]
+    bytes_per_instruction = sum(len(instruction.model_dump_json(exclude_none=True)) for instruction in sample) / max(
+        len(sample), 1
+    )
+    sizes = [CIRCUIT_OVERHEAD_BYTES + bytes_per_instruction * len(circuit.instructions) for circuit in circuits]
+    n_chunks = max(
+        math.ceil(len(circuits) / max_circuits) if max_circuits else 1,
+        math.ceil(sum(sizes) / max_payload_bytes),
+        1,
+    )
+    chunk_length = math.ceil(len(circuits) / n_chunks)
+    chunks: list[list[Circuit]] = [[]]
+    chunk_size = 0.0
+    for circuit, size in zip(circuits, sizes):
+        if chunks[-1] and (len(chunks[-1]) >= chunk_length or chunk_size + size > max_payload_bytes):
+            chunks.append([])
+            chunk_size = 0.0
+        chunks[-1].append(circuit)
+        chunk_size += size
+    return chunks
+
+
+def _serialize_circuit(circuit: QuantumCircuit, qubit_mapping: dict[int, str]) -> Circuit:
+    """Serialize a quantum circuit, see :meth:`IQMBackend.serialize_circuit`.
+
+    A module level function, so that it can be run in worker processes.
+    """
+    instructions = tuple(serialize_instructions(circuit, qubit_index_to_name=qubit_mapping))
+
+    try:
+        metadata = to_json_dict(circuit.metadata)
+    except ValueError:
+        warnings.warn(
+            f"Metadata of circuit {circuit.name} was dropped because it could not be serialised to JSON.",
+        )
+        metadata = None
 
-        return Circuit(name=circuit.name, instructions=instructions, metadata=metadata)
+    return Circuit.from_trusted(name=circuit.name, instructions=instructions, metadata=metadata)
 
 
 class IQMFacadeBackend(IQMBackend):
@@ -312,6 +535,9 @@ class IQMProvider:
     If the server requires user authentication, you can provide it either using environment
     variables, or as keyword arguments to IQMProvider. The user authentication kwargs are passed
     through to :class:`~iqm.iqm_client.iqm_client.IQMClient` as is, and are documented there.
+    Other keyword arguments of :class:`~iqm.iqm_client.iqm_client.IQMClient` can be given the same way, e.g.
+    ``cache_dir`` for storing the quantum architectures locally, which speeds up :meth:`get_backend` in
+    short-lived processes.
 
     Args:
         url: URL of the IQM server (e.g. https://cocos.resonance.meetiqm.com/garnet)
@@ -110,7 +110,8 @@ def serialize_instructions(  # noqa: PLR0912, PLR0915
             `i` th parameter of an unrecognized instruction is given the name ``"p<i>"``.
 
     Returns:
-        list of instructions representing the circuit
+        list of instructions representing the circuit, not yet validated as the validation happens
+        when they are placed in a :class:`~iqm.iqm_client.models.Circuit`, or when the circuit is submitted
 
     Raises:
         ValueError: circuit contains an unsupported instruction or is not transpiled in general
@@ -119,29 +120,35 @@ def serialize_instructions(  # noqa: PLR0912, PLR0915
     instructions: list[Instruction] = []
     # maps clbits to the latest "measure" instruction to store its result there
     clbit_to_measure: dict[Clbit, Instruction] = {}
+    # index lookup table for the qubits, equivalent to but much faster than calling circuit.find_bit for each gate
+    qubit_to_index = {qubit: idx for idx, qubit in enumerate(circuit.qubits)}
+    # measurement keys of the clbits, computed on first use
+    clbit_to_key: dict[Clbit, str] = {}
     for circuit_instruction in circuit.data:
         instruction = circuit_instruction.operation
-        qubit_names = [qubit_index_to_name[circuit.find_bit(qubit).index] for qubit in circuit_instruction.qubits]
+        qubit_names = tuple(qubit_index_to_name[qubit_to_index[qubit]] for qubit in circuit_instruction.qubits)
+        # The native instructions are constructed without validation, since they are validated anyway
+        # when the containing Circuit is constructed or submitted.
         if instruction.name == "r":
             angle_t = float(instruction.params[0] / (2 * np.pi))
             phase_t = float(instruction.params[1] / (2 * np.pi))
-            native_inst = Instruction(name="prx", qubits=qubit_names, args={"angle_t": angle_t, "phase_t": phase_t})
+            native_inst = _native("prx", qubit_names, {"angle_t": angle_t, "phase_t": phase_t})
         elif instruction.name == "x":
-            native_inst = Instruction(name="prx", qubits=qubit_names, args={"angle_t": 0.5, "phase_t": 0.0})
+            native_inst = _native("prx", qubit_names, {"angle_t": 0.5, "phase_t": 0.0})
         elif instruction.name == "rx":
             angle_t = float(instruction.params[0] / (2 * np.pi))
-            native_inst = Instruction(name="prx", qubits=qubit_names, args={"angle_t": angle_t, "phase_t": 0.0})
+            native_inst = _native("prx", qubit_names, {"angle_t": angle_t, "phase_t": 0.0})
         elif instruction.name == "y":
-            native_inst = Instruction(name="prx", qubits=qubit_names, args={"angle_t": 0.5, "phase_t": 0.25})
+            native_inst = _native("prx", qubit_names, {"angle_t": 0.5, "phase_t": 0.25})
         elif instruction.name == "ry":
             angle_t = float(instruction.params[0] / (2 * np.pi))
-            native_inst = Instruction(name="prx", qubits=qubit_names, args={"angle_t": angle_t, "phase_t": 0.25})
+            native_inst = _native("prx", qubit_names, {"angle_t": angle_t, "phase_t": 0.25})
         elif instruction.name == "cz":
-            native_inst = Instruction(name="cz", qubits=qubit_names, args={})
+            native_inst = _native("cz", qubit_names, {})
         elif instruction.name == "move":
-            native_inst = Instruction(name="move", qubits=qubit_names, args={})
+            native_inst = _native("move", qubit_names, {})
         elif instruction.name == "barrier":
-            native_inst = Instruction(name="barrier", qubits=qubit_names, args={})
+            native_inst = _native("barrier", qubit_names, {})
         elif instruction.name == "delay":
             duration = float(instruction.params[0])
             # convert duration to seconds
@@ -160,23 +167,24 @@ def serialize_instructions(  # noqa: PLR0912, PLR0915
                 duration *= 1e-12
             else:
                 raise ValueError(f"Delay: Unsupported unit '{unit}'")
-            native_inst = Instruction(name="delay", qubits=qubit_names, args={"duration": duration})
+            native_inst = _native("delay", qubit_names, {"duration": duration})
         elif instruction.name == "measure":
             if len(circuit_instruction.clbits) != 1:
                 raise ValueError(
                     f"Unexpected: measurement instruction {circuit_instruction} uses multiple classical bits."
                 )
             clbit = circuit_instruction.clbits[0]  # always a single-qubit measurement
-            mk = str(MeasurementKey.from_clbit(clbit, circuit))
-            native_inst = Instruction(name="measure", qubits=qubit_names, args={"key": mk})
+            if (mk := clbit_to_key.get(clbit)) is None:
+                mk = clbit_to_key[clbit] = str(MeasurementKey.from_clbit(clbit, circuit))
+            native_inst = _native("measure", qubit_names, {"key": mk})
             clbit_to_measure[clbit] = native_inst
         elif instruction.name == "reset":
-            native_inst = Instruction(name="reset", qubits=qubit_names, args={})
+            native_inst = _native("reset", qubit_names, {})
         elif instruction.name == "id":
             continue
         elif instruction.name in allowed_nonnative_gates:
             args = {f"p{i}": param for i, param in enumerate(instruction.params)}
-            native_inst = Instruction.model_construct(name=instruction.name, qubits=tuple(qubit_names), args=args)
+            native_inst = Instruction.model_construct(name=instruction.name, qubits=qubit_names, args=args)
         else:
             raise ValueError(
                 f"Instruction '{instruction.name}' in the circuit '{circuit.name}' is not natively supported. "
@@ -219,6 +227,15 @@ def serialize_instructions(  # noqa: PLR0912, PLR0915
     return instructions
 
 
+def _native(name: str, qubits: tuple[str, ...], args: dict) -> Instruction:
+    """Construct a native instruction without validating it.
+
+    The caller is responsible for giving the current name of a supported operation, a number of qubits matching
+    its arity, and arguments of the correct names and types.
+    """
+    return Instruction.model_construct(name=name, qubits=qubits, args=args)
+
+
 def deserialize_instructions(
     instructions: list[Instruction], qubit_name_to_index: dict[str, int], layout: Layout
 ) -> QiskitQuantumCircuit:
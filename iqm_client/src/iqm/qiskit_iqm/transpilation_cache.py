@@ -0,0 +1,263 @@
+# Copyright 2025 Qiskit on IQM developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Caching transpiled circuits for repeated submissions of structurally identical circuits."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+import hashlib
+import threading
+from typing import Any
+
+from iqm.qiskit_iqm.iqm_job import IQMJob
+from iqm.qiskit_iqm.iqm_naive_move_pass import transpile_to_IQM
+from iqm.qiskit_iqm.iqm_provider import IQMBackend
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Clbit, Gate, Parameter, ParameterExpression, ParameterVector
+from qiskit.circuit.library import get_standard_gate_name_mapping
+
+_STANDARD_OPERATIONS: dict[str, type] = {
+    name: type(operation) for name, operation in get_standard_gate_name_mapping().items()
+}
+"""Standard operations, by name."""
+
+_ROTATION_GATES: dict[str, type] = {
+    name: type(operation)
+    for name, operation in get_standard_gate_name_mapping().items()
+    if isinstance(operation, Gate) and operation.params
+}
+"""Standard gates whose parameters are all rotation angles, by name."""
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    """Transpiled circuit skeleton, in which the lifted gate angles are still unbound parameters."""
+
+    circuit: QuantumCircuit
+    """transpiled circuit"""
+    parameters: tuple[Parameter, ...]
+    """the lifted parameters, in the order of the angles returned by :func:`_structure`"""
+
+
+class TranspilationCache:
+    """Transpiles circuits for a backend, reusing the transpilation of structurally identical circuits.
+
+    Two circuits are structurally identical if they consist of the same gates acting on the same qubits and
+    classical bits, in the same order, and only differ in the numerical angles of their gates.
+    When a circuit is transpiled for the first time, its numerical gate angles are replaced with
+    symbolic parameters, and the resulting parametric circuit is transpiled using :func:`.transpile_to_IQM`.
+    The transpiled circuit is cached, and the transpilation of any structurally identical circuit is obtained by
+    binding its angles to the parameters of the cached circuit, without running the transpiler.
+
+    Since the cached circuits are transpiled for arbitrary angles, they cannot be simplified based on
+    the particular angle values, e.g. by dropping zero rotations, so they may be slightly longer than circuits
+    transpiled individually. Circuits with their own unbound parameters are cached the same way,
+    and their parameters must be bound using ``parameter_values``.
+
+    The cache is specific to the backend, and thus to its calibration set, and can be shared between threads.
+
+    Args:
+        backend: backend to transpile the circuits for
+        maxsize: maximum number of transpiled circuits to keep, the least recently used ones are dropped first
+        transpile_options: keyword arguments for :func:`.transpile_to_IQM`, used for all the circuits
+
+    """
+
+    def __init__(self, backend: IQMBackend, *, maxsize: int = 256, **transpile_options: Any):
+        self.backend = backend
+        self.maxsize = maxsize
+        self._transpile_options = transpile_options
+        self._options_key = repr(sorted(transpile_options.items()))
+        self._entries: OrderedDict[bytes, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        """number of circuits transpiled using a cached circuit"""
+        self.misses = 0
+        """number of circuits that had to be transpiled"""
+
+    def transpile(
+        self, circuit: QuantumCircuit, parameter_values: Mapping[Parameter, float] | None = None
+    ) -> QuantumCircuit:
+        """Transpile a circuit for the backend, using the cache if possible.
+
+        Args:
+            circuit: circuit to transpile
+            parameter_values: values for the unbound parameters of ``circuit``, if any
+
+        Returns:
+            transpiled circuit with all parameters bound, ready for running on the backend
+
+        """
+        structure, angles = _structure(circuit)
+        target_key = (self.backend.name, self.backend.architecture.calibration_set_id, self._options_key)
+        key = hashlib.blake2b(repr((target_key, structure)).encode(), digest_size=32).digest()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is None:
+            lifted, parameters = _lift_angles(circuit)
+            entry = _CacheEntry(transpile_to_IQM(lifted, self.backend, **self._transpile_options), parameters)
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = entry
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        values: dict[Parameter, float] = dict(zip(entry.parameters, angles))
+        if parameter_values:
+            values.update(parameter_values)
+        transpiled = entry.circuit
+        bound = transpiled.assign_parameters(
+            {parameter: values[parameter] for parameter in transpiled.parameters}, inplace=False
+        )
+        bound.name = circuit.name
+        bound.metadata = circuit.metadata
+        return bound
+
+    def run(
+        self,
+        run_input: QuantumCircuit | list[QuantumCircuit],
+        parameter_values: Mapping[Parameter, float] | None = None,
+        **options: Any,
+    ) -> IQMJob:
+        """Transpile circuits using the cache, and run them on the backend.
+
+        Args:
+            run_input: circuits to run
+            parameter_values: values for the unbound parameters of the circuits, if any
+            options: keyword arguments for :meth:`.IQMBackend.run`
+
+        Returns:
+            the job executing the circuits
+
+        """
+        circuits = [run_input] if isinstance(run_input, QuantumCircuit) else run_input
+        return self.backend.run([self.transpile(circuit, parameter_values) for circuit in circuits], **options)
+
+    def clear(self) -> None:
+        """Drop all the cached circuits."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _is_liftable(operation: Any) -> bool:
+    """True iff the numerical parameters of the given operation are angles that can be replaced with parameters.
+
+    Only the standard rotation gates qualify. The parameters of other gates, e.g. custom gates created using
+    :meth:`QuantumCircuit.to_gate` or state preparations, are not necessarily angles, and replacing them would not
+    update the definitions of the gates.
+    """
+    return type(operation) is _ROTATION_GATES.get(operation.name)
+
+
+def _structure(circuit: QuantumCircuit, lift: bool = True) -> tuple[tuple, list[float]]:
+    """Split a circuit into its structure and the numerical angles of its gates.
+
+    The parameters of the operations whose angles are not lifted, see :func:`_is_liftable`, are included in the
+    structure as such, as are the definitions of non-standard operations.
+
+    Args:
+        circuit: circuit to split
+        lift: iff False, no angles are lifted, and the structure identifies the circuit completely
+
+    Returns:
+        hashable structure of the circuit, numerical gate angles in circuit order
+
+    """
+    angles: list[float] = []
+    qubit_indices = {qubit: idx for idx, qubit in enumerate(circuit.qubits)}
+    clbit_indices = {clbit: idx for idx, clbit in enumerate(circuit.clbits)}
+    instructions = []
+    for circuit_instruction in circuit.data:
+        operation = circuit_instruction.operation
+        liftable = lift and _is_liftable(operation)
+        params: list[Any] = []
+        for param in operation.params:
+            if isinstance(param, ParameterExpression):
+                params.append(str(param))
+            elif liftable and isinstance(param, (int, float)):
+                angles.append(float(param))
+                params.append(None)
+            elif isinstance(param, np.ndarray):
+                params.append((param.shape, param.tobytes()))
+            else:
+                params.append(param)
+        definition = None
+        if type(operation) is not _STANDARD_OPERATIONS.get(operation.name):
+            # custom gates with the same name and parameters may still differ, e.g. QuantumCircuit.to_gate
+            definition = getattr(operation, "definition", None)
+            if definition is not None:
+                definition = _structure(definition, lift=False)[0]
+        condition = getattr(operation, "condition", None)
+        if condition is not None:
+            target, value = condition
+            condition = (clbit_indices[target] if isinstance(target, Clbit) else target.name, value)
+        instructions.append(
+            (
+                operation.name,
+                tuple(params),
+                definition,
+                tuple(qubit_indices[qubit] for qubit in circuit_instruction.qubits),
+                tuple(clbit_indices[clbit] for clbit in circuit_instruction.clbits),
+                condition,
+            )
+        )
+    registers = (
+        tuple((qreg.name, qreg.size) for qreg in circuit.qregs),
+        tuple((creg.name, creg.size) for creg in circuit.cregs),
+    )
+    return (circuit.num_qubits, circuit.num_clbits, registers, tuple(instructions)), angles
+
+
+def _lift_angles(circuit: QuantumCircuit) -> tuple[QuantumCircuit, tuple[Parameter, ...]]:
+    """Replace the numerical gate angles of a circuit with parameters.
+
+    Args:
+        circuit: circuit to convert
+
+    Returns:
+        parametric copy of ``circuit``, the introduced parameters in the order of the angles in :func:`_structure`
+
+    """
+    n_angles = sum(
+        isinstance(param, (int, float))
+        for circuit_instruction in circuit.data
+        if _is_liftable(circuit_instruction.operation)
+        for param in circuit_instruction.operation.params
+    )
+    # the name is unlikely to collide with the parameters of the circuit
+    parameters = ParameterVector("_iqm_cached_angle", n_angles)
+    lifted = circuit.copy_empty_like()
+    index = 0
+    for circuit_instruction in circuit.data:
+        operation = circuit_instruction.operation
+        if _is_liftable(operation) and any(isinstance(param, (int, float)) for param in operation.params):
+            operation = operation.to_mutable()
+            new_params = []
+            for param in operation.params:
+                if isinstance(param, (int, float)):
+                    new_params.append(parameters[index])
+                    index += 1
+                else:
+                    new_params.append(param)
+            operation.params = new_params
+            lifted._append(circuit_instruction.replace(operation=operation))
+        else:
+            lifted._append(circuit_instruction)
+    return lifted, tuple(parameters)
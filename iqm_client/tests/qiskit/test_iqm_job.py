@@ -0,0 +1,43 @@
+# Copyright 2025 Qiskit on IQM developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Testing IQMJob result retrieval."""
+
+from unittest.mock import Mock
+import uuid
+
+from iqm.iqm_client import Status
+from iqm.iqm_client.models import Counts, RunCounts
+from iqm.qiskit_iqm.iqm_job import IQMJob
+
+
+def test_result_without_memory_uses_counts():
+    """The counts fast path builds a valid Qiskit result without fetching the shot-level measurements."""
+    backend = Mock()
+    backend.client.wait_for_counts.return_value = RunCounts(
+        status=Status.READY,
+        counts_batch=[
+            Counts(measurement_keys=["c_2_0_0", "c_2_0_1"], counts={"00": 3, "01": 5}),
+            Counts(measurement_keys=["c_1_0_0"], counts={"1": 8}),
+        ],
+    )
+    job = IQMJob(backend, str(uuid.uuid4()), shots=8, memory=False)
+    job.circuit_names = ["circuit_1", "circuit_2"]
+
+    result = job.result()
+
+    backend.client.wait_for_counts.assert_called_once()
+    backend.client.wait_for_results.assert_not_called()
+    assert result.get_counts("circuit_1") == {"00": 3, "10": 5}
+    assert result.get_counts("circuit_2") == {"1": 8}
+    assert [experiment.shots for experiment in result.results] == [8, 8]
@@ -0,0 +1,58 @@
+# Copyright 2025 Qiskit on IQM developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Testing the transpilation cache."""
+
+import math
+
+from iqm.qiskit_iqm.fake_backends.fake_adonis import IQMFakeAdonis
+from iqm.qiskit_iqm.transpilation_cache import TranspilationCache
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.quantum_info import Statevector
+
+
+def _probability_of_one(circuit: QuantumCircuit) -> float:
+    """Probability of measuring the first virtual qubit of a transpiled circuit in the state 1."""
+    physical_qubit = circuit.layout.final_index_layout()[0]
+    return Statevector(circuit).probabilities([physical_qubit])[1]
+
+
+def _rx_circuit(angle: float, custom: bool) -> QuantumCircuit:
+    """Single-qubit circuit applying an RX rotation, either directly or wrapped in a custom gate."""
+    circuit = QuantumCircuit(1)
+    if custom:
+        theta = Parameter("theta")
+        subcircuit = QuantumCircuit(1, name="custom_rx")
+        subcircuit.rx(theta, 0)
+        circuit.append(subcircuit.to_gate(), [0])
+        return circuit.assign_parameters({theta: angle})
+    circuit.rx(angle, 0)
+    return circuit
+
+
+def test_rotation_angles_are_lifted():
+    cache = TranspilationCache(IQMFakeAdonis())
+    cache.transpile(_rx_circuit(0.1, custom=False))
+    transpiled = cache.transpile(_rx_circuit(math.pi, custom=False))
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert _probability_of_one(transpiled) == pytest.approx(1.0)
+
+
+def test_custom_gate_parameters_are_not_lifted():
+    cache = TranspilationCache(IQMFakeAdonis())
+    cache.transpile(_rx_circuit(0.1, custom=True))
+    transpiled = cache.transpile(_rx_circuit(math.pi, custom=True))
+    assert cache.misses == 2
+    assert _probability_of_one(transpiled) == pytest.approx(1.0)